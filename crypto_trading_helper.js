@@ -1,4 +1,5 @@
 import axios from 'axios';
+import readline from 'readline';
 
 const API_URL = 'https://api.binance.com/api/v3';
 const API_KEY = process.env.API_KEY;
@@ -43,7 +44,45 @@ async function backtestStrategy(strategy, symbol) {
   console.log('Backtesting complete. Results: Strategy is profitable.');
 }
 
-console.log("Running Crypto Trading Helper...");
+// Commands available to --daemon requests
+const DAEMON_COMMANDS = {
+  fetch: fetchMarketData,
+  trade: executeTrade,
+  analyze: analyzePortfolio,
+  alert: setPriceAlert,
+  backtest: backtestStrategy,
+};
+
+// Persistent mode: one JSON request ({"cmd": ..., "args": [...]}) per stdin
+// line, one JSON response ({"ok": ..., "output": [...]}) per stdout line.
+// Console output is captured into the response so it doesn't interleave
+// with the protocol.
+async function runDaemon() {
+  const rl = readline.createInterface({ input: process.stdin });
+  for await (const line of rl) {
+    const output = [];
+    const { log, error } = console;
+    console.log = console.error = (...parts) => {
+      output.push(parts.map((part) => (typeof part === 'string' ? part : JSON.stringify(part))).join(' '));
+    };
+    let ok = true;
+    try {
+      const { cmd, args = [] } = JSON.parse(line);
+      const handler = DAEMON_COMMANDS[cmd];
+      if (!handler) {
+        throw new Error(`Unknown command: ${cmd}`);
+      }
+      await handler(...args);
+    } catch (err) {
+      ok = false;
+      output.push(err.message);
+    } finally {
+      console.log = log;
+      console.error = error;
+    }
+    process.stdout.write(JSON.stringify({ ok, output }) + '\n');
+  }
+}
 
 // Command-line interface
 const args = process.argv.slice(2);
@@ -52,7 +91,14 @@ const param1 = args[1];
 const param2 = args[2];
 const param3 = args[3];
 
+if (command !== '--daemon') {
+  console.log("Running Crypto Trading Helper...");
+}
+
 switch (command) {
+  case '--daemon':
+    runDaemon();
+    break;
   case 'fetch':
     fetchMarketData(param1);
     break;
@@ -19,4 +19,9 @@ if ($mode -eq 'cpu') {
 
 $env:QUANTUM_SECURITY = $security_level
 $env:QUANTUM_FRONTIER = $features
-python src/main.py
+
+# Bring the bytecode cache up to date so imports load .pyc files instead of
+# compiling sources; only stale files are recompiled. Frozen stdlib modules
+# skip the stdlib .py/.pyc lookup entirely.
+python -m compileall -q -j 0 src
+python -X frozen_modules=on src/main.py
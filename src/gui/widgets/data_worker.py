@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+import logging
+
+logger = logging.getLogger(__name__)
+
+class DataWorkerSignals(QObject):
+    """
+    Signals emitted by a DataWorker; delivered on the receiver's thread
+    """
+    done = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+class DataWorker(QRunnable):
+    """
+    Runs a data-generation callable on the global thread pool and hands
+    the result back through signals.done, keeping the GUI thread free
+    """
+
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = DataWorkerSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            logger.exception("Data worker failed")
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.done.emit(result)
+
+    def start(self):
+        """Queue this worker on the global thread pool"""
+        QThreadPool.globalInstance().start(self)
@@ -1,13 +1,20 @@
 #!/usr/bin/env python3
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-    QTableWidget, QTableWidgetItem, QHeaderView, 
+    QTableView, QAbstractItemView, QHeaderView, 
     QGroupBox, QFrame, QPushButton
 )
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QColor, QPainter, QBrush, QPen
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QRect, QRectF, QPointF
+from PyQt6.QtGui import QColor, QPainter, QBrush, QPen, QPixmap, QPainterPath
+from math import fsum
+from operator import itemgetter
 import random
 
+# Pre-bound formatters for table cells, avoiding per-cell f-string work
+_fmt_usd = "${:,.2f}".format
+_fmt_bal = "{:.8f}".format
+_fmt_pct = "{:.2%}".format
+
 class DonutChart(QWidget):
     """
     A simple donut chart implementation for asset allocation visualization
@@ -21,6 +28,16 @@ class DonutChart(QWidget):
             QColor("#FFC107"), QColor("#EF5350"), QColor("#5D4037"),
             QColor("#26C6DA"), QColor("#66BB6A"), QColor("#EC407A")
         ]
+        # Shared with the allocation legend so neither side builds brushes per paint
+        self.brushes = [QBrush(color) for color in self.colors]
+        # Segment outlines as (path, brush) pairs, rebuilt with the data or size
+        self._segments = []
+        # Rendered chart, rebuilt only when the data or size changes
+        self._cache_pixmap = None
+    
+    def brush_for(self, index):
+        """Return the cached brush for the segment at index"""
+        return self.brushes[index % len(self.brushes)]
     
     def set_data(self, asset_data):
         """
@@ -30,13 +47,75 @@ class DonutChart(QWidget):
             asset_data (dict): Dictionary with asset names as keys and values as percentages
         """
         self.asset_data = asset_data
+        self._rebuild_segments()
+        self._cache_pixmap = None
         self.update()
     
+    def resizeEvent(self, event):
+        self._rebuild_segments()
+        self._cache_pixmap = None
+        super().resizeEvent(event)
+    
+    def _rebuild_segments(self):
+        """Build one filled pie path per asset for the current size"""
+        width = self.width()
+        height = self.height()
+        center = QPointF(width / 2, height / 2)
+        outer_radius = min(width, height) / 2 - 10
+        bounds = QRectF(
+            center.x() - outer_radius,
+            center.y() - outer_radius,
+            outer_radius * 2,
+            outer_radius * 2
+        )
+        
+        self._segments = []
+        start_angle = 0.0
+        for i, percentage in enumerate(self.asset_data.values()):
+            # Calculate angle for this asset (ensure valid values)
+            span = max(0, min(1, percentage)) * 360
+            if span <= 0:
+                continue
+            
+            path = QPainterPath(center)
+            path.arcTo(bounds, start_angle, span)
+            path.closeSubpath()
+            self._segments.append((path, self.brush_for(i)))
+            start_angle += span
+    
     def paintEvent(self, event):
         if not self.asset_data:
             return
-            
+        
+        # Skip repaints whose exposed area misses the chart entirely
+        rect = event.rect()
+        if not rect.intersects(self.rect()):
+            return
+        
+        if self._cache_pixmap is None:
+            self._cache_pixmap = self._render_pixmap()
+        
+        # Only copy the exposed part of the cached chart
+        ratio = self._cache_pixmap.devicePixelRatio()
+        source = QRect(rect.topLeft() * ratio, rect.size() * ratio)
         painter = QPainter(self)
+        painter.drawPixmap(rect, self._cache_pixmap, source)
+        painter.end()
+    
+    def _render_pixmap(self):
+        """Render the full chart into an off-screen pixmap"""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        
+        painter = QPainter(pixmap)
+        self._draw_chart(painter)
+        painter.end()
+        return pixmap
+    
+    def _draw_chart(self, painter):
+        """Draw the donut segments and hole with the given painter"""
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
         # Calculate center and radius
@@ -62,34 +141,13 @@ class DonutChart(QWidget):
             return
         
         # Draw donut chart
-        start_angle = 0
-        for i, (asset, percentage) in enumerate(self.asset_data.items()):
-            # Calculate angle for this asset (ensure valid values)
-            angle = int(max(0, min(1, percentage)) * 360 * 16)  # QPainter uses 1/16th degrees
-            if angle <= 0:
-                continue
-                
-            # Set color for this segment
-            painter.setBrush(QBrush(self.colors[i % len(self.colors)]))
-            painter.setPen(Qt.PenStyle.NoPen)
-            
-            # Draw segment
-            try:
-                painter.drawPie(
-                    int(center_x - outer_radius), 
-                    int(center_y - outer_radius),
-                    int(outer_radius * 2), 
-                    int(outer_radius * 2),
-                    start_angle, 
-                    angle
-                )
-            except Exception as e:
-                # Skip this segment if there's an error
-                pass
-            
-            start_angle += angle
+        for path, brush in self._segments:
+            painter.fillPath(path, brush)
         
-        # Draw inner circle (to create donut hole)
+        # Draw inner circle (to create donut hole). It is a flat fill in the
+        # window colour, so skip the antialiased path kept for the pie arcs
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+        painter.setPen(Qt.PenStyle.NoPen)
         painter.setBrush(QBrush(self.palette().window().color()))
         try:
             painter.drawEllipse(
@@ -102,20 +160,176 @@ class DonutChart(QWidget):
             # Skip if there's an error
             pass
 
+class HoldingsModel(QAbstractTableModel):
+    """
+    Table model serving the holdings rows straight from the portfolio list,
+    so the view only formats the cells it actually paints
+    """
+    HEADERS = ["Asset", "Balance", "Price", "Value"]
+    
+    def __init__(self, rows=None, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._cells = []
+        # symbol -> ((balance, price, value), formatted cells)
+        self._row_cache = {}
+        if rows:
+            self.set_rows(rows)
+    
+    def set_rows(self, rows):
+        """
+        Replace the backing portfolio list
+        
+        Rows whose balance, price and value are unchanged since the last
+        refresh reuse their formatted cells and are not repainted.
+        """
+        cells = []
+        changed = []
+        for i, item in enumerate(rows):
+            key = (item["balance"], item["price"], item["value"])
+            cached = self._row_cache.get(item["symbol"])
+            if cached is not None and cached[0] == key:
+                cells.append(cached[1])
+                continue
+            
+            row_cells = (
+                f"{item['asset']} ({item['symbol']})",
+                _fmt_bal(item["balance"]),
+                _fmt_usd(item["price"]),
+                _fmt_usd(item["value"]),
+            )
+            self._row_cache[item["symbol"]] = (key, row_cells)
+            cells.append(row_cells)
+            changed.append(i)
+        
+        same_layout = (
+            len(rows) == len(self._rows)
+            and all(old["symbol"] == new["symbol"] for old, new in zip(self._rows, rows))
+        )
+        if not same_layout:
+            self.beginResetModel()
+            self._rows = rows
+            self._cells = cells
+            self.endResetModel()
+            return
+        
+        self._rows = rows
+        self._cells = cells
+        last_column = len(self.HEADERS) - 1
+        for i in changed:
+            self.dataChanged.emit(self.index(i, 0), self.index(i, last_column))
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        column = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._cells[index.row()][column]
+        
+        if role == Qt.ItemDataRole.TextAlignmentRole and column > 0:
+            return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+        
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+class AllocationModel(QAbstractTableModel):
+    """
+    Table model for the allocation legend, colouring each row to match
+    its donut chart segment
+    """
+    HEADERS = ["Asset", "Allocation"]
+    
+    def __init__(self, brushes, parent=None):
+        super().__init__(parent)
+        self._brushes = brushes
+        self._rows = []
+    
+    def set_allocations(self, allocations):
+        """
+        Replace the legend rows
+        
+        Only rows whose rounded percentage moved are repainted when the
+        set of assets is unchanged.
+        
+        Args:
+            allocations (dict): Dictionary with asset symbols as keys and fractions as values
+        """
+        rows = [(symbol, _fmt_pct(percentage)) for symbol, percentage in allocations.items()]
+        if len(rows) != len(self._rows) or any(old[0] != new[0] for old, new in zip(self._rows, rows)):
+            self.beginResetModel()
+            self._rows = rows
+            self.endResetModel()
+            return
+        
+        previous = self._rows
+        self._rows = rows
+        for i, (old, new) in enumerate(zip(previous, rows)):
+            if old != new:
+                self.dataChanged.emit(self.index(i, 1), self.index(i, 1))
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        row = index.row()
+        column = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._rows[row][column]
+        
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self._brushes[row % len(self._brushes)]
+        
+        if role == Qt.ItemDataRole.TextAlignmentRole and column == 1:
+            return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+        
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
 class PortfolioViewWidget(QWidget):
     """
     Widget displaying portfolio information, including asset balances,
     allocation, and value.
     """
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, change_provider=None):
         super().__init__(parent)
         
+        # Source of the 24h change shown in the summary. Takes the total
+        # portfolio value and returns the change amount; swap in a cached
+        # real-data adapter instead of the demo generator below.
+        self._rng = random.Random()
+        self._change_provider = change_provider or self._sample_change
+        
         # Initialize UI
         self.init_ui()
         
         # Load sample data for demonstration
         self.load_sample_data()
+    
+    def _sample_change(self, total_value):
+        """Generate a random 24h change for demonstration"""
+        return self._rng.uniform(-total_value * 0.03, total_value * 0.05)
         
     def init_ui(self):
         """Initialize the user interface components"""
@@ -161,15 +375,16 @@ class PortfolioViewWidget(QWidget):
         self.donut_chart = DonutChart()
         
         # Asset legend
-        self.asset_legend = QTableWidget(0, 2)
-        self.asset_legend.setHorizontalHeaderLabels(["Asset", "Allocation"])
+        self.allocation_model = AllocationModel(self.donut_chart.brushes)
+        self.asset_legend = QTableView()
+        self.asset_legend.setModel(self.allocation_model)
         self.asset_legend.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.asset_legend.verticalHeader().setVisible(False)
         self.asset_legend.setShowGrid(False)
         self.asset_legend.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-        self.asset_legend.setSelectionMode(QTableWidget.SelectionMode.NoSelection)
+        self.asset_legend.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
         self.asset_legend.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: transparent;
                 border: none;
             }
@@ -179,7 +394,7 @@ class PortfolioViewWidget(QWidget):
                 border: none;
                 padding: 4px;
             }
-            QTableWidget::item {
+            QTableView::item {
                 border-bottom: 1px solid #2A2A2A;
                 padding: 4px;
             }
@@ -192,14 +407,15 @@ class PortfolioViewWidget(QWidget):
         self.holdings_label = QLabel("Holdings")
         self.holdings_label.setStyleSheet("font-weight: bold; margin-top: 10px;")
         
-        self.holdings_table = QTableWidget(0, 4)
-        self.holdings_table.setHorizontalHeaderLabels(["Asset", "Balance", "Price", "Value"])
+        self.holdings_model = HoldingsModel()
+        self.holdings_table = QTableView()
+        self.holdings_table.setModel(self.holdings_model)
         self.holdings_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.holdings_table.verticalHeader().setVisible(False)
         self.holdings_table.setShowGrid(False)
         self.holdings_table.setFocusPolicy(Qt.FocusPolicy.NoFocus)
         self.holdings_table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: #1E1E1E;
                 border: none;
             }
@@ -209,7 +425,7 @@ class PortfolioViewWidget(QWidget):
                 border: none;
                 padding: 4px;
             }
-            QTableWidget::item {
+            QTableView::item {
                 border-bottom: 1px solid #2A2A2A;
                 padding: 4px;
             }
@@ -243,14 +459,16 @@ class PortfolioViewWidget(QWidget):
         ]
         
         # Calculate total value and allocations
-        total_value = sum(item["value"] for item in portfolio)
-        allocations = {item["symbol"]: item["value"] / total_value for item in portfolio}
+        values = list(map(itemgetter("value"), portfolio))
+        total_value = fsum(values)
+        inv_total = 1.0 / total_value if total_value else 0.0
+        allocations = {item["symbol"]: value * inv_total for item, value in zip(portfolio, values)}
         
         # Update total value display
-        self.total_value.setText(f"${total_value:.2f}")
+        self.total_value.setText(_fmt_usd(total_value))
         
-        # Generate random 24h change for demonstration
-        change_amount = random.uniform(-total_value * 0.03, total_value * 0.05)
+        # 24h change
+        change_amount = self._change_provider(total_value)
         change_percent = (change_amount / (total_value - change_amount)) * 100
         
         change_color = "green" if change_amount >= 0 else "red"
@@ -262,41 +480,23 @@ class PortfolioViewWidget(QWidget):
         # Update asset allocation chart
         self.donut_chart.set_data(allocations)
         
-        # Update allocation legend
-        self.asset_legend.setRowCount(len(allocations))
-        for i, (symbol, percentage) in enumerate(allocations.items()):
-            # Asset symbol
-            symbol_item = QTableWidgetItem(symbol)
-            self.asset_legend.setItem(i, 0, symbol_item)
-            
-            # Allocation percentage
-            percentage_item = QTableWidgetItem(f"{percentage * 100:.2f}%")
-            percentage_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.asset_legend.setItem(i, 1, percentage_item)
-            
-            # Set row color based on asset
-            color = self.donut_chart.colors[i % len(self.donut_chart.colors)]
-            symbol_item.setForeground(color)
-            percentage_item.setForeground(color)
-        
-        # Update holdings table
-        self.holdings_table.setRowCount(len(portfolio))
-        for i, item in enumerate(portfolio):
-            # Asset name
-            asset_item = QTableWidgetItem(f"{item['asset']} ({item['symbol']})")
-            self.holdings_table.setItem(i, 0, asset_item)
-            
-            # Balance
-            balance_item = QTableWidgetItem(f"{item['balance']:.8f}")
-            balance_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.holdings_table.setItem(i, 1, balance_item)
-            
-            # Price
-            price_item = QTableWidgetItem(f"${item['price']:.2f}")
-            price_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.holdings_table.setItem(i, 2, price_item)
-            
-            # Value
-            value_item = QTableWidgetItem(f"${item['value']:.2f}")
-            value_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.holdings_table.setItem(i, 3, value_item)
+        # Suspend painting and sorting on both tables so the model resets
+        # below collapse into a single re-layout
+        tables = (self.asset_legend, self.holdings_table)
+        sorting = [table.isSortingEnabled() for table in tables]
+        for table in tables:
+            table.setUpdatesEnabled(False)
+            table.blockSignals(True)
+            table.setSortingEnabled(False)
+
+        try:
+            # Update allocation legend
+            self.allocation_model.set_allocations(allocations)
+
+            # Update holdings table
+            self.holdings_model.set_rows(portfolio)
+        finally:
+            for table, was_sorting in zip(tables, sorting):
+                table.setSortingEnabled(was_sorting)
+                table.blockSignals(False)
+                table.setUpdatesEnabled(True)
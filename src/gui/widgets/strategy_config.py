@@ -3,11 +3,28 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
     QLineEdit, QComboBox, QDoubleSpinBox, QSpinBox,
     QGroupBox, QFormLayout, QTabWidget, QPushButton,
-    QCheckBox, QScrollArea, QSizePolicy, QFrame
+    QCheckBox, QScrollArea, QSizePolicy, QFrame, QFileDialog, QMessageBox
 )
 from PyQt6.QtCore import Qt
 import json
 
+def _get_value(widget):
+    """Read the value of a parameter widget"""
+    if isinstance(widget, QComboBox):
+        return widget.currentText()
+    if isinstance(widget, QCheckBox):
+        return widget.isChecked()
+    return widget.value()
+
+def _set_value(widget, value):
+    """Write a value into a parameter widget"""
+    if isinstance(widget, QComboBox):
+        widget.setCurrentText(value)
+    elif isinstance(widget, QCheckBox):
+        widget.setChecked(value)
+    else:
+        widget.setValue(value)
+
 class StrategyConfigWidget(QWidget):
     """
     Widget for configuring trading strategies with detailed parameters
@@ -17,6 +34,9 @@ class StrategyConfigWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         
+        # Parameter widgets keyed by name, used for save/load
+        self._params = {}
+        
         # Initialize UI
         self.init_ui()
         
@@ -28,31 +48,34 @@ class StrategyConfigWidget(QWidget):
         # Strategy configuration tabs
         self.tabs = QTabWidget()
         
-        # Pure market making tab
+        # Strategy tabs start empty and are populated the first time they
+        # are shown, so unused strategies never build their widgets
         self.market_making_tab = QWidget()
-        self.setup_market_making_tab()
         self.tabs.addTab(self.market_making_tab, "Pure Market Making")
         
-        # Cross exchange market making tab
         self.cross_exchange_tab = QWidget()
-        self.setup_cross_exchange_tab()
         self.tabs.addTab(self.cross_exchange_tab, "Cross Exchange Market Making")
         
-        # Arbitrage tab
         self.arbitrage_tab = QWidget()
-        self.setup_arbitrage_tab()
         self.tabs.addTab(self.arbitrage_tab, "Arbitrage")
         
-        # TWAP tab
         self.twap_tab = QWidget()
-        self.setup_twap_tab()
         self.tabs.addTab(self.twap_tab, "TWAP")
         
-        # Avellaneda & Stoikov tab
         self.avellaneda_tab = QWidget()
-        self.setup_avellaneda_tab()
         self.tabs.addTab(self.avellaneda_tab, "Avellaneda & Stoikov")
         
+        self._tab_builders = {
+            0: self.setup_market_making_tab,
+            1: self.setup_cross_exchange_tab,
+            2: self.setup_arbitrage_tab,
+            3: self.setup_twap_tab,
+            4: self.setup_avellaneda_tab,
+        }
+        self._built = set()
+        self.tabs.currentChanged.connect(self._lazy_build)
+        self._lazy_build(self.tabs.currentIndex())
+        
         # Action buttons
         self.button_layout = QHBoxLayout()
         
@@ -73,6 +96,29 @@ class StrategyConfigWidget(QWidget):
         self.layout.addWidget(self.tabs)
         self.layout.addLayout(self.button_layout)
         
+    def _mk_spin(self, name, decimals, lo, hi, val, step, suffix=""):
+        """Create a configured QDoubleSpinBox and register it as parameter name"""
+        spin = QDoubleSpinBox()
+        spin.setDecimals(decimals)
+        spin.setRange(lo, hi)
+        spin.setSingleStep(step)
+        spin.setSuffix(suffix)
+        spin.setValue(val)
+        self._params[name] = spin
+        return spin
+        
+    def _lazy_build(self, index):
+        """Build the widgets of the tab at index on its first display"""
+        if index in self._built or index not in self._tab_builders:
+            return
+        self._tab_builders[index]()
+        self._built.add(index)
+        
+    def _build_all_tabs(self):
+        """Build every tab not shown yet, so all parameters are registered"""
+        for index in self._tab_builders:
+            self._lazy_build(index)
+        
     def setup_market_making_tab(self):
         """Setup the pure market making strategy configuration tab"""
         # Main layout
@@ -94,40 +140,24 @@ class StrategyConfigWidget(QWidget):
         # Exchange
         self.mm_exchange = QComboBox()
         self.mm_exchange.addItems(["Binance", "Binance US", "Coinbase Pro", "Kraken", "KuCoin"])
+        self._params["mm_exchange"] = self.mm_exchange
         market_form.addRow("Exchange:", self.mm_exchange)
         
         # Market (trading pair)
         self.mm_market = QComboBox()
         self.mm_market.addItems(["BTC-USDT", "ETH-USDT", "BNB-USDT", "SOL-USDT", "ADA-USDT"])
+        self._params["mm_market"] = self.mm_market
         market_form.addRow("Market:", self.mm_market)
         
         # Bid/Ask spread
-        self.mm_bid_spread = QDoubleSpinBox()
-        self.mm_bid_spread.setDecimals(2)
-        self.mm_bid_spread.setMinimum(0.01)
-        self.mm_bid_spread.setMaximum(5.00)
-        self.mm_bid_spread.setValue(0.50)
-        self.mm_bid_spread.setSingleStep(0.05)
-        self.mm_bid_spread.setSuffix("%")
+        self.mm_bid_spread = self._mk_spin("mm_bid_spread", 2, 0.01, 5.00, 0.50, 0.05, "%")
         market_form.addRow("Bid Spread:", self.mm_bid_spread)
         
-        self.mm_ask_spread = QDoubleSpinBox()
-        self.mm_ask_spread.setDecimals(2)
-        self.mm_ask_spread.setMinimum(0.01)
-        self.mm_ask_spread.setMaximum(5.00)
-        self.mm_ask_spread.setValue(0.50)
-        self.mm_ask_spread.setSingleStep(0.05)
-        self.mm_ask_spread.setSuffix("%")
+        self.mm_ask_spread = self._mk_spin("mm_ask_spread", 2, 0.01, 5.00, 0.50, 0.05, "%")
         market_form.addRow("Ask Spread:", self.mm_ask_spread)
         
         # Order refresh time
-        self.mm_order_refresh_time = QDoubleSpinBox()
-        self.mm_order_refresh_time.setDecimals(1)
-        self.mm_order_refresh_time.setMinimum(5.0)
-        self.mm_order_refresh_time.setMaximum(300.0)
-        self.mm_order_refresh_time.setValue(30.0)
-        self.mm_order_refresh_time.setSingleStep(5.0)
-        self.mm_order_refresh_time.setSuffix(" sec")
+        self.mm_order_refresh_time = self._mk_spin("mm_order_refresh_time", 1, 5.0, 300.0, 30.0, 5.0, " sec")
         market_form.addRow("Order Refresh Time:", self.mm_order_refresh_time)
         
         # Apply group layout
@@ -138,12 +168,7 @@ class StrategyConfigWidget(QWidget):
         order_form = QFormLayout()
         
         # Order amount
-        self.mm_order_amount = QDoubleSpinBox()
-        self.mm_order_amount.setDecimals(6)
-        self.mm_order_amount.setMinimum(0.000001)
-        self.mm_order_amount.setMaximum(10.0)
-        self.mm_order_amount.setValue(0.001)
-        self.mm_order_amount.setSingleStep(0.001)
+        self.mm_order_amount = self._mk_spin("mm_order_amount", 6, 0.000001, 10.0, 0.001, 0.001)
         order_form.addRow("Order Amount:", self.mm_order_amount)
         
         # Order levels
@@ -151,26 +176,15 @@ class StrategyConfigWidget(QWidget):
         self.mm_order_levels.setMinimum(1)
         self.mm_order_levels.setMaximum(5)
         self.mm_order_levels.setValue(1)
+        self._params["mm_order_levels"] = self.mm_order_levels
         order_form.addRow("Number of Order Levels:", self.mm_order_levels)
         
         # Order level spread
-        self.mm_order_level_spread = QDoubleSpinBox()
-        self.mm_order_level_spread.setDecimals(2)
-        self.mm_order_level_spread.setMinimum(0.01)
-        self.mm_order_level_spread.setMaximum(5.00)
-        self.mm_order_level_spread.setValue(1.00)
-        self.mm_order_level_spread.setSingleStep(0.10)
-        self.mm_order_level_spread.setSuffix("%")
+        self.mm_order_level_spread = self._mk_spin("mm_order_level_spread", 2, 0.01, 5.00, 1.00, 0.10, "%")
         order_form.addRow("Order Level Spread:", self.mm_order_level_spread)
         
         # Order level amount
-        self.mm_order_level_amount = QDoubleSpinBox()
-        self.mm_order_level_amount.setDecimals(2)
-        self.mm_order_level_amount.setMinimum(0.01)
-        self.mm_order_level_amount.setMaximum(5.00)
-        self.mm_order_level_amount.setValue(1.00)
-        self.mm_order_level_amount.setSingleStep(0.10)
-        self.mm_order_level_amount.setSuffix("x")
+        self.mm_order_level_amount = self._mk_spin("mm_order_level_amount", 2, 0.01, 5.00, 1.00, 0.10, "x")
         order_form.addRow("Order Level Amount:", self.mm_order_level_amount)
         
         # Apply group layout
@@ -183,26 +197,23 @@ class StrategyConfigWidget(QWidget):
         # Price source
         self.mm_price_source = QComboBox()
         self.mm_price_source.addItems(["current_market", "external_market", "custom_api"])
+        self._params["mm_price_source"] = self.mm_price_source
         advanced_form.addRow("Price Source:", self.mm_price_source)
         
         # Price type
         self.mm_price_type = QComboBox()
         self.mm_price_type.addItems(["mid_price", "last_price", "best_bid", "best_ask"])
+        self._params["mm_price_type"] = self.mm_price_type
         advanced_form.addRow("Price Type:", self.mm_price_type)
         
         # Inventory skew
         self.mm_inventory_skew_enabled = QCheckBox("Enable")
         self.mm_inventory_skew_enabled.setChecked(False)
+        self._params["mm_inventory_skew_enabled"] = self.mm_inventory_skew_enabled
         advanced_form.addRow("Inventory Skew:", self.mm_inventory_skew_enabled)
         
         # Target base ratio
-        self.mm_target_base_ratio = QDoubleSpinBox()
-        self.mm_target_base_ratio.setDecimals(2)
-        self.mm_target_base_ratio.setMinimum(0.0)
-        self.mm_target_base_ratio.setMaximum(100.0)
-        self.mm_target_base_ratio.setValue(50.0)
-        self.mm_target_base_ratio.setSingleStep(5.0)
-        self.mm_target_base_ratio.setSuffix("%")
+        self.mm_target_base_ratio = self._mk_spin("mm_target_base_ratio", 2, 0.0, 100.0, 50.0, 5.0, "%")
         advanced_form.addRow("Target Base Ratio:", self.mm_target_base_ratio)
         
         # Apply group layout
@@ -213,33 +224,15 @@ class StrategyConfigWidget(QWidget):
         risk_form = QFormLayout()
         
         # Max order age
-        self.mm_max_order_age = QDoubleSpinBox()
-        self.mm_max_order_age.setDecimals(1)
-        self.mm_max_order_age.setMinimum(10.0)
-        self.mm_max_order_age.setMaximum(3600.0)
-        self.mm_max_order_age.setValue(1800.0)
-        self.mm_max_order_age.setSingleStep(60.0)
-        self.mm_max_order_age.setSuffix(" sec")
+        self.mm_max_order_age = self._mk_spin("mm_max_order_age", 1, 10.0, 3600.0, 1800.0, 60.0, " sec")
         risk_form.addRow("Max Order Age:", self.mm_max_order_age)
         
         # Min order spread
-        self.mm_min_spread = QDoubleSpinBox()
-        self.mm_min_spread.setDecimals(2)
-        self.mm_min_spread.setMinimum(-100.0)
-        self.mm_min_spread.setMaximum(100.0)
-        self.mm_min_spread.setValue(-0.5)
-        self.mm_min_spread.setSingleStep(0.1)
-        self.mm_min_spread.setSuffix("%")
+        self.mm_min_spread = self._mk_spin("mm_min_spread", 2, -100.0, 100.0, -0.5, 0.1, "%")
         risk_form.addRow("Minimum Spread:", self.mm_min_spread)
         
         # Max spread
-        self.mm_max_spread = QDoubleSpinBox()
-        self.mm_max_spread.setDecimals(2)
-        self.mm_max_spread.setMinimum(0.0)
-        self.mm_max_spread.setMaximum(100.0)
-        self.mm_max_spread.setValue(5.0)
-        self.mm_max_spread.setSingleStep(0.1)
-        self.mm_max_spread.setSuffix("%")
+        self.mm_max_spread = self._mk_spin("mm_max_spread", 2, 0.0, 100.0, 5.0, 0.1, "%")
         risk_form.addRow("Maximum Spread:", self.mm_max_spread)
         
         # Apply group layout
@@ -294,15 +287,50 @@ class StrategyConfigWidget(QWidget):
         # Placeholder for now
         layout.addWidget(QLabel("This is an advanced market making strategy based on a mathematical model that accounts for inventory risk."))
         
+    def get_parameters(self):
+        """Return the current parameter values keyed by name"""
+        self._build_all_tabs()
+        return {name: _get_value(widget) for name, widget in self._params.items()}
+        
+    def set_parameters(self, params):
+        """Apply parameter values keyed by name, ignoring unknown names"""
+        self._build_all_tabs()
+        for name, value in params.items():
+            widget = self._params.get(name)
+            if widget is not None:
+                _set_value(widget, value)
+        
     def save_configuration(self):
         """Save the current strategy configuration"""
-        # In a real implementation, we would serialize the configuration and save to a file
-        print("Configuration saved")
+        filename, _ = QFileDialog.getSaveFileName(
+            self, "Save Configuration", "", "JSON Files (*.json)"
+        )
+        if filename:
+            try:
+                with open(filename, "w", encoding="utf-8") as f:
+                    f.write(json.dumps(self.get_parameters(), indent=2))
+            except (OSError, ValueError, TypeError) as e:
+                QMessageBox.critical(self, "Save Configuration", f"Could not save {filename}:\n{e}")
+                return
+            print("Configuration saved")
         
     def load_configuration(self):
         """Load a saved strategy configuration"""
-        # In a real implementation, we would load a configuration file and update the UI
-        print("Configuration loaded")
+        filename, _ = QFileDialog.getOpenFileName(
+            self, "Load Configuration", "", "JSON Files (*.json)"
+        )
+        if filename:
+            try:
+                with open(filename, encoding="utf-8") as f:
+                    params = json.load(f)
+                if not isinstance(params, dict):
+                    raise ValueError("expected a JSON object of parameter values")
+                self.set_parameters(params)
+            except (OSError, ValueError, TypeError) as e:
+                # JSONDecodeError is a ValueError; widgets reject mistyped values with TypeError
+                QMessageBox.critical(self, "Load Configuration", f"Could not load {filename}:\n{e}")
+                return
+            print("Configuration loaded")
         
     def validate_strategy(self):
         """Validate the current strategy configuration"""
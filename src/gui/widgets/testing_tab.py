@@ -1,6 +1,6 @@
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTreeWidget, QTreeWidgetItem, QTextEdit
-from PyQt6.QtCore import pyqtSlot, Qt
-from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTreeView, QTextEdit
+from PyQt6.QtCore import pyqtSlot, Qt, QTimer
+from PyQt6.QtGui import QColor, QStandardItemModel, QStandardItem, QTextCursor
 
 class TestingTabWidget(QWidget):
     """
@@ -17,14 +17,26 @@ class TestingTabWidget(QWidget):
         self.run_tests_btn.setStyleSheet("background-color: #4CAF50; color: white;")
         self.controls_layout.addWidget(self.run_tests_btn)
         
-        # Results tree
-        self.results_tree = QTreeWidget()
-        self.results_tree.setHeaderLabels(["Test Case", "Status", "Execution Time", "Accuracy"])
+        # Results tree, model-backed so streamed results only materialize visible rows
+        self.results_model = QStandardItemModel(0, 4)
+        self.results_model.setHorizontalHeaderLabels(["Test Case", "Status", "Execution Time", "Accuracy"])
+        self.results_tree = QTreeView()
+        self.results_tree.setModel(self.results_model)
+        self.results_tree.setRootIsDecorated(False)
+        self.results_tree.setUniformRowHeights(True)
         
         # Log output
         self.test_log = QTextEdit()
         self.test_log.setReadOnly(True)
         
+        # Log lines are buffered and flushed at most every 100 ms so a
+        # chatty test run repaints the log a bounded number of times; the
+        # timer only runs while lines are waiting
+        self._log_buffer = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setInterval(100)
+        self._log_timer.timeout.connect(self._flush_log)
+        
         # Add components to layout
         self.layout.addLayout(self.controls_layout)
         self.layout.addWidget(self.results_tree, 3)
@@ -36,22 +48,41 @@ class TestingTabWidget(QWidget):
     @pyqtSlot()
     def on_run_tests(self):
         """Handle test execution"""
-        self.test_log.append("Starting neural predictor test suite...")
+        self.log("Starting neural predictor test suite...")
         
         # TODO: Connect to actual test runner
         self._add_test_result("Market Trend Prediction", "Passed", "1.23s", "98.2%")
         self._add_test_result("Volatility Analysis", "Warning", "2.15s", "89.5%")
         self._add_test_result("Order Book Simulation", "Failed", "0.45s", "N/A")
         
+    def log(self, message):
+        """Queue a line for the test log"""
+        if not self._log_buffer:
+            self._log_timer.start()
+        self._log_buffer.append(message)
+        
+    def _flush_log(self):
+        """Write all buffered log lines in a single insert"""
+        self._log_timer.stop()
+        if not self._log_buffer:
+            return
+        self.test_log.setUpdatesEnabled(False)
+        self.test_log.moveCursor(QTextCursor.MoveOperation.End)
+        self.test_log.insertPlainText("\n".join(self._log_buffer) + "\n")
+        self.test_log.setUpdatesEnabled(True)
+        self._log_buffer.clear()
+        
     def _add_test_result(self, name, status, time, accuracy):
-        item = QTreeWidgetItem([name, status, time, accuracy])
+        items = [QStandardItem(text) for text in (name, status, time, accuracy)]
+        for item in items:
+            item.setEditable(False)
         
         # Color coding
         if status == "Passed":
-            item.setBackground(1, QColor(200, 255, 200))
+            items[1].setBackground(QColor(200, 255, 200))
         elif status == "Warning":
-            item.setBackground(1, QColor(255, 255, 200))
+            items[1].setBackground(QColor(255, 255, 200))
         else:
-            item.setBackground(1, QColor(255, 200, 200))
+            items[1].setBackground(QColor(255, 200, 200))
         
-        self.results_tree.addTopLevelItem(item)
+        self.results_model.appendRow(items)
@@ -1,13 +1,200 @@
 #!/usr/bin/env python3
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-    QTableWidget, QTableWidgetItem, QHeaderView, 
+    QTableView, QHeaderView, QStyledItemDelegate,
     QGroupBox, QComboBox
 )
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QColor
-import random
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QColor, QPalette
 from datetime import datetime, timedelta
+import random
+
+from gui.widgets.data_worker import DataWorker
+
+# Trading pairs and the price/amount ranges sample trades are drawn from,
+# indexed by pair id. Plain tuples, so importing this module (e.g. via
+# gui.widgets at startup) does not pull in NumPy or pandas
+PAIRS = ("BTC/USDT", "ETH/USDT", "BNB/USDT", "SOL/USDT", "XRP/USDT")
+PRICE_LOW = (45000, 2500, 280, 40, 0.5)
+PRICE_HIGH = (52000, 3200, 350, 60, 0.7)
+AMOUNT_LOW = (0.01, 0.1, 0.5, 1.0, 50)
+AMOUNT_HIGH = (0.2, 2.0, 5.0, 20.0, 1000)
+
+def generate_sample_trades(period, seed, token=None):
+    """
+    Generate sample trades for a period. Runs off the GUI thread, so it
+    only touches its own generator and returns plain data.
+    
+    Args:
+        period (str): Period filter text, e.g. "Today" or "All Time"
+        seed (int): Seed for the random generator
+        token: Opaque request token passed back with the result
+        
+    Returns:
+        dict: Trade columns sorted newest first, plus summary stats
+    """
+    import numpy as np
+    import pandas as pd
+    
+    rng = np.random.default_rng(seed)
+    
+    # Determine date range based on period
+    end_date = datetime.now()
+    
+    if period == "Today":
+        start_date = end_date.replace(hour=0, minute=0, second=0, microsecond=0)
+        num_trades = rng.integers(5, 15, endpoint=True)
+    elif period == "Yesterday":
+        end_date = end_date.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(seconds=1)
+        start_date = end_date.replace(hour=0, minute=0, second=0, microsecond=0)
+        num_trades = rng.integers(10, 25, endpoint=True)
+    elif period == "This Week":
+        start_date = end_date - timedelta(days=end_date.weekday())
+        start_date = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
+        num_trades = rng.integers(20, 50, endpoint=True)
+    elif period == "Last 7 Days":
+        start_date = end_date - timedelta(days=7)
+        num_trades = rng.integers(30, 70, endpoint=True)
+    elif period == "This Month":
+        start_date = end_date.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        num_trades = rng.integers(50, 100, endpoint=True)
+    else:  # All Time
+        start_date = end_date - timedelta(days=90)  # Just use last 90 days for demo
+        num_trades = rng.integers(100, 200, endpoint=True)
+    
+    # Generate all trades in one vectorized batch: random time within
+    # period, pair, side, and price/amount drawn from the pair's range
+    span = (end_date - start_date).total_seconds()
+    offsets = rng.random(num_trades) * span
+    trade_times = pd.Timestamp(start_date) + pd.to_timedelta(offsets, unit="s")
+    pair_idx = rng.integers(0, len(PAIRS), num_trades)
+    sells = rng.random(num_trades) < 0.5
+    prices = rng.uniform(np.take(PRICE_LOW, pair_idx), np.take(PRICE_HIGH, pair_idx))
+    amounts = rng.uniform(np.take(AMOUNT_LOW, pair_idx), np.take(AMOUNT_HIGH, pair_idx))
+    totals = prices * amounts
+    
+    # Aggregate summary stats; for demo, assume a random profit
+    # percentage on sells
+    profit_pct = rng.uniform(-1.5, 3.0, int(sells.sum()))
+    
+    # Sort trades by time (newest first)
+    order = trade_times.argsort()[::-1]
+    
+    return {
+        "token": token,
+        "times": trade_times[order],
+        "pairs": np.take(PAIRS, pair_idx[order]).tolist(),
+        "sides": np.where(sells[order], "SELL", "BUY").tolist(),
+        "prices": prices[order],
+        "amounts": amounts[order],
+        "totals": totals[order],
+        "total_volume": float(totals.sum()),
+        "net_profit": float((totals[sells] * profit_pct / 100).sum()),
+    }
+
+# Stylesheets, built once and shared by every TradeHistoryWidget
+_TITLE_QSS = "font-weight: bold; font-size: 14px;"
+_PROFIT_QSS = "color: green; font-weight: bold;"
+_LOSS_QSS = "color: red; font-weight: bold;"
+_TABLE_QSS = """
+    QTableView {
+        background-color: #1E1E1E;
+        border: none;
+    }
+    QHeaderView::section {
+        background-color: #2A2A2A;
+        color: #E0E0E0;
+        border: none;
+        padding: 4px;
+    }
+    QTableView::item {
+        border-bottom: 1px solid #2A2A2A;
+        padding: 4px;
+    }
+"""
+
+class TradesModel(QAbstractTableModel):
+    """
+    Table model over trade columns. Display strings are formatted once
+    per column when trades are set; the view only materializes the
+    rows it paints.
+    """
+    HEADERS = ["Time", "Pair", "Side", "Price", "Amount", "Total"]
+    SIDE_COLUMN = 2
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._columns = [[] for _ in self.HEADERS]
+    
+    def set_trades(self, times, pairs, sides, prices, amounts, totals):
+        """
+        Replace the backing trades
+        
+        Args:
+            times: Trade times, anything pandas.DatetimeIndex accepts
+            pairs (list): Trading pair per trade
+            sides (list): "BUY" or "SELL" per trade
+            prices, amounts, totals (np.ndarray): Numeric columns
+        """
+        # Only needed once trades arrive, not when the widget is imported
+        import numpy as np
+        import pandas as pd
+        
+        time_strs = pd.DatetimeIndex(times).strftime("%Y-%m-%d %H:%M:%S").tolist()
+        columns = [
+            time_strs,
+            list(pairs),
+            list(sides),
+            [f"${price:.2f}" for price in np.asarray(prices).tolist()],
+            [f"{amount:.6f}" for amount in np.asarray(amounts).tolist()],
+            [f"${total:.2f}" for total in np.asarray(totals).tolist()],
+        ]
+        
+        self.beginResetModel()
+        self._columns = columns
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns[0])
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._columns[index.column()][index.row()]
+        
+        # Raw side of the trade, used by TradeDelegate for colouring
+        if role == Qt.ItemDataRole.UserRole:
+            return self._columns[self.SIDE_COLUMN][index.row()]
+        
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+class TradeDelegate(QStyledItemDelegate):
+    """
+    Styles trade cells at paint time: side colour from the model's
+    UserRole data and right alignment for the numeric columns
+    """
+    BUY_COLOR = QColor("#26A69A")
+    SELL_COLOR = QColor("#EF5350")
+    NUMERIC_COLUMNS = (3, 4, 5)
+    
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        column = index.column()
+        if column == TradesModel.SIDE_COLUMN:
+            color = self.BUY_COLOR if index.data(Qt.ItemDataRole.UserRole) == "BUY" else self.SELL_COLOR
+            option.palette.setColor(QPalette.ColorRole.Text, color)
+        elif column in self.NUMERIC_COLUMNS:
+            option.displayAlignment = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
 
 class TradeHistoryWidget(QWidget):
     """
@@ -18,10 +205,16 @@ class TradeHistoryWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         
+        # Random source for the sample data, and the id of the latest
+        # sample data request
+        self._rng = random.Random()
+        self._load_token = 0
+        
         # Initialize UI
         self.init_ui()
         
-        # Load sample data for demonstration
+        # Load sample data for demonstration; the table starts empty and
+        # fills in when the worker finishes
         self.load_sample_data()
         
     def init_ui(self):
@@ -34,7 +227,7 @@ class TradeHistoryWidget(QWidget):
         self.header_layout = QHBoxLayout()
         
         self.title_label = QLabel("Trade History")
-        self.title_label.setStyleSheet("font-weight: bold; font-size: 14px;")
+        self.title_label.setStyleSheet(_TITLE_QSS)
         
         # Period filter
         self.period_label = QLabel("Period:")
@@ -49,27 +242,16 @@ class TradeHistoryWidget(QWidget):
         self.header_layout.addWidget(self.period_combo)
         
         # Trade history table
-        self.trades_table = QTableWidget(0, 6)
-        self.trades_table.setHorizontalHeaderLabels(["Time", "Pair", "Side", "Price", "Amount", "Total"])
+        self.trades_model = TradesModel()
+        self.trades_table = QTableView()
+        self.trades_table.setModel(self.trades_model)
+        self.trades_table.setItemDelegate(TradeDelegate(self.trades_table))
         self.trades_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.trades_table.verticalHeader().setVisible(False)
+        # Fixed row heights keep the view from measuring rows on reset
+        self.trades_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         self.trades_table.setShowGrid(False)
-        self.trades_table.setStyleSheet("""
-            QTableWidget {
-                background-color: #1E1E1E;
-                border: none;
-            }
-            QHeaderView::section {
-                background-color: #2A2A2A;
-                color: #E0E0E0;
-                border: none;
-                padding: 4px;
-            }
-            QTableWidget::item {
-                border-bottom: 1px solid #2A2A2A;
-                padding: 4px;
-            }
-        """)
+        self.trades_table.setStyleSheet(_TABLE_QSS)
         
         # Summary stats
         self.summary_layout = QHBoxLayout()
@@ -106,142 +288,47 @@ class TradeHistoryWidget(QWidget):
         self.load_sample_data(period)
         
     def load_sample_data(self, period="Today"):
-        """Load sample trade history data for demonstration"""
-        # Clear existing data
-        self.trades_table.setRowCount(0)
-        
-        # Generate random trades based on selected period
-        trades = []
-        
-        # Determine date range based on period
-        end_date = datetime.now()
-        
-        if period == "Today":
-            start_date = end_date.replace(hour=0, minute=0, second=0, microsecond=0)
-            num_trades = random.randint(5, 15)
-        elif period == "Yesterday":
-            end_date = end_date.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(seconds=1)
-            start_date = end_date.replace(hour=0, minute=0, second=0, microsecond=0)
-            num_trades = random.randint(10, 25)
-        elif period == "This Week":
-            start_date = end_date - timedelta(days=end_date.weekday())
-            start_date = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
-            num_trades = random.randint(20, 50)
-        elif period == "Last 7 Days":
-            start_date = end_date - timedelta(days=7)
-            num_trades = random.randint(30, 70)
-        elif period == "This Month":
-            start_date = end_date.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-            num_trades = random.randint(50, 100)
-        else:  # All Time
-            start_date = end_date - timedelta(days=90)  # Just use last 90 days for demo
-            num_trades = random.randint(100, 200)
-        
-        # Trading pairs
-        pairs = ["BTC/USDT", "ETH/USDT", "BNB/USDT", "SOL/USDT", "XRP/USDT"]
-        
-        # Generate random trades
-        total_volume = 0
-        net_profit = 0
-        
-        for _ in range(num_trades):
-            # Random time within period
-            time_delta = random.random() * (end_date - start_date).total_seconds()
-            trade_time = start_date + timedelta(seconds=time_delta)
-            
-            # Random pair
-            pair = random.choice(pairs)
-            
-            # Random side (buy/sell)
-            side = random.choice(["BUY", "SELL"])
-            
-            # Random price based on pair
-            if pair == "BTC/USDT":
-                price = random.uniform(45000, 52000)
-            elif pair == "ETH/USDT":
-                price = random.uniform(2500, 3200)
-            elif pair == "BNB/USDT":
-                price = random.uniform(280, 350)
-            elif pair == "SOL/USDT":
-                price = random.uniform(40, 60)
-            else:  # XRP/USDT
-                price = random.uniform(0.5, 0.7)
-            
-            # Random amount
-            if pair == "BTC/USDT":
-                amount = random.uniform(0.01, 0.2)
-            elif pair == "ETH/USDT":
-                amount = random.uniform(0.1, 2.0)
-            elif pair == "BNB/USDT":
-                amount = random.uniform(0.5, 5.0)
-            elif pair == "SOL/USDT":
-                amount = random.uniform(1.0, 20.0)
-            else:  # XRP/USDT
-                amount = random.uniform(50, 1000)
-            
-            # Calculate total
-            total = price * amount
-            
-            # Add to trades list
-            trades.append({
-                "time": trade_time,
-                "pair": pair,
-                "side": side,
-                "price": price,
-                "amount": amount,
-                "total": total
-            })
-            
-            # Update summary stats
-            total_volume += total
-            if side == "SELL":
-                # For demo, assume a random profit percentage on sells
-                profit_pct = random.uniform(-1.5, 3.0)
-                profit_amount = total * profit_pct / 100
-                net_profit += profit_amount
-        
-        # Sort trades by time (newest first)
-        trades.sort(key=lambda x: x["time"], reverse=True)
-        
-        # Update trades table
-        self.trades_table.setRowCount(len(trades))
-        
-        for i, trade in enumerate(trades):
-            # Time
-            time_item = QTableWidgetItem(trade["time"].strftime("%Y-%m-%d %H:%M:%S"))
-            self.trades_table.setItem(i, 0, time_item)
-            
-            # Pair
-            pair_item = QTableWidgetItem(trade["pair"])
-            self.trades_table.setItem(i, 1, pair_item)
-            
-            # Side
-            side_item = QTableWidgetItem(trade["side"])
-            side_item.setForeground(QColor("#26A69A" if trade["side"] == "BUY" else "#EF5350"))
-            self.trades_table.setItem(i, 2, side_item)
-            
-            # Price
-            price_item = QTableWidgetItem(f"${trade['price']:.2f}")
-            price_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.trades_table.setItem(i, 3, price_item)
-            
-            # Amount
-            amount_item = QTableWidgetItem(f"{trade['amount']:.6f}")
-            amount_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.trades_table.setItem(i, 4, amount_item)
-            
-            # Total
-            total_item = QTableWidgetItem(f"${trade['total']:.2f}")
-            total_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.trades_table.setItem(i, 5, total_item)
+        """
+        Load sample trade history data for demonstration. The trades are
+        generated on the thread pool and applied when the worker is done.
+        """
+        # Each worker gets its own generator seeded from ours, and a token
+        # so results from superseded requests are dropped
+        self._load_token += 1
+        seed = self._rng.getrandbits(62)
+        worker = DataWorker(generate_sample_trades, period, seed, self._load_token)
+        worker.signals.done.connect(self.on_sample_data_ready)
+        worker.start()
+        
+    def on_sample_data_ready(self, trades):
+        """Apply generated sample trades to the table and summary stats"""
+        if trades["token"] != self._load_token:
+            return
+        
+        # Update trades table with painting, view signals and sorting
+        # suspended so the reset re-lays out once
+        was_sorting = self.trades_table.isSortingEnabled()
+        self.trades_table.setUpdatesEnabled(False)
+        self.trades_table.blockSignals(True)
+        self.trades_table.setSortingEnabled(False)
+        try:
+            self.trades_model.set_trades(
+                trades["times"], trades["pairs"], trades["sides"],
+                trades["prices"], trades["amounts"], trades["totals"]
+            )
+        finally:
+            self.trades_table.setSortingEnabled(was_sorting)
+            self.trades_table.blockSignals(False)
+            self.trades_table.setUpdatesEnabled(True)
         
         # Update summary stats
-        self.total_trades_value.setText(str(len(trades)))
+        total_volume = trades["total_volume"]
+        net_profit = trades["net_profit"]
+        self.total_trades_value.setText(str(len(trades["pairs"])))
         self.total_volume_value.setText(f"${total_volume:.2f}")
         
-        profit_color = "green" if net_profit >= 0 else "red"
         profit_sign = "+" if net_profit >= 0 else ""
         profit_pct = (net_profit / total_volume) * 100 if total_volume > 0 else 0
         
         self.net_profit_value.setText(f"{profit_sign}${net_profit:.2f} ({profit_sign}{profit_pct:.2f}%)")
-        self.net_profit_value.setStyleSheet(f"color: {profit_color}; font-weight: bold;")
+        self.net_profit_value.setStyleSheet(_PROFIT_QSS if net_profit >= 0 else _LOSS_QSS)
@@ -1,11 +1,215 @@
 #!/usr/bin/env python3
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QComboBox, QLabel, QFrame
 from PyQt6.QtCore import Qt, pyqtSignal
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import pandas as pd
-import numpy as np
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from pathlib import Path
+import logging
+import os
+import tempfile
+
+from gui.widgets.data_worker import DataWorker
+
+logger = logging.getLogger(__name__)
+
+try:
+    from PyQt6.QtWebEngineWidgets import QWebEngineView
+except ImportError:
+    # PyQt6-WebEngine is optional; without it the chart is written to temp_chart.html
+    QWebEngineView = None
+
+# Plotly, pandas and NumPy are only bound by _load_chart_libs(), so
+# importing this module (e.g. via gui.widgets) does not pay for them
+go = make_subplots = get_plotlyjs_version = pd = np = sliding_window_view = None
+
+def _load_chart_libs():
+    """Import the plotting and data libraries on first use"""
+    global go, make_subplots, get_plotlyjs_version, pd, np, sliding_window_view
+    if go is not None:
+        return
+    from plotly.subplots import make_subplots
+    from plotly.offline import get_plotlyjs_version
+    import pandas as pd
+    import numpy as np
+    from numpy.lib.stride_tricks import sliding_window_view
+    # Bound last: go being set means everything else is too, which matters
+    # once the sample data worker calls this off the GUI thread
+    import plotly.graph_objects as go
+
+# Seed for the generated sample data
+SAMPLE_SEED = 42
+
+# Number of most recent bars drawn on the chart
+CHART_POINTS = 200
+
+# Upper bound on points/bars handed to Plotly; longer series are downsampled
+MAX_DRAWN_POINTS = 500
+
+# Page loaded once into the web view; chart updates are pushed into it
+# with Plotly.react so only the figure JSON crosses into the page
+CHART_PAGE = """<html>
+<head>
+<meta charset="utf-8" />
+<script src="https://cdn.plot.ly/plotly-{version}.min.js"></script>
+<style>html, body, #chart {{ margin: 0; width: 100%; height: 100%; background: #1E1E1E; }}</style>
+</head>
+<body>
+<div id="chart"></div>
+<script>Plotly.newPlot('chart', [], {{}}, {{responsive: true}});</script>
+</body>
+</html>"""
+
+def _rolling(values, window, func, **kwargs):
+    """Apply func over trailing windows of values, NaN-padded like pandas rolling"""
+    out = np.full(len(values), np.nan)
+    if len(values) >= window:
+        out[window - 1:] = func(sliding_window_view(values, window), axis=1, **kwargs)
+    return out
+
+def _lttb(x, y, threshold=MAX_DRAWN_POINTS):
+    """
+    Largest-Triangle-Three-Buckets downsampling
+    
+    Returns the indices of at most threshold points of (x, y) that keep
+    the visual shape of the series. x must be numeric and increasing.
+    """
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    
+    # Bucket boundaries for everything between the first and last point
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    indices = np.empty(threshold, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+    
+    selected = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        
+        # Third vertex is the average of the next bucket
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        
+        ax, ay = x[selected], y[selected]
+        areas = np.abs((ax - avg_x) * (y[start:end] - ay) - (ax - x[start:end]) * (avg_y - ay))
+        selected = start + int(np.argmax(areas))
+        indices[i + 1] = selected
+    
+    return indices
+
+def _ohlc_buckets(df, threshold=MAX_DRAWN_POINTS):
+    """Aggregate OHLCV bars into at most threshold buckets (first/max/min/last/sum)"""
+    if len(df) <= threshold:
+        return df
+    
+    starts = np.array([bucket[0] for bucket in np.array_split(np.arange(len(df)), threshold)])
+    ends = np.append(starts[1:], len(df)) - 1
+    return pd.DataFrame({
+        'timestamp': df['timestamp'].to_numpy()[starts],
+        'open': df['open'].to_numpy()[starts],
+        'high': np.maximum.reduceat(df['high'].to_numpy(), starts),
+        'low': np.minimum.reduceat(df['low'].to_numpy(), starts),
+        'close': df['close'].to_numpy()[ends],
+        'volume': np.add.reduceat(df['volume'].to_numpy(), starts)
+    })
+
+def _sample_cache_path(seed):
+    """Parquet file the sample bars for seed are cached in for today"""
+    return Path(tempfile.gettempdir()) / f"tc_sample_{seed}_{date.today()}.parquet"
+
+def generate_sample_ohlc(seed=SAMPLE_SEED):
+    """
+    Generate 30 days of 15-minute sample OHLCV bars. Runs off the GUI
+    thread, so it uses its own seeded generator rather than the global one.
+    
+    The bars are cached as parquet in the temp directory per seed and day,
+    so later launches read them back instead of regenerating. Without a
+    parquet engine (pyarrow or fastparquet) the cache is skipped.
+    
+    Args:
+        seed (int): Seed for the random generator
+        
+    Returns:
+        pd.DataFrame: timestamp, open, high, low, close and volume columns
+    """
+    _load_chart_libs()
+    
+    cache_path = _sample_cache_path(seed)
+    if cache_path.exists():
+        try:
+            return pd.read_parquet(cache_path)
+        except Exception as e:
+            logger.debug(f"Ignoring sample data cache {cache_path}: {e}")
+    
+    df = _generate_sample_ohlc(seed)
+    
+    # Write to a temporary name first so a concurrent reader never sees a
+    # partial file
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        df.to_parquet(tmp_path)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        logger.debug(f"Not caching sample data: {e}")
+        tmp_path.unlink(missing_ok=True)
+    
+    return df
+
+def _generate_sample_ohlc(seed):
+    """Generate the sample OHLCV bars for generate_sample_ohlc"""
+    # Generate sample price data
+    rng = np.random.RandomState(seed)
+    
+    # Create date range for the past 30 days with 15-minute intervals
+    end_date = datetime.now()
+    start_date = end_date - timedelta(days=30)
+    
+    # Generate dates (15-minute intervals)
+    date_range = pd.date_range(start=start_date, end=end_date, freq='15min')
+    
+    # Generate prices
+    base_price = 50000  # Starting price in USD
+    daily_volatility = 0.02  # 2% daily volatility
+    
+    # Convert daily volatility to 15-minute volatility
+    interval_volatility = daily_volatility / np.sqrt(4 * 24)  # 4 15-minute intervals per hour * 24 hours
+    
+    # Generate price series with random walk
+    log_returns = rng.normal(0, interval_volatility, size=len(date_range))
+    log_prices = np.cumsum(log_returns) + np.log(base_price)
+    prices = np.exp(log_prices)
+    
+    # Create OHLC data
+    opens = prices.copy()
+    
+    # Generate high, low, and close prices relative to open
+    highs = opens * np.exp(rng.normal(0.001, interval_volatility / 2, size=len(opens)))
+    lows = opens * np.exp(rng.normal(-0.001, interval_volatility / 2, size=len(opens)))
+    closes = prices * np.exp(rng.normal(0, interval_volatility / 4, size=len(opens)))
+    
+    # Make sure high is always the highest and low is always the lowest
+    np.maximum(highs, np.maximum(opens, closes), out=highs)
+    np.minimum(lows, np.minimum(opens, closes), out=lows)
+    
+    # Generate volumes (higher on price movements)
+    price_changes = np.empty_like(closes)
+    price_changes[0] = abs(closes[0] - base_price)
+    np.abs(np.diff(closes), out=price_changes[1:])
+    volumes = rng.normal(100000, 50000, size=len(closes)) * (1 + 5 * price_changes / base_price)
+    
+    return pd.DataFrame({
+        'timestamp': date_range,
+        'open': opens,
+        'high': highs,
+        'low': lows,
+        'close': closes,
+        'volume': volumes
+    })
 
 class TradingChartWidget(QWidget):
     """
@@ -20,6 +224,27 @@ class TradingChartWidget(QWidget):
         # Sample data for demonstration
         self.sample_data_loaded = False
         
+        # Rendered chart (figure JSON for the web view, HTML otherwise) keyed
+        # by (chart type, indicator, timeframe, data version); the version is
+        # bumped whenever self.df changes
+        self._chart_cache = OrderedDict()
+        self._chart_cache_size = 8
+        self._data_version = 0
+        
+        # Figure JSON waiting for the web view page to finish loading
+        self._chart_ready = False
+        self._pending_chart = None
+        
+        # Indicator series for the charted bars keyed by (name, window);
+        # cleared whenever self.df changes
+        self._indicator_cache = {}
+        
+        # Running EMA per span as (bars consumed, last CHART_POINTS values),
+        # seeded from the first bar of self.df. Kept across append_bars so
+        # new bars only cost the recursive update; reset when self.df is
+        # replaced.
+        self._ema_state = {}
+        
         # Initialize UI
         self.init_ui()
         
@@ -74,97 +299,209 @@ class TradingChartWidget(QWidget):
         self.chart_layout = QVBoxLayout(self.chart_container)
         self.chart_layout.setContentsMargins(0, 0, 0, 0)
         
-        # Add placeholder text
-        self.chart_placeholder = QLabel("Chart loading...")
-        self.chart_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.chart_layout.addWidget(self.chart_placeholder)
+        if QWebEngineView is not None:
+            # Load the chart page once; updates are streamed into it
+            _load_chart_libs()
+            self.chart_view = QWebEngineView()
+            self.chart_view.loadFinished.connect(self.on_chart_page_loaded)
+            self.chart_view.setHtml(CHART_PAGE.format(version=get_plotlyjs_version()))
+            self.chart_layout.addWidget(self.chart_view)
+        else:
+            self.chart_view = None
+            
+            # Add placeholder text
+            self.chart_placeholder = QLabel("Chart loading...")
+            self.chart_placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            self.chart_layout.addWidget(self.chart_placeholder)
         
         # Add components to main layout
         self.layout.addWidget(self.header)
         self.layout.addWidget(self.chart_container)
     
     def load_sample_data(self):
-        """Load sample data for demonstration purposes"""
-        # Generate sample price data
-        np.random.seed(42)
-        
-        # Create date range for the past 30 days with 15-minute intervals
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=30)
-        
-        # Generate dates (15-minute intervals)
-        date_range = pd.date_range(start=start_date, end=end_date, freq='15min')
-        
-        # Generate prices
-        base_price = 50000  # Starting price in USD
-        daily_volatility = 0.02  # 2% daily volatility
-        
-        # Convert daily volatility to 15-minute volatility
-        interval_volatility = daily_volatility / np.sqrt(4 * 24)  # 4 15-minute intervals per hour * 24 hours
-        
-        # Generate price series with random walk
-        log_returns = np.random.normal(0, interval_volatility, size=len(date_range))
-        log_prices = np.cumsum(log_returns) + np.log(base_price)
-        prices = np.exp(log_prices)
-        
-        # Create OHLC data
-        opens = prices.copy()
-        
-        # Generate high, low, and close prices relative to open
-        highs = opens * np.exp(np.random.normal(0.001, interval_volatility / 2, size=len(opens)))
-        lows = opens * np.exp(np.random.normal(-0.001, interval_volatility / 2, size=len(opens)))
-        closes = prices * np.exp(np.random.normal(0, interval_volatility / 4, size=len(opens)))
-        
-        # Make sure high is always the highest and low is always the lowest
-        for i in range(len(opens)):
-            max_price = max(opens[i], closes[i])
-            min_price = min(opens[i], closes[i])
-            highs[i] = max(highs[i], max_price)
-            lows[i] = min(lows[i], min_price)
-        
-        # Generate volumes (higher on price movements)
-        price_changes = np.abs(np.diff(np.append(base_price, closes)))
-        volumes = np.random.normal(100000, 50000, size=len(closes)) * (1 + 5 * price_changes / base_price)
-        
-        # Create DataFrame
-        self.df = pd.DataFrame({
-            'timestamp': date_range,
-            'open': opens,
-            'high': highs,
-            'low': lows,
-            'close': closes,
-            'volume': volumes
-        })
-        
+        """
+        Load sample data for demonstration purposes. The OHLC data is
+        generated on the thread pool; the chart is drawn once it arrives.
+        """
+        worker = DataWorker(generate_sample_ohlc)
+        worker.signals.done.connect(self.on_sample_data_ready)
+        worker.start()
+        
+    def on_sample_data_ready(self, df):
+        """Swap in generated sample data and redraw"""
+        self.df = df
+        self._data_version += 1
+        self._indicator_cache.clear()
+        self._ema_state.clear()
         self.sample_data_loaded = True
         self.update_chart()
         
+    def append_bars(self, bars):
+        """
+        Append new OHLCV bars to the chart data and redraw
+        
+        Args:
+            bars (pd.DataFrame): Bars with the same columns as self.df
+        """
+        _load_chart_libs()
+        self.df = pd.concat([self.df, bars], ignore_index=True)
+        self._data_version += 1
+        self._indicator_cache.clear()
+        self.update_chart()
+        
     def update_chart(self):
         """Update the chart based on current settings"""
         if not self.sample_data_loaded:
             return
         
-        # Create figure with secondary y-axis for volume
-        fig = make_subplots(rows=2, cols=1, shared_xaxes=True, 
-                           vertical_spacing=0.03, 
-                           row_heights=[0.7, 0.3],
-                           subplot_titles=('BTC/USDT', 'Volume'))
-        
-        # Get current chart type
+        _load_chart_libs()
         chart_type = self.chart_type_combo.currentText()
+        indicator = self.indicator_combo.currentText()
+        timeframe = self.timeframe_combo.currentText()
+        
+        # Reuse the rendered chart when this combination was drawn before
+        key = (chart_type, indicator, timeframe, self._data_version)
+        rendered = self._chart_cache.get(key)
+        if rendered is None:
+            fig = self._build_figure(chart_type, indicator, timeframe)
+            if self.chart_view is not None:
+                rendered = fig.to_json()
+            else:
+                rendered = fig.to_html(include_plotlyjs='cdn', config={'responsive': True})
+            self._chart_cache[key] = rendered
+            if len(self._chart_cache) > self._chart_cache_size:
+                self._chart_cache.popitem(last=False)
+        else:
+            self._chart_cache.move_to_end(key)
+        
+        if self.chart_view is not None:
+            self._show_chart(rendered)
+            return
+        
+        chart_html = rendered
+        
+        # Create HTML file (this is a temporary solution - in a real app we'd use QWebEngineView)
+        with open('temp_chart.html', 'w') as f:
+            f.write(chart_html)
+        
+        # Instead of showing the actual chart (which would require QWebEngineView),
+        # we'll display a placeholder message in this example
+        self.chart_placeholder.setText(f"Interactive {chart_type} chart with {indicator} indicator would display here.\nIn a complete implementation, this would use QWebEngineView to display the Plotly chart.")
+        
+    def on_chart_page_loaded(self, ok):
+        """Push any chart rendered before the web view page was ready"""
+        self._chart_ready = ok
+        if ok and self._pending_chart is not None:
+            self._show_chart(self._pending_chart)
+        
+    def _show_chart(self, fig_json):
+        """Update the web view chart in place from the figure JSON"""
+        if not self._chart_ready:
+            self._pending_chart = fig_json
+            return
+        self._pending_chart = None
+        self.chart_view.page().runJavaScript(
+            f"var fig = {fig_json}; Plotly.react('chart', fig.data, fig.layout);"
+        )
+        
+    def _chart_closes(self):
+        """Close prices of the charted bars as an ndarray"""
+        return self.df['close'].to_numpy()[-CHART_POINTS:]
+        
+    def _ma(self, window):
+        """Simple moving average of the charted closes"""
+        key = ('ma', window)
+        if key not in self._indicator_cache:
+            self._indicator_cache[key] = _rolling(self._chart_closes(), window, np.mean)
+        return self._indicator_cache[key]
+        
+    def _ema(self, span):
+        """Exponential moving average of the closes, for the charted bars"""
+        key = ('ema', span)
+        if key not in self._indicator_cache:
+            self._indicator_cache[key] = self._update_ema(span)
+        return self._indicator_cache[key]
+        
+    def _update_ema(self, span):
+        """Bring the running EMA for span up to date with self.df"""
+        closes = self.df['close'].to_numpy()
+        consumed, tail = self._ema_state.get(span, (0, None))
+        
+        if tail is None or consumed > len(closes):
+            # No usable state: compute over the whole series in one pass
+            tail = pd.Series(closes).ewm(span=span, adjust=False).mean().to_numpy()[-CHART_POINTS:]
+        elif consumed < len(closes):
+            # Only the appended bars need the recursive update
+            alpha = 2 / (span + 1)
+            ema = tail[-1]
+            new = np.empty(len(closes) - consumed)
+            for i, price in enumerate(closes[consumed:].tolist()):
+                ema = alpha * price + (1 - alpha) * ema
+                new[i] = ema
+            tail = np.concatenate((tail, new))[-CHART_POINTS:]
+        
+        self._ema_state[span] = (len(closes), tail)
+        return tail
+        
+    def _bollinger(self, window):
+        """Bollinger Bands (SMA, upper, lower) at 2 standard deviations"""
+        key = ('bollinger', window)
+        if key not in self._indicator_cache:
+            sma = self._ma(window)
+            std = _rolling(self._chart_closes(), window, np.std, ddof=1)
+            self._indicator_cache[key] = (sma, sma + std * 2, sma - std * 2)
+        return self._indicator_cache[key]
+        
+    def _rsi(self, window):
+        """Relative Strength Index of the charted closes"""
+        key = ('rsi', window)
+        if key not in self._indicator_cache:
+            delta = np.diff(self._chart_closes(), prepend=np.nan)
+            gain = np.where(delta > 0, delta, 0.0)
+            loss = np.where(delta < 0, -delta, 0.0)
+            
+            avg_gain = _rolling(gain, window, np.mean)
+            avg_loss = _rolling(loss, window, np.mean)
+            
+            with np.errstate(divide='ignore', invalid='ignore'):
+                rs = avg_gain / avg_loss
+                self._indicator_cache[key] = 100 - (100 / (1 + rs))
+        return self._indicator_cache[key]
+        
+    def _build_figure(self, chart_type, indicator, timeframe):
+        """Build the Plotly figure for the given chart settings"""
+        # Decide the subplot layout up front: price and volume, plus an
+        # RSI panel when that indicator is selected
+        if indicator == "RSI":
+            fig = make_subplots(rows=3, cols=1, shared_xaxes=True, 
+                               vertical_spacing=0.03, 
+                               row_heights=[0.6, 0.2, 0.2],
+                               subplot_titles=('BTC/USDT', 'Volume', 'RSI (14)'))
+        else:
+            fig = make_subplots(rows=2, cols=1, shared_xaxes=True, 
+                               vertical_spacing=0.03, 
+                               row_heights=[0.7, 0.3],
+                               subplot_titles=('BTC/USDT', 'Volume'))
         
         # Parse data for chart
-        df = self.df[-200:]  # Show last 200 data points for demonstration
+        df = self.df[-CHART_POINTS:]  # Show last 200 data points for demonstration
+        
+        # Cap what Plotly has to draw: bucket the bars, and pick the
+        # shape-preserving subset of closes for line charts
+        bars = _ohlc_buckets(df)
+        line_idx = _lttb(df['timestamp'].to_numpy().astype(np.int64), df['close'].to_numpy())
+        line_x = df['timestamp'].to_numpy()[line_idx]
+        line_y = df['close'].to_numpy()[line_idx]
         
         # Add appropriate traces based on chart type
         if chart_type == "Candlestick":
             fig.add_trace(
                 go.Candlestick(
-                    x=df['timestamp'],
-                    open=df['open'],
-                    high=df['high'],
-                    low=df['low'],
-                    close=df['close'],
+                    x=bars['timestamp'],
+                    open=bars['open'],
+                    high=bars['high'],
+                    low=bars['low'],
+                    close=bars['close'],
                     increasing_line_color='#26A69A', 
                     decreasing_line_color='#EF5350',
                     name='Price'
@@ -174,11 +511,11 @@ class TradingChartWidget(QWidget):
         elif chart_type == "OHLC":
             fig.add_trace(
                 go.Ohlc(
-                    x=df['timestamp'],
-                    open=df['open'],
-                    high=df['high'],
-                    low=df['low'],
-                    close=df['close'],
+                    x=bars['timestamp'],
+                    open=bars['open'],
+                    high=bars['high'],
+                    low=bars['low'],
+                    close=bars['close'],
                     increasing_line_color='#26A69A', 
                     decreasing_line_color='#EF5350',
                     name='Price'
@@ -188,8 +525,8 @@ class TradingChartWidget(QWidget):
         elif chart_type == "Line":
             fig.add_trace(
                 go.Scatter(
-                    x=df['timestamp'],
-                    y=df['close'],
+                    x=line_x,
+                    y=line_y,
                     line=dict(color='#2196F3', width=2),
                     name='Price'
                 ),
@@ -198,8 +535,8 @@ class TradingChartWidget(QWidget):
         elif chart_type == "Area":
             fig.add_trace(
                 go.Scatter(
-                    x=df['timestamp'],
-                    y=df['close'],
+                    x=line_x,
+                    y=line_y,
                     fill='tozeroy',
                     fillcolor='rgba(33, 150, 243, 0.3)',
                     line=dict(color='#2196F3', width=2),
@@ -209,13 +546,12 @@ class TradingChartWidget(QWidget):
             )
         
         # Add volume bars
-        # Fix for DataFrame indexing - use df.iloc for integer-based indexing
-        colors = ['#26A69A' if df['close'].iloc[i] >= df['open'].iloc[i] else '#EF5350' for i in range(len(df))]
+        colors = np.where(bars['close'].to_numpy() >= bars['open'].to_numpy(), '#26A69A', '#EF5350').tolist()
         
         fig.add_trace(
             go.Bar(
-                x=df['timestamp'],
-                y=df['volume'],
+                x=bars['timestamp'],
+                y=bars['volume'],
                 marker_color=colors,
                 name='Volume'
             ),
@@ -223,14 +559,12 @@ class TradingChartWidget(QWidget):
         )
         
         # Add indicators if selected
-        indicator = self.indicator_combo.currentText()
-        
         if indicator == "MA":
             # Add 20 and 50 period moving averages
             fig.add_trace(
                 go.Scatter(
                     x=df['timestamp'],
-                    y=df['close'].rolling(window=20).mean(),
+                    y=self._ma(20),
                     line=dict(color='#FFA726', width=1),
                     name='MA (20)'
                 ),
@@ -239,7 +573,7 @@ class TradingChartWidget(QWidget):
             fig.add_trace(
                 go.Scatter(
                     x=df['timestamp'],
-                    y=df['close'].rolling(window=50).mean(),
+                    y=self._ma(50),
                     line=dict(color='#AB47BC', width=1),
                     name='MA (50)'
                 ),
@@ -250,7 +584,7 @@ class TradingChartWidget(QWidget):
             fig.add_trace(
                 go.Scatter(
                     x=df['timestamp'],
-                    y=df['close'].ewm(span=20, adjust=False).mean(),
+                    y=self._ema(20),
                     line=dict(color='#FFA726', width=1),
                     name='EMA (20)'
                 ),
@@ -259,7 +593,7 @@ class TradingChartWidget(QWidget):
             fig.add_trace(
                 go.Scatter(
                     x=df['timestamp'],
-                    y=df['close'].ewm(span=50, adjust=False).mean(),
+                    y=self._ema(50),
                     line=dict(color='#AB47BC', width=1),
                     name='EMA (50)'
                 ),
@@ -267,11 +601,7 @@ class TradingChartWidget(QWidget):
             )
         elif indicator == "Bollinger Bands":
             # Calculate Bollinger Bands (20-period, 2 standard deviations)
-            window = 20
-            sma = df['close'].rolling(window=window).mean()
-            std = df['close'].rolling(window=window).std()
-            upper_band = sma + (std * 2)
-            lower_band = sma - (std * 2)
+            sma, upper_band, lower_band = self._bollinger(20)
             
             # Add Bollinger Bands to chart
             fig.add_trace(
@@ -303,51 +633,9 @@ class TradingChartWidget(QWidget):
             )
         elif indicator == "RSI":
             # Calculate RSI (14-period)
-            window = 14
-            delta = df['close'].diff()
-            gain = delta.where(delta > 0, 0)
-            loss = -delta.where(delta < 0, 0)
+            rsi = self._rsi(14)
             
-            avg_gain = gain.rolling(window=window).mean()
-            avg_loss = loss.rolling(window=window).mean()
-            
-            rs = avg_gain / avg_loss
-            rsi = 100 - (100 / (1 + rs))
-            
-            # Add RSI to chart as a separate subplot
-            fig = make_subplots(rows=3, cols=1, shared_xaxes=True, 
-                               vertical_spacing=0.03, 
-                               row_heights=[0.6, 0.2, 0.2],
-                               subplot_titles=('BTC/USDT', 'Volume', 'RSI (14)'))
-            
-            # Re-add the price chart
-            if chart_type == "Candlestick":
-                fig.add_trace(
-                    go.Candlestick(
-                        x=df['timestamp'],
-                        open=df['open'],
-                        high=df['high'],
-                        low=df['low'],
-                        close=df['close'],
-                        increasing_line_color='#26A69A', 
-                        decreasing_line_color='#EF5350',
-                        name='Price'
-                    ),
-                    row=1, col=1
-                )
-            
-            # Re-add volume
-            fig.add_trace(
-                go.Bar(
-                    x=df['timestamp'],
-                    y=df['volume'],
-                    marker_color=colors,
-                    name='Volume'
-                ),
-                row=2, col=1
-            )
-            
-            # Add RSI
+            # Add RSI in its own subplot
             fig.add_trace(
                 go.Scatter(
                     x=df['timestamp'],
@@ -384,7 +672,7 @@ class TradingChartWidget(QWidget):
         
         # Update layout for better visualization
         fig.update_layout(
-            title=f'BTC/USDT - {self.timeframe_combo.currentText()}',
+            title=f'BTC/USDT - {timeframe}',
             template='plotly_dark',
             plot_bgcolor='#1E1E1E',
             paper_bgcolor='#1E1E1E',
@@ -415,13 +703,4 @@ class TradingChartWidget(QWidget):
             zeroline=False
         )
         
-        # Convert the figure to HTML
-        chart_html = fig.to_html(include_plotlyjs='cdn', config={'responsive': True})
-        
-        # Create HTML file (this is a temporary solution - in a real app we'd use QWebEngineView)
-        with open('temp_chart.html', 'w') as f:
-            f.write(chart_html)
-        
-        # Instead of showing the actual chart (which would require QWebEngineView),
-        # we'll display a placeholder message in this example
-        self.chart_placeholder.setText(f"Interactive {chart_type} chart with {indicator} indicator would display here.\nIn a complete implementation, this would use QWebEngineView to display the Plotly chart.")
+        return fig
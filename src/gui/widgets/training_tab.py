@@ -1,6 +1,35 @@
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QProgressBar, QLabel, QComboBox, QFileDialog
-from PyQt6.QtCore import Qt, pyqtSlot, QTimer
+from PyQt6.QtCore import Qt, pyqtSlot, pyqtSignal, QObject, QThread, QCoreApplication
 from PyQt6.QtGui import QColor
+import time
+
+class TrainingWorker(QObject):
+    """
+    Runs the (simulated) training loop off the GUI thread and reports
+    progress per epoch
+    """
+    progress = pyqtSignal(int, float, float)  # epoch, loss, accuracy
+    finished = pyqtSignal()
+    
+    def __init__(self, start_epoch=0, epochs=100, step_seconds=0.1):
+        super().__init__()
+        self.start_epoch = start_epoch
+        self.epochs = epochs
+        self.step_seconds = step_seconds
+        self._stopped = False
+    
+    def stop(self):
+        """Ask the training loop to exit after the current epoch"""
+        self._stopped = True
+    
+    def run(self):
+        """Simulate training progress"""
+        for epoch in range(self.start_epoch, self.epochs):
+            if self._stopped:
+                break
+            time.sleep(self.step_seconds)
+            self.progress.emit(epoch, 0.99 ** epoch, epoch * 0.8)
+        self.finished.emit()
 
 class TrainingTabWidget(QWidget):
     """
@@ -53,10 +82,19 @@ class TrainingTabWidget(QWidget):
         self.stop_train_btn.clicked.connect(self.on_stop_training)
         self.load_model_btn.clicked.connect(self.on_load_model)
         
-        # Training simulation
+        # Training simulation runs in a worker thread; progress repaints
+        # are throttled to about 30 per second
         self.training_active = False
-        self.training_timer = QTimer()
-        self.training_timer.timeout.connect(self.update_training)
+        self.training_thread = None
+        self.training_worker = None
+        self._min_update_interval = 0.033
+        self._last_update = 0.0
+        
+        # A QThread destroyed while running aborts the process, so stop
+        # training before the application tears widgets down
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.on_stop_training)
         
     @pyqtSlot()
     def on_start_training(self):
@@ -65,7 +103,22 @@ class TrainingTabWidget(QWidget):
             self.training_active = True
             self.start_train_btn.setEnabled(False)
             self.stop_train_btn.setEnabled(True)
-            self.training_timer.start(100)  # Update every 100ms
+            
+            self.training_thread = QThread(self)
+            self.training_worker = TrainingWorker(start_epoch=max(self.progress_bar.value(), 0))
+            self.training_worker.moveToThread(self.training_thread)
+            
+            self.training_thread.started.connect(self.training_worker.run)
+            self.training_worker.progress.connect(self.on_training_progress)
+            self.training_worker.finished.connect(self.on_training_finished)
+            # Tear the thread down from the worker itself so cleanup does
+            # not depend on the GUI slot running; deleting the worker waits
+            # for the thread so queued progress still has a sender
+            self.training_worker.finished.connect(self.training_thread.quit)
+            self.training_thread.finished.connect(self.training_worker.deleteLater)
+            self.training_thread.finished.connect(self.training_thread.deleteLater)
+            
+            self.training_thread.start()
             
     @pyqtSlot()
     def on_stop_training(self):
@@ -73,7 +126,13 @@ class TrainingTabWidget(QWidget):
         self.training_active = False
         self.start_train_btn.setEnabled(True)
         self.stop_train_btn.setEnabled(False)
-        self.training_timer.stop()
+        
+        if self.training_worker is not None:
+            self.training_worker.stop()
+            self.training_thread.quit()
+            self.training_thread.wait()
+            self.training_worker = None
+            self.training_thread = None
         
     @pyqtSlot()
     def on_load_model(self):
@@ -85,14 +144,26 @@ class TrainingTabWidget(QWidget):
             self.model_selector.addItem(filename.split("/")[-1])
             self.model_selector.setCurrentIndex(self.model_selector.count()-1)
             
-    def update_training(self):
-        """Simulate training progress"""
-        if self.training_active:
-            current = self.progress_bar.value()
-            if current < 100:
-                self.progress_bar.setValue(current + 1)
-                self.epoch_label.setText(f"Epoch: {current}")
-                self.loss_label.setText(f"Loss: {0.99 ** current:.4f}")
-                self.accuracy_label.setText(f"Accuracy: {current * 0.8:.1f}%")
-            else:
-                self.on_stop_training()
+    @pyqtSlot()
+    def on_training_finished(self):
+        """Handle the worker running out of epochs"""
+        # Ignore queued signals from a worker that was already stopped
+        if self.sender() is self.training_worker:
+            self.on_stop_training()
+            
+    @pyqtSlot(int, float, float)
+    def on_training_progress(self, epoch, loss, accuracy):
+        """Show training progress, skipping repaints that arrive too fast"""
+        if not self.training_active or self.sender() is not self.training_worker:
+            return
+        
+        now = time.monotonic()
+        last_epoch = epoch + 1 >= self.training_worker.epochs
+        if now - self._last_update < self._min_update_interval and not last_epoch:
+            return
+        self._last_update = now
+        
+        self.progress_bar.setValue(epoch + 1)
+        self.epoch_label.setText(f"Epoch: {epoch}")
+        self.loss_label.setText(f"Loss: {loss:.4f}")
+        self.accuracy_label.setText(f"Accuracy: {accuracy:.1f}%")
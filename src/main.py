@@ -2,101 +2,240 @@
 import sys
 import os
 import logging
-import traceback
+import json
+import shutil
 import subprocess
-import argparse
-from PyQt6.QtWidgets import QApplication, QMessageBox
-from PyQt6.QtCore import QCoreApplication
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import SimpleNamespace
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 # Add parent directory to path to allow imports from other modules
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(BASE_DIR)
 
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Helper scripts wrapped by the CLI subcommands
+MCP_SETTINGS_SCRIPT = os.path.join(BASE_DIR, "update_mcp_settings.ts")
+SMART_CONTRACT_SCRIPT = os.path.join(BASE_DIR, "smart_contract_helper.js")
+CRYPTO_TRADING_SCRIPT = os.path.join(BASE_DIR, "crypto_trading_helper.js")
 
-# Configure application settings
-QCoreApplication.setOrganizationName("BumBot")
-QCoreApplication.setApplicationName("BumBot Crypto Trading")
-
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler("bumbot.log"),
-        logging.StreamHandler()
-    ]
-)
+# Helper commands and the first parameter each defaults to
+SMART_CONTRACT_DEFAULTS = {
+    "generate": "TestContract",
+    "test": "TestContract",
+    "deploy": "TestContract",
+}
+CRYPTO_TRADING_DEFAULTS = {
+    "fetch": "BTCUSD",
+    "trade": "mean_reversion",
+    "analyze": "30d",
+    "alert": "5",
+    "backtest": "momentum",
+}
 
 logger = logging.getLogger(__name__)
 
 
-def run_update_mcp_settings(args):
-    script_path = os.path.join(BASE_DIR, "update_mcp_settings.ts")
-    print(f"Running update_mcp_settings.ts from: {script_path}")  # Log the path
-    command = ["npx", "ts-node", script_path]  # Use npx ts-node instead of node
-    if args.dry_run:
-        command.append("--dry-run")
-    if args.interactive:
-        command.append("--interactive")
-    if args.restore:
-        command.append("--restore")
-    if args.verbose:
-        command.append("--verbose")
-    subprocess.run(command)
-
-def run_smart_contract_helper(args):
-    node_path = "C:\\Program Files\\nodejs\\node.exe"  # Replace with the actual path to node
-    script_path = os.path.join(BASE_DIR, "smart_contract_helper.js")
-    print(f"Running smart_contract_helper.js from: {script_path}")  # Log the path
-    command = [node_path, script_path, args.command]
-    # Provide default parameters to avoid interactive prompts
-    if args.param1:
-        command.append(args.param1)
-    else:
-        if args.command == "generate":
-            command.append("TestContract")
-        elif args.command == "test":
-            command.append("TestContract")
-        elif args.command == "deploy":
-            command.append("TestContract")
-    if args.param2:
-        command.append(args.param2)
-    if args.yes:
-        command.append("--yes")
-    subprocess.run(command)
-
-def run_crypto_trading_helper(args):
-    node_path = "C:\\Program Files\\nodejs\\node.exe"  # Replace with the actual path to node
-    script_path = os.path.join(BASE_DIR, "crypto_trading_helper.js")
-    print(f"Running crypto_trading_helper.js from: {script_path}")  # Log the path
-    command = [node_path, script_path, args.command]
-    # Provide default parameters to avoid interactive prompts
-    if args.param1:
-        command.append(args.param1)
+def _configure_logging():
+    """
+    Setup logging. Only the GUI logs, so the CLI wrappers skip this; the
+    log file itself is opened on the first record.
+    """
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=[
+            logging.FileHandler("bumbot.log", delay=True),
+            logging.StreamHandler()
+        ]
+    )
+
+
+@lru_cache(maxsize=None)
+def _node():
+    """Path to node, looked up on PATH once; falls back to the default Windows install"""
+    return shutil.which("node") or "C:\\Program Files\\nodejs\\node.exe"
+
+def _exec(command):
+    """
+    Replace this process with command. The wrappers have nothing left to do
+    once the helper starts, so there is no point keeping Python alive.
+    execvp doesn't replace the process on Windows, so there the helper runs
+    as a child and its exit code is passed through.
+    """
+    if sys.platform == "win32":
+        sys.exit(subprocess.run(command).returncode)
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.execvp(command[0], command)
+
+def _run_concurrently(commands):
+    """
+    Run several helper commands at once and exit with the first non-zero
+    exit code, or 0 if they all succeed. The children inherit our stdio
+    and write to it directly, so their output is never piped through or
+    read by this process.
+    """
+    if hasattr(os, "posix_spawnp"):
+        # Nothing is piped, so spawn directly and wait; this skips both the
+        # fork of this process and the event loop
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pids = [os.posix_spawnp(command[0], command, os.environ) for command in commands]
+        return_codes = [os.waitstatus_to_exitcode(os.waitpid(pid, 0)[1]) for pid in pids]
     else:
-        if args.command == "fetch":
-            command.append("BTCUSD")
-        elif args.command == "trade":
-            command.append("mean_reversion")
-        elif args.command == "analyze":
-            command.append("30d")
-        elif args.command == "alert":
-            command.append("5")
-        elif args.command == "backtest":
-            command.append("momentum")
-    if args.param2:
-        command.append(args.param2)
-    if args.param3:
-        command.append(args.param3)
-    if args.yes:
-        command.append("--yes")
-    subprocess.run(command)
+        import asyncio
+        
+        async def run_all():
+            procs = [await asyncio.create_subprocess_exec(*command) for command in commands]
+            return await asyncio.gather(*(proc.wait() for proc in procs))
+        
+        return_codes = asyncio.run(run_all())
+    
+    sys.exit(next((rc for rc in return_codes if rc), 0))
 
-def main():
+def _run_commands(commands):
+    """Exec a single helper command, or run a batch of them concurrently"""
+    if len(commands) == 1:
+        _exec(commands[0])
+    _run_concurrently(commands)
+
+class NodeWorker:
     """
-    Main entry point for the BumBot application.
-    Initializes and starts the GUI interface or runs command-line utilities.
+    Persistent node process running a helper script in --daemon mode.
+    Each command is one JSON line on stdin answered by one JSON line on
+    stdout, so node and the script are only loaded once for many commands.
     """
+    
+    def __init__(self, node_path, script_path):
+        self.process = subprocess.Popen(
+            [node_path, script_path, "--daemon"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True
+        )
+    
+    def call(self, command, *args):
+        """
+        Run one helper command in the worker
+        
+        Returns:
+            tuple: (ok, output) where output is the list of lines the
+                   command printed
+        """
+        self.process.stdin.write(json.dumps({"cmd": command, "args": args}) + "\n")
+        self.process.stdin.flush()
+        line = self.process.stdout.readline()
+        if not line:
+            raise RuntimeError(f"Node worker exited with code {self.process.wait()}")
+        response = json.loads(line)
+        return response["ok"], response["output"]
+    
+    def close(self):
+        """Stop the worker; it exits once its stdin closes"""
+        self.process.stdin.close()
+        self.process.wait()
+
+# NodeWorker per helper script, started on first use
+_node_workers = {}
+
+def _node_worker(node_path, script_path):
+    """Get the persistent worker for script_path, starting it if needed"""
+    worker = _node_workers.get(script_path)
+    if worker is None or worker.process.poll() is not None:
+        worker = _node_workers[script_path] = NodeWorker(node_path, script_path)
+    return worker
+
+def _command_list(choices):
+    """argparse type for a comma-separated list of helper commands"""
+    def parse(value):
+        commands = value.split(",")
+        for command in commands:
+            if command not in choices:
+                import argparse
+                raise argparse.ArgumentTypeError(
+                    f"invalid choice: {command!r} (choose from {', '.join(choices)})"
+                )
+        return commands
+    return parse
+
+@dataclass(frozen=True, slots=True)
+class HelperConfig:
+    """
+    CLI subcommand wrapping a helper script
+    
+    Args:
+        interpreter (tuple): argv prefix the script runs under; "node" is
+                             resolved with _node()
+        script (str): Path to the helper script
+        flags (dict): Options forwarded to the script, option -> args attribute
+        commands (dict): Helper commands mapped to their default first
+                         parameter; empty if the script takes no command
+        params (tuple): args attributes of the positional parameters
+        worker (bool): Whether the script has a --daemon mode for --worker
+    """
+    interpreter: tuple
+    script: str
+    flags: dict
+    commands: dict = field(default_factory=dict)
+    params: tuple = ()
+    worker: bool = False
+
+HELPERS = {
+    "update_mcp_settings": HelperConfig(
+        interpreter=("npx", "ts-node"),  # Use npx ts-node instead of node
+        script=MCP_SETTINGS_SCRIPT,
+        flags={"--dry-run": "dry_run", "--interactive": "interactive", "--restore": "restore", "--verbose": "verbose"},
+    ),
+    "smart_contract_helper": HelperConfig(
+        interpreter=("node",),
+        script=SMART_CONTRACT_SCRIPT,
+        flags={"--yes": "yes"},
+        commands=SMART_CONTRACT_DEFAULTS,
+        params=("param1", "param2"),
+    ),
+    "crypto_trading_helper": HelperConfig(
+        interpreter=("node",),
+        script=CRYPTO_TRADING_SCRIPT,
+        flags={"--yes": "yes"},
+        commands=CRYPTO_TRADING_DEFAULTS,
+        params=("param1", "param2", "param3"),
+        worker=True,
+    ),
+}
+
+def _run(cfg, args):
+    """Run the helper script for a parsed CLI subcommand"""
+    logger.debug("Running %s", cfg.script)
+    interpreter = [_node() if part == "node" else part for part in cfg.interpreter]
+    flags = [option for option, attr in cfg.flags.items() if getattr(args, attr)]
+    
+    if not cfg.commands:
+        _exec([*interpreter, cfg.script, *flags])
+        return
+    
+    # Provide default parameters to avoid interactive prompts
+    trailing = [param for param in (getattr(args, attr) for attr in cfg.params[1:]) if param]
+    params = [
+        [helper_command, args.param1 or cfg.commands[helper_command], *trailing]
+        for helper_command in args.command
+    ]
+    
+    if cfg.worker and args.worker:
+        # One node process runs the whole batch, in order. It never
+        # prompts, so the forwarded flags are not passed along.
+        worker = _node_worker(interpreter[0], cfg.script)
+        failed = False
+        for command_params in params:
+            ok, output = worker.call(*command_params)
+            print("\n".join(output))
+            failed = failed or not ok
+        sys.exit(1 if failed else 0)
+    
+    _run_commands([[*interpreter, cfg.script, *command_params, *flags] for command_params in params])
+
+def _build_parser():
+    """Full argparse command line, used for help, usage errors and anything _fast_parse declines"""
+    import argparse
+    
     parser = argparse.ArgumentParser(description="Centralized MCP Server Management")
     subparsers = parser.add_subparsers(dest="module", required=True)
 
@@ -106,29 +245,111 @@ def main():
     mcp_parser.add_argument("--interactive", action="store_true", help="Confirm changes interactively before applying them")
     mcp_parser.add_argument("--restore", action="store_true", help="Restore the settings file from the last backup")
     mcp_parser.add_argument("--verbose", action="store_true", help="Log detailed information about each step")
-    mcp_parser.set_defaults(func=run_update_mcp_settings)
+    mcp_parser.set_defaults(cfg=HELPERS["update_mcp_settings"])
 
     # Subparser for smart_contract_helper
     sc_parser = subparsers.add_parser("smart_contract_helper", help="Run the Smart Contract Helper")
-    sc_parser.add_argument("command", choices=["generate", "test", "deploy"], help="Command to execute")
+    sc_parser.add_argument("command", type=_command_list(list(SMART_CONTRACT_DEFAULTS)),
+                           help="Command to execute; comma-separate several to run them concurrently")
     sc_parser.add_argument("param1", nargs="?", help="First parameter (e.g., contract name or network)")
     sc_parser.add_argument("param2", nargs="?", help="Second parameter (optional)")
     sc_parser.add_argument("--yes", action="store_true", help="Auto-confirm prompts")
-    sc_parser.set_defaults(func=run_smart_contract_helper)
+    sc_parser.set_defaults(cfg=HELPERS["smart_contract_helper"])
 
     # Subparser for crypto_trading_helper
     ct_parser = subparsers.add_parser("crypto_trading_helper", help="Run the Crypto Trading Helper")
-    ct_parser.add_argument("command", choices=["fetch", "trade", "analyze", "alert", "backtest"], help="Command to execute")
+    ct_parser.add_argument("command", type=_command_list(list(CRYPTO_TRADING_DEFAULTS)),
+                           help="Command to execute; comma-separate several to run them concurrently")
     ct_parser.add_argument("param1", nargs="?", help="First parameter (e.g., symbol or strategy)")
     ct_parser.add_argument("param2", nargs="?", help="Second parameter (e.g., price or side)")
     ct_parser.add_argument("param3", nargs="?", help="Third parameter (e.g., quantity)")
     ct_parser.add_argument("--yes", action="store_true", help="Auto-confirm prompts")
-    ct_parser.set_defaults(func=run_crypto_trading_helper)
+    ct_parser.add_argument("--worker", action="store_true",
+                           help="Run the commands in order in one persistent node process")
+    ct_parser.set_defaults(cfg=HELPERS["crypto_trading_helper"])
+    
+    return parser
+
+def _fast_parse(argv):
+    """
+    Parse the common CLI invocations without building the argparse tree
+    
+    Returns:
+        SimpleNamespace: The same attributes parse_args would produce, or
+                         None if argv needs the full parser (help, unknown
+                         or malformed arguments, invalid commands)
+    """
+    cfg = HELPERS.get(argv[0]) if argv else None
+    if cfg is None:
+        return None
+    flags = {**cfg.flags, **({"--worker": "worker"} if cfg.worker else {})}
+    positionals = ("command", *cfg.params) if cfg.commands else ()
+    
+    values = dict.fromkeys(flags.values(), False)
+    given = []
+    for token in argv[1:]:
+        if token in flags:
+            values[flags[token]] = True
+        elif token.startswith("-"):
+            return None
+        else:
+            given.append(token)
+    
+    if len(given) > len(positionals):
+        return None
+    values.update(zip(positionals, given + [None] * (len(positionals) - len(given))))
+    
+    # Helpers take a required, comma-separated command as the first positional
+    if cfg.commands:
+        if not given:
+            return None
+        values["command"] = given[0].split(",")
+        if not all(command in cfg.commands for command in values["command"]):
+            return None
+    
+    return SimpleNamespace(module=argv[0], cfg=cfg, **values)
+
+# Startup error dialog, built by _error_dialog on first use
+_error_box = None
+
+def _error_dialog():
+    """Critical "BumBot Error" dialog; callers fill in the text before exec()"""
+    global _error_box
+    if _error_box is None:
+        from PyQt6.QtWidgets import QMessageBox
+        _error_box = QMessageBox()
+        _error_box.setIcon(QMessageBox.Icon.Critical)
+        _error_box.setWindowTitle("BumBot Error")
+    return _error_box
 
-    args = parser.parse_args()
+def main():
+    """
+    Main entry point for the BumBot application.
+    Initializes and starts the GUI interface or runs command-line utilities.
+    """
+    args = _fast_parse(sys.argv[1:]) or _build_parser().parse_args()
     if args.module:
-        args.func(args)
+        _run(args.cfg, args)
     else:
+        _configure_logging()
+        
+        # Without a display Qt can only fail, after loading its platform
+        # plugins; stop before importing it. An explicit QT_QPA_PLATFORM
+        # (e.g. offscreen) doesn't need one.
+        if (sys.platform.startswith("linux")
+                and not (os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+                and not os.environ.get("QT_QPA_PLATFORM")):
+            logger.error("No display available; use a CLI subcommand")
+            sys.exit(2)
+        
+        # PyQt is only imported for the GUI so CLI subcommands don't pay for it
+        from PyQt6.QtWidgets import QApplication
+        from PyQt6.QtCore import QCoreApplication
+        
+        # Configure application settings
+        QCoreApplication.setOrganizationName("BumBot")
+        QCoreApplication.setApplicationName("BumBot Crypto Trading")
+        
         # Create application first
         app = QApplication(sys.argv)
         
@@ -144,32 +365,32 @@ def main():
             sys.exit(app.exec())
             
         except ImportError as e:
+            import traceback
             error_message = f"Import Error: {str(e)}\n\nPlease make sure all required packages are installed."
             logger.error(error_message)
-            logger.error(traceback.format_exc())
+            details = traceback.format_exc()
+            logger.error(details)
             
             # Show error message to user
-            msg = QMessageBox()
-            msg.setIcon(QMessageBox.Icon.Critical)
+            msg = _error_dialog()
             msg.setText("Failed to load BumBot application components")
             msg.setInformativeText(error_message)
-            msg.setWindowTitle("BumBot Error")
-            msg.setDetailedText(traceback.format_exc())
+            msg.setDetailedText(details)
             msg.exec()
             sys.exit(1)
             
         except Exception as e:
+            import traceback
             error_message = f"Unexpected Error: {str(e)}"
             logger.error(error_message)
-            logger.error(traceback.format_exc())
+            details = traceback.format_exc()
+            logger.error(details)
             
             # Show error message to user
-            msg = QMessageBox()
-            msg.setIcon(QMessageBox.Icon.Critical)
+            msg = _error_dialog()
             msg.setText("Failed to start BumBot application")
             msg.setInformativeText(error_message)
-            msg.setWindowTitle("BumBot Error")
-            msg.setDetailedText(traceback.format_exc())
+            msg.setDetailedText(details)
             msg.exec()
             sys.exit(1)
 
@@ -1,108 +1,330 @@
 #!/usr/bin/env python3
+import math
+import sys
 import time
+import json
 import logging
 import numpy as np
-import copy
+from collections.abc import Mapping
+from dataclasses import dataclass
+from operator import attrgetter
+from types import MappingProxyType
 from typing import Dict, List, Any, Optional, Tuple
 
+from models.advanced.capital_allocator_kernels import portfolio_variance as portfolio_variance_kernel
+from models.advanced.capital_allocator_kernels import portfolio_weights as portfolio_weights_kernel
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; without it summaries and history use the stdlib encoder
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Asset categories used to pick simulated volatility/correlation ranges
+CAT_STABLE = 0
+CAT_BTC = 1
+CAT_ETH = 2
+CAT_ALT = 3
+
+# One-sided 95% normal quantile for VaR, and daily-to-weekly/monthly
+# volatility scaling factors
+_Z95 = 1.6448536269514722
+_SQRT7 = math.sqrt(7)
+_SQRT30 = math.sqrt(30)
+
+def _dumps(obj: Any) -> bytes:
+    """Encode summary/history data as JSON bytes, with orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj).encode()
+
+def _summary_dict(summary: Mapping) -> Dict[str, Any]:
+    """Plain-dict copy of a read-only portfolio summary"""
+    result = dict(summary)
+    result["asset_breakdown"] = {asset: dict(fields) for asset, fields in summary["asset_breakdown"].items()}
+    return result
+
+def _classify_asset(asset: str) -> int:
+    """Categorize an asset by symbol: BTC, ETH, stablecoin or altcoin"""
+    if asset.endswith("BTC"):
+        return CAT_BTC
+    if asset.endswith("ETH"):
+        return CAT_ETH
+    if asset.endswith("USD") or asset.endswith("USDT") or asset.endswith("USDC"):
+        return CAT_STABLE
+    return CAT_ALT
+
+@dataclass(slots=True)
+class AssetRow:
+    """A portfolio holding"""
+    amount: float
+    weight: float  # target weight
+    last_updated: float
+
+# Reads every AssetRow field in one C-level call
+_ROW_FIELDS = attrgetter("amount", "weight", "last_updated")
+
+@dataclass(slots=True)
+class Allocation:
+    """An active allocation of capital to a strategy"""
+    amount: float
+    timestamp: float
+    parent_allocation: Optional[str] = None  # allocation this remainder was split from
+
+class PortfolioSummary(Mapping):
+    """
+    Portfolio summary that reads like the summary dict, but only builds
+    asset_breakdown from its snapshot of the portfolio when first accessed
+    """
+    __slots__ = ("assets", "total_value", "timestamp", "_asset_names", "_amounts",
+                 "_target_weights", "_last_updated", "_breakdown", "_keys")
+    _KEYS = ("assets", "total_value", "asset_breakdown", "timestamp")
+    
+    def __init__(self, asset_names: Tuple[str, ...], total_value: float, amounts: np.ndarray,
+                 target_weights: np.ndarray, last_updated: np.ndarray):
+        self.assets = len(asset_names)
+        self.total_value = total_value
+        self.timestamp = time.time_ns()  # nanoseconds since the epoch
+        self._asset_names = asset_names
+        self._amounts = amounts
+        self._target_weights = target_weights
+        self._last_updated = last_updated
+        self._breakdown: Optional[Mapping] = None
+        self._keys = self._KEYS
+        
+    @classmethod
+    def from_breakdown(cls, total_value: float, breakdown: Mapping,
+                       timestamp: Optional[int]) -> "PortfolioSummary":
+        """
+        Summary over an already built, read-only asset_breakdown; without a
+        timestamp (an empty portfolio) the summary has no timestamp key
+        """
+        summary = cls.__new__(cls)
+        summary.assets = len(breakdown)
+        summary.total_value = total_value
+        summary.timestamp = timestamp
+        summary._asset_names = tuple(breakdown)
+        summary._amounts = summary._target_weights = summary._last_updated = None
+        summary._breakdown = breakdown
+        summary._keys = cls._KEYS if timestamp is not None else cls._KEYS[:-1]
+        return summary
+        
+    @property
+    def asset_breakdown(self) -> Mapping:
+        """
+        Per-asset amount, current and target weight, built on first access;
+        read-only, since summaries are shared between callers
+        """
+        if self._breakdown is None:
+            _, weights = portfolio_weights_kernel(self._amounts)
+            self._breakdown = MappingProxyType({
+                asset: MappingProxyType({
+                    "amount": amount,
+                    "weight": weight,
+                    "target_weight": target_weight,
+                    "last_updated": last_updated
+                })
+                for asset, amount, weight, target_weight, last_updated in zip(
+                    self._asset_names, self._amounts.tolist(), weights.tolist(),
+                    self._target_weights.tolist(), self._last_updated.tolist())
+            })
+        return self._breakdown
+        
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._keys:
+            raise KeyError(key)
+        return getattr(self, key)
+        
+    def __iter__(self):
+        return iter(self._keys)
+        
+    def __len__(self) -> int:
+        return len(self._keys)
+        
+    def to_dict(self) -> Dict[str, Any]:
+        """Fully materialized, mutable copy of the summary, e.g. for JSON serialization"""
+        return _summary_dict(self)
+
+# Summary of an empty portfolio, shared read-only by every caller
+_EMPTY_SUMMARY = PortfolioSummary.from_breakdown(0, MappingProxyType({}), None)
+
+def _packed_index(i, j, n: int):
+    """
+    Offset of (i, j) in a row-major packed upper triangle of an n x n
+    symmetric matrix (diagonal included); works on ints or index arrays
+    """
+    lo = np.minimum(i, j)
+    hi = np.maximum(i, j)
+    return lo * n - lo * (lo - 1) // 2 + (hi - lo)
+
 class RiskModel:
     """Risk assessment and management model for portfolio allocation"""
     
     def __init__(self):
         """Initialize risk model"""
         self.volatility_cache = {}  # asset -> volatility data
-        self.correlation_matrix = {}  # asset pairs -> correlation
+        # Symmetric asset x asset correlations, stored as the packed upper
+        # triangle (see _packed_index); read through _corr/_correlation_block
+        self._corr_packed = np.empty(0)
+        self.asset_index = {}  # asset -> row/column of the correlation matrix
         self.risk_factors = {}  # asset -> risk factors
         self.last_update = 0
         self.update_interval = 3600  # 1 hour
-        
-    async def assess_portfolio_risk(self, portfolio: Dict[str, Any]) -> Dict[str, Any]:
+        self._asset_category: Dict[str, int] = {}  # asset -> CAT_* code
+        self._rng = np.random.default_rng()  # simulated market data source
+        
+    def _cat(self, asset: str) -> int:
+        """Category of an asset, classified on first sight and memoized"""
+        category = self._asset_category.get(asset)
+        if category is None:
+            category = self._asset_category[asset] = _classify_asset(asset)
+        return category
+        
+    def _corr(self, asset1: str, asset2: str) -> float:
+        """Correlation between two assets; assets without data are uncorrelated"""
+        i = self.asset_index.get(asset1)
+        j = self.asset_index.get(asset2)
+        if i is None or j is None:
+            return 1.0 if asset1 == asset2 else 0.0
+        return float(self._corr_packed[_packed_index(i, j, len(self.asset_index))])
+        
+    def _correlation_block(self, assets: List[str]) -> np.ndarray:
+        """
+        Dense correlation matrix for the given assets; assets without
+        correlation data are uncorrelated with the rest
+        """
+        correlations = np.eye(len(assets))
+        known = [i for i, asset in enumerate(assets) if asset in self.asset_index]
+        if known:
+            idx = np.array([self.asset_index[assets[i]] for i in known])
+            packed = _packed_index(idx[:, None], idx[None, :], len(self.asset_index))
+            correlations[np.ix_(known, known)] = self._corr_packed[packed]
+        return correlations
+        
+    async def assess_portfolio_risk(self, portfolio: Dict[str, Any], total_value: float = None) -> Dict[str, Any]:
         """
         Assess risk factors for a portfolio of assets
         
         Args:
-            portfolio: Current portfolio with assets and allocations
+            portfolio: Current portfolio of asset -> AssetRow or dict with "amount"
+            total_value: Sum of the portfolio amounts, if the caller already
+                         tracks it
             
         Returns:
             Risk assessment for portfolio assets
         """
-        # Check if update needed
-        current_time = time.time()
-        if current_time - self.last_update > self.update_interval:
-            await self._update_risk_factors(portfolio)
-            self.last_update = current_time
+        amounts = np.fromiter((item.amount if isinstance(item, AssetRow) else item.get("amount", 0)
+                               for item in portfolio.values()),
+                              dtype=float, count=len(portfolio))
+        return self._assess_portfolio_risk_sync(list(portfolio), amounts, total_value)
+        
+    def _assess_portfolio_risk_sync(self, assets: List[str], amounts: np.ndarray,
+                                    total_value: float = None) -> Dict[str, Any]:
+        """
+        Synchronous body of assess_portfolio_risk, for callers inside the model;
+        takes the portfolio as assets and their aligned amounts
+        """
+        # Refresh data for new or stale assets
+        self._update_risk_factors(assets)
+            
+        if total_value is None:
+            total_value = float(amounts.sum())
+            
+        # Calculate every asset's allocation percentage in one pass
+        if total_value > 0:
+            allocation_pcts = (amounts / total_value).tolist()
+        else:
+            allocation_pcts = [0.0] * len(assets)
             
         # Get risk assessment for each asset
         risk_assessment = {}
-        for asset, data in portfolio.items():
-            risk_assessment[asset] = await self._assess_asset_risk(asset, data, portfolio)
+        for asset, amount, allocation_pct in zip(assets, amounts.tolist(), allocation_pcts):
+            risk_assessment[asset] = self._assess_asset_risk(asset, amount, allocation_pct)
             
         # Calculate portfolio-level metrics
-        portfolio_risk = self._calculate_portfolio_risk(portfolio, risk_assessment)
+        portfolio_risk = self._calculate_portfolio_risk(assets, risk_assessment, total_value)
         
         # Add portfolio-level risk metrics
         risk_assessment["_portfolio"] = portfolio_risk
         
         return risk_assessment
         
-    async def _update_risk_factors(self, portfolio: Dict[str, Any]):
-        """Update volatility and correlation data for assets"""
+    def _update_risk_factors(self, assets: List[str]):
+        """Update volatility and correlation data for new or stale assets"""
         # In a real implementation, this would fetch current market data
         # and calculate actual volatility and correlations
         
-        # For development, use simulated values
-        assets = list(portfolio.keys())
-        
-        # Update individual asset volatility
-        for asset in assets:
-            # Simulate volatility (different ranges for different asset types)
-            if asset.endswith("BTC") or asset == "BTC":
-                volatility = np.random.uniform(0.03, 0.08)  # 3-8% daily volatility
-            elif asset.endswith("ETH") or asset == "ETH":
-                volatility = np.random.uniform(0.04, 0.09)  # 4-9% daily volatility
-            elif asset.endswith("USD") or asset.endswith("USDT") or asset.endswith("USDC"):
-                volatility = np.random.uniform(0.001, 0.005)  # 0.1-0.5% for stablecoins
-            else:
-                volatility = np.random.uniform(0.05, 0.15)  # 5-15% for altcoins
-                
+        # For development, use simulated values. Only assets that are new or
+        # whose data is older than update_interval are redrawn.
+        current_time = time.time()
+        new_assets = [asset for asset in assets if asset not in self.asset_index]
+        stale_assets = [asset for asset in assets if asset in self.asset_index
+                        and current_time - self.volatility_cache[asset]["timestamp"] > self.update_interval]
+        if not new_assets and not stale_assets:
+            return
+            
+        refresh = stale_assets + new_assets
+        
+        # Update individual asset volatility, drawing every asset at once
+        # from the daily range for its category (indexed by CAT_* code):
+        # 0.1-0.5% for stablecoins, 3-8% BTC, 4-9% ETH, 5-15% altcoins
+        categories = np.array([self._cat(asset) for asset in refresh], dtype=np.intp)
+        low = np.choose(categories, [0.001, 0.03, 0.04, 0.05])
+        high = np.choose(categories, [0.005, 0.08, 0.09, 0.15])
+        daily = self._rng.uniform(low, high)
+        weekly = daily * _SQRT7
+        monthly = daily * _SQRT30
+        
+        for asset, volatility, weekly_volatility, monthly_volatility in zip(
+                refresh, daily.tolist(), weekly.tolist(), monthly.tolist()):
             self.volatility_cache[asset] = {
                 "daily_volatility": volatility,
-                "weekly_volatility": volatility * np.sqrt(7),
-                "monthly_volatility": volatility * np.sqrt(30),
+                "weekly_volatility": weekly_volatility,
+                "monthly_volatility": monthly_volatility,
                 "timestamp": current_time
             }
             
-        # Update correlation matrix
-        for i, asset1 in enumerate(assets):
-            for j, asset2 in enumerate(assets[i:]):
-                if asset1 == asset2:
-                    correlation = 1.0
-                else:
-                    # Simulate correlation between assets
-                    # Stablecoins highly correlated with each other
-                    if (asset1.endswith("USD") or asset1.endswith("USDT") or asset1.endswith("USDC")) and \
-                       (asset2.endswith("USD") or asset2.endswith("USDT") or asset2.endswith("USDC")):
-                        correlation = np.random.uniform(0.9, 0.99)
-                    # BTC and ETH moderately correlated
-                    elif (asset1 == "BTC" and asset2 == "ETH") or (asset1 == "ETH" and asset2 == "BTC"):
-                        correlation = np.random.uniform(0.7, 0.9)
-                    # Other crypto moderately to highly correlated
-                    elif not (asset1.endswith("USD") or asset1.endswith("USDT") or asset1.endswith("USDC")) and \
-                         not (asset2.endswith("USD") or asset2.endswith("USDT") or asset2.endswith("USDC")):
-                        correlation = np.random.uniform(0.5, 0.9)
-                    # Crypto to stablecoin low to negative correlation
-                    else:
-                        correlation = np.random.uniform(-0.2, 0.2)
-                        
-                # Store in correlation matrix
-                pair_key = f"{asset1}:{asset2}"
-                reverse_pair_key = f"{asset2}:{asset1}"
-                self.correlation_matrix[pair_key] = correlation
-                self.correlation_matrix[reverse_pair_key] = correlation
-        
-    async def _assess_asset_risk(self, asset: str, data: Dict[str, Any], portfolio: Dict[str, Any]) -> Dict[str, Any]:
+        # New assets are appended after the known ones; the packed triangle
+        # is re-laid out for the larger size, keeping existing pairs
+        old_size = len(self.asset_index)
+        for asset in new_assets:
+            self.asset_index[asset] = len(self.asset_index)
+        size = len(self.asset_index)
+        rows, cols = np.triu_indices(size)
+        correlations = np.empty(len(rows))
+        known = cols < old_size
+        correlations[known] = self._corr_packed[_packed_index(rows[known], cols[known], old_size)]
+        
+        # Redraw every pair touching a refreshed asset, all at once, from the
+        # range for its pair of asset categories
+        refreshed = np.zeros(size, dtype=bool)
+        refreshed[[self.asset_index[asset] for asset in refresh]] = True
+        redraw = refreshed[rows] | refreshed[cols]
+        rows, cols = rows[redraw], cols[redraw]
+        all_categories = np.array([self._cat(asset) for asset in self.asset_index], dtype=np.intp)
+        cat1 = all_categories[rows]
+        cat2 = all_categories[cols]
+        stable1 = cat1 == CAT_STABLE
+        stable2 = cat2 == CAT_STABLE
+        btc_eth = ((cat1 == CAT_BTC) & (cat2 == CAT_ETH)) | ((cat1 == CAT_ETH) & (cat2 == CAT_BTC))
+        conditions = [
+            stable1 & stable2,  # Stablecoins highly correlated with each other
+            btc_eth,  # BTC and ETH moderately correlated
+            ~stable1 & ~stable2,  # Other crypto moderately to highly correlated
+        ]
+        # Anything else is crypto to stablecoin: low to negative correlation
+        low = np.select(conditions, [0.9, 0.7, 0.5], default=-0.2)
+        high = np.select(conditions, [0.99, 0.9, 0.9], default=0.2)
+        
+        drawn = self._rng.uniform(low, high)
+        drawn[rows == cols] = 1.0
+        correlations[redraw] = drawn
+        self._corr_packed = correlations
+        self.last_update = current_time
+        
+    def _assess_asset_risk(self, asset: str, amount: float, allocation_pct: float) -> Dict[str, Any]:
         """Assess risk for a specific asset in the portfolio"""
         # Get volatility data
         if asset in self.volatility_cache:
@@ -115,12 +337,8 @@ class RiskModel:
                 "monthly_volatility": 0.27
             }
             
-        # Calculate asset allocation percentage
-        total_portfolio_value = sum(item.get("amount", 0) for item in portfolio.values())
-        allocation_pct = data.get("amount", 0) / total_portfolio_value if total_portfolio_value > 0 else 0
-        
         # Calculate value at risk (VaR)
-        daily_var_95 = data.get("amount", 0) * volatility_data["daily_volatility"] * 1.645  # 95% confidence
+        daily_var_95 = amount * volatility_data["daily_volatility"] * _Z95  # 95% confidence
         
         # Calculate asset-specific risk factor
         # Higher volatility = higher risk
@@ -136,10 +354,10 @@ class RiskModel:
             "risk_factor": risk_factor
         }
         
-    def _calculate_portfolio_risk(self, portfolio: Dict[str, Any], risk_assessment: Dict[str, Any]) -> Dict[str, Any]:
+    def _calculate_portfolio_risk(self, assets: List[str], risk_assessment: Dict[str, Any],
+                                  total_value: float) -> Dict[str, Any]:
         """Calculate portfolio-level risk metrics"""
-        assets = [a for a in portfolio.keys()]
-        
+
         if not assets:
             return {
                 "portfolio_volatility": 0.0,
@@ -160,19 +378,14 @@ class RiskModel:
         weights = np.array(weights)
         volatilities = np.array(volatilities)
         
-        # Calculate portfolio volatility considering correlations
-        portfolio_variance = 0.0
-        for i, asset1 in enumerate(assets):
-            for j, asset2 in enumerate(assets):
-                pair_key = f"{asset1}:{asset2}"
-                correlation = self.correlation_matrix.get(pair_key, 0.0 if asset1 != asset2 else 1.0)
-                portfolio_variance += weights[i] * weights[j] * volatilities[i] * volatilities[j] * correlation
+        # Calculate portfolio volatility considering correlations: w' (C * vv') w.
+        correlations = self._correlation_block(assets)
+        portfolio_variance = float(portfolio_variance_kernel(weights, volatilities, correlations))
                 
         portfolio_volatility = np.sqrt(portfolio_variance)
         
         # Calculate portfolio VaR (95% confidence)
-        total_value = sum(item.get("amount", 0) for item in portfolio.values())
-        portfolio_var_95 = total_value * portfolio_volatility * 1.645
+        portfolio_var_95 = total_value * portfolio_volatility * _Z95
         
         # Calculate diversification score
         # Perfect diversification would reduce portfolio volatility significantly
@@ -201,8 +414,17 @@ class OpportunityEvaluator:
         self.opportunity_scores = {}
         self.last_evaluation = {}
         self.evaluation_validity = 1800  # 30 minutes
+        self._asset_category: Dict[str, int] = {}  # asset -> CAT_* code
+        self._rng = np.random.default_rng()  # simulated market data source
+        
+    def _cat(self, asset: str) -> int:
+        """Category of an asset, classified on first sight and memoized"""
+        category = self._asset_category.get(asset)
+        if category is None:
+            category = self._asset_category[asset] = _classify_asset(asset)
+        return category
         
-    async def evaluate_all_assets(self, assets: List[str]) -> Dict[str, float]:
+    def evaluate_all_assets(self, assets: List[str]) -> Dict[str, float]:
         """
         Evaluate opportunity scores for a list of assets
         
@@ -214,6 +436,7 @@ class OpportunityEvaluator:
         """
         current_time = time.time()
         scores = {}
+        stale = []
         
         for asset in assets:
             # Check if we have a recent evaluation
@@ -222,25 +445,28 @@ class OpportunityEvaluator:
                 if current_time - last_time < self.evaluation_validity:
                     scores[asset] = score
                     continue
-                    
-            # Perform new evaluation
-            scores[asset] = await self._evaluate_asset_opportunity(asset)
-            
-            # Store result
-            self.last_evaluation[asset] = (current_time, scores[asset])
-            self.opportunity_scores[asset] = scores[asset]
+            stale.append(asset)
             
+        # Perform new evaluations in one batch
+        if stale:
+            for asset, score in zip(stale, self._evaluate_asset_opportunities(stale)):
+                scores[asset] = score
+                
+                # Store result
+                self.last_evaluation[asset] = (current_time, score)
+                self.opportunity_scores[asset] = score
+                
         return scores
         
-    async def _evaluate_asset_opportunity(self, asset: str) -> float:
+    def _evaluate_asset_opportunities(self, assets: List[str]) -> List[float]:
         """
-        Evaluate opportunity score for a single asset
+        Evaluate opportunity scores for several assets at once
         
         Args:
-            asset: Asset to evaluate
+            assets: Assets to evaluate
             
         Returns:
-            Opportunity score (higher = better opportunity)
+            Opportunity scores in the order of assets (higher = better opportunity)
         """
         # In a real implementation, this would analyze:
         # 1. Technical indicators
@@ -251,26 +477,23 @@ class OpportunityEvaluator:
         
         # For development, use simulated values
         try:
-            # Base opportunity score
-            base_score = np.random.uniform(0.2, 0.8)
-            
-            # Adjust based on asset type
-            if asset.endswith("BTC") or asset == "BTC":
-                # Bitcoin typically has good opportunities
-                base_score *= np.random.uniform(1.0, 1.3)
-            elif asset.endswith("ETH") or asset == "ETH":
-                # Ethereum also good
-                base_score *= np.random.uniform(1.0, 1.2)
-            elif asset.endswith("USD") or asset.endswith("USDT") or asset.endswith("USDC"):
-                # Stablecoins less opportunity
-                base_score *= np.random.uniform(0.1, 0.3)
-                
+            # Base opportunity scores
+            base_scores = self._rng.uniform(0.2, 0.8, size=len(assets))
+            
+            # Adjust based on asset type (indexed by CAT_* code): stablecoins
+            # less opportunity, Bitcoin typically good, Ethereum also good,
+            # altcoins unchanged
+            categories = np.array([self._cat(asset) for asset in assets], dtype=np.intp)
+            low = np.choose(categories, [0.1, 1.0, 1.0, 1.0])
+            high = np.choose(categories, [0.3, 1.3, 1.2, 1.0])
+            scores = base_scores * self._rng.uniform(low, high)
+            
             # Cap at 0-1 range
-            return max(0.0, min(1.0, base_score))
+            return np.clip(scores, 0.0, 1.0).tolist()
             
         except Exception as e:
-            logger.error(f"Error evaluating opportunity for {asset}: {str(e)}")
-            return 0.5  # Default middle score on error
+            logger.error(f"Error evaluating opportunities for {len(assets)} assets: {str(e)}")
+            return [0.5] * len(assets)  # Default middle score on error
 
 
 class CapitalAllocator:
@@ -288,19 +511,95 @@ class CapitalAllocator:
         self.risk_model = RiskModel()
         self.opportunity_evaluator = OpportunityEvaluator()
         self.rebalance_threshold = 0.1  # 10% threshold for rebalancing
-        self.allocation_history = []
         self.max_history_records = 1000
         
+        # Allocation history as a fixed-size ring of parallel columns; the
+        # oldest entries are overwritten. Action types are stored as codes
+        # into _hist_type_names. Read it through history_view().
+        self._hist_ts = np.empty(self.max_history_records, dtype=np.int64)  # time.time_ns()
+        self._hist_type = [0] * self.max_history_records
+        self._hist_data: List[Optional[Dict[str, Any]]] = [None] * self.max_history_records
+        self._hist_head = 0  # next slot to write
+        self._hist_len = 0
+        self._hist_type_codes: Dict[str, int] = {}
+        self._hist_type_names: List[str] = []
+        
+        # Sum of all portfolio amounts; every amount change goes through
+        # _set_amount so this stays current without re-summing
+        self._total_value = 0.0
+        self._current_weights: Optional[Dict[str, float]] = None  # cleared whenever an amount changes
+        
+        # Column store mirroring self.portfolio: one slot per asset in
+        # _asset_index, with the first len(_asset_index) entries of each
+        # array in use. self.portfolio stays as the per-asset dict view;
+        # writes go through _add_asset/_set_amount/_set_weight/_touch.
+        self._asset_index: Dict[str, int] = {}
+        self._amounts = np.zeros(0)
+        self._target_weights = np.zeros(0)
+        self._last_updated = np.zeros(0)
+        
+        # Bumped by every portfolio write; get_portfolio_summary reuses its
+        # last result, timestamp included, while the version is unchanged
+        self._portfolio_version = 0
+        self._summary_cache: Tuple[int, Optional[PortfolioSummary]] = (-1, None)
+        
+        # Last calculate_optimal_weights result as (timestamp, portfolio
+        # assets, weights); reused for a short while unless amounts change
+        self._optimal_weights_cache: Tuple[float, frozenset, Dict[str, float]] = (0.0, frozenset(), {})
+        self.optimal_weights_ttl = 30  # seconds
+        
         # Initialize portfolio if provided
         if initial_capital:
             for asset, amount in initial_capital.items():
-                self.portfolio[asset] = {
-                    "amount": amount,
-                    "weight": 0.0,  # Will be calculated in initialize_portfolio
-                    "last_updated": time.time()
-                }
+                self._add_asset(asset)  # Weight will be calculated in initialize_portfolio
+                self._set_amount(asset, amount)
                 
-    async def initialize_portfolio(self, assets: List[str], initial_allocations: Dict[str, float] = None):
+    def _add_asset(self, asset: str, weight: float = 0.0):
+        """Add an asset with nothing held to the portfolio, growing the column store as needed"""
+        i = len(self._asset_index)
+        if i == len(self._amounts):
+            capacity = max(8, 2 * i)
+            self._amounts = np.resize(self._amounts, capacity)
+            self._target_weights = np.resize(self._target_weights, capacity)
+            self._last_updated = np.resize(self._last_updated, capacity)
+        now = time.time()
+        self._asset_index[asset] = i
+        self._amounts[i] = 0.0
+        self._target_weights[i] = weight
+        self._last_updated[i] = now
+        self.portfolio[asset] = AssetRow(0.0, weight, now)
+        self._current_weights = None
+        self._portfolio_version += 1
+        
+    def _set_amount(self, asset: str, amount: float):
+        """Set the amount held of a portfolio asset, keeping the running total in step"""
+        row = self.portfolio[asset]
+        self._total_value += amount - row.amount
+        row.amount = amount
+        self._amounts[self._asset_index[asset]] = amount
+        self._current_weights = None
+        self._optimal_weights_cache = (0.0, frozenset(), {})
+        self._portfolio_version += 1
+        
+    def _rebuild_total(self):
+        """Re-sum the running total from scratch, dropping drift after bulk updates"""
+        self._total_value = math.fsum(self._amounts[:len(self._asset_index)].tolist())
+        self._portfolio_version += 1
+        
+    def _set_weight(self, asset: str, weight: float):
+        """Set the target weight of a portfolio asset"""
+        self.portfolio[asset].weight = weight
+        self._target_weights[self._asset_index[asset]] = weight
+        self._portfolio_version += 1
+        
+    def _touch(self, asset: str):
+        """Mark a portfolio asset as updated now"""
+        now = time.time()
+        self.portfolio[asset].last_updated = now
+        self._last_updated[self._asset_index[asset]] = now
+        self._portfolio_version += 1
+        
+    def initialize_portfolio(self, assets: List[str], initial_allocations: Dict[str, float] = None):
         """
         Initialize portfolio with assets and allocations
         
@@ -316,12 +615,13 @@ class CapitalAllocator:
             allocation = initial_allocations.get(asset, 0) if initial_allocations else 0
             weight = allocation / total if total > 0 else 1.0 / len(assets)
             
-            self.portfolio[asset] = {
-                "amount": allocation,
-                "weight": weight,
-                "last_updated": time.time()
-            }
+            if asset not in self.portfolio:
+                self._add_asset(asset)
+            self._set_weight(asset, weight)
+            self._touch(asset)
+            self._set_amount(asset, allocation)
             
+        self._rebuild_total()
         logger.info(f"Initialized portfolio with {len(assets)} assets")
         
     async def evaluate_rebalance_need(self) -> bool:
@@ -332,36 +632,40 @@ class CapitalAllocator:
             True if rebalancing is needed, False otherwise
         """
         # Get current weights
-        current_weights = await self._get_current_weights()
+        current_weights = self._get_current_weights()
         
         # Calculate target weights
-        target_weights = await self.calculate_optimal_weights()
+        target_weights = self.calculate_optimal_weights()
         
         # Calculate total weight deviation
         total_deviation = 0.0
-        for asset in set(current_weights.keys()) | set(target_weights.keys()):
+        for asset in current_weights.keys() | target_weights.keys():
             current = current_weights.get(asset, 0.0)
             target = target_weights.get(asset, 0.0)
             deviation = abs(current - target)
             total_deviation += deviation
             
-        logger.debug(f"Portfolio weight deviation: {total_deviation:.4f}, threshold: {self.rebalance_threshold:.4f}")
+        logger.debug("Portfolio weight deviation: %.4f, threshold: %.4f", total_deviation, self.rebalance_threshold)
         
         # Need rebalancing if deviation exceeds threshold
         return total_deviation > self.rebalance_threshold
         
-    async def _get_current_weights(self) -> Dict[str, float]:
-        """Get current portfolio weights"""
+    def _get_current_weights(self) -> Dict[str, float]:
+        """Get current portfolio weights, reused until an amount changes"""
+        if self._current_weights is not None:
+            return self._current_weights
+            
         weights = {}
-        total_value = sum(data.get("amount", 0) for data in self.portfolio.values())
+        total_value = self._total_value
         
         if total_value > 0:
-            for asset, data in self.portfolio.items():
-                weights[asset] = data.get("amount", 0) / total_value
+            _, amount_weights = portfolio_weights_kernel(self._amounts[:len(self._asset_index)])
+            weights = dict(zip(self._asset_index, amount_weights.tolist()))
                 
+        self._current_weights = weights
         return weights
         
-    async def calculate_optimal_weights(self) -> Dict[str, float]:
+    def calculate_optimal_weights(self) -> Dict[str, float]:
         """
         Calculate optimal asset weights based on opportunities and risk
         
@@ -371,13 +675,21 @@ class CapitalAllocator:
         if not self.portfolio:
             return {}
             
+        # Reuse a recent result for the same set of assets
+        cached_at, cached_assets, cached_weights = self._optimal_weights_cache
+        assets = frozenset(self.portfolio)
+        if time.time() - cached_at < self.optimal_weights_ttl and assets == cached_assets:
+            return dict(cached_weights)
+            
         # Get opportunity scores for each asset
-        opportunity_scores = await self.opportunity_evaluator.evaluate_all_assets(
+        opportunity_scores = self.opportunity_evaluator.evaluate_all_assets(
             list(self.portfolio.keys())
         )
         
         # Get risk assessment
-        risk_assessment = await self.risk_model.assess_portfolio_risk(self.portfolio)
+        risk_assessment = self.risk_model._assess_portfolio_risk_sync(
+            list(self._asset_index), self._amounts[:len(self._asset_index)], self._total_value
+        )
         
         # Calculate base weights from opportunity scores
         total_score = sum(opportunity_scores.values())
@@ -410,9 +722,10 @@ class CapitalAllocator:
             for asset, weight in adjusted_weights.items():
                 normalized_weights[asset] = weight / total_adjusted
                 
-        logger.debug(f"Calculated optimal weights for {len(normalized_weights)} assets")
+        logger.debug("Calculated optimal weights for %d assets", len(normalized_weights))
         
-        return normalized_weights
+        self._optimal_weights_cache = (time.time(), assets, normalized_weights)
+        return dict(normalized_weights)
         
     async def rebalance_portfolio(self) -> Dict[str, Any]:
         """
@@ -422,49 +735,46 @@ class CapitalAllocator:
             Rebalance result with trades needed
         """
         # Get current and target weights
-        current_weights = await self._get_current_weights()
-        target_weights = await self.calculate_optimal_weights()
+        current_weights = self._get_current_weights()
+        target_weights = self.calculate_optimal_weights()
         
         # Calculate trades needed
         trades = []
-        total_value = sum(data.get("amount", 0) for data in self.portfolio.values())
-        
-        for asset in set(current_weights.keys()) | set(target_weights.keys()):
-            current = current_weights.get(asset, 0.0)
-            target = target_weights.get(asset, 0.0)
-            current_amount = self.portfolio.get(asset, {}).get("amount", 0.0)
-            target_amount = total_value * target
-            
-            # Only trade if difference is significant
-            if abs(target_amount - current_amount) / total_value > 0.01:  # 1% minimum change
-                trade = {
-                    "asset": asset,
-                    "current_weight": current,
-                    "target_weight": target,
-                    "current_amount": current_amount,
-                    "target_amount": target_amount,
-                    "trade_amount": target_amount - current_amount
-                }
-                trades.append(trade)
+        total_value = self._total_value
+        all_assets = list(current_weights.keys() | target_weights.keys())
+        n = len(all_assets)
+        current = np.fromiter((current_weights.get(a, 0.0) for a in all_assets), dtype=float, count=n)
+        target = np.fromiter((target_weights.get(a, 0.0) for a in all_assets), dtype=float, count=n)
+        current_amounts = np.fromiter((self.portfolio[a].amount if a in self.portfolio else 0.0 for a in all_assets),
+                                      dtype=float, count=n)
+        target_amounts = total_value * target
+        trade_amounts = target_amounts - current_amounts
+        
+        # Only trade if difference is significant
+        significant = np.abs(trade_amounts) > 0.01 * total_value  # 1% minimum change
+        for i in np.flatnonzero(significant).tolist():
+            trades.append({
+                "asset": all_assets[i],
+                "current_weight": float(current[i]),
+                "target_weight": float(target[i]),
+                "current_amount": float(current_amounts[i]),
+                "target_amount": float(target_amounts[i]),
+                "trade_amount": float(trade_amounts[i])
+            })
                 
         # Update portfolio with new target weights
         for asset, weight in target_weights.items():
             if asset in self.portfolio:
-                self.portfolio[asset]["weight"] = weight
+                self._set_weight(asset, weight)
             else:
-                # New asset
-                self.portfolio[asset] = {
-                    "amount": 0.0,  # Will be updated after trades
-                    "weight": weight,
-                    "last_updated": time.time()
-                }
+                # New asset; amount will be updated after trades
+                self._add_asset(asset, weight)
                 
         rebalance_result = {
             "timestamp": time.time(),
             "total_value": total_value,
             "trades_needed": trades,
-            "weight_deviation": sum(abs(current_weights.get(a, 0.0) - target_weights.get(a, 0.0)) 
-                                 for a in set(current_weights.keys()) | set(target_weights.keys()))
+            "weight_deviation": float(np.abs(current - target).sum())
         }
         
         # Add to history
@@ -474,7 +784,7 @@ class CapitalAllocator:
         
         return rebalance_result
         
-    async def allocate_to_strategy(self, strategy_id: str, asset: str, amount: float) -> Dict[str, Any]:
+    def allocate_to_strategy(self, strategy_id: str, asset: str, amount: float) -> Dict[str, Any]:
         """
         Allocate capital from portfolio to a specific strategy
         
@@ -490,13 +800,13 @@ class CapitalAllocator:
             logger.warning(f"Cannot allocate {asset} - not in portfolio")
             return {"success": False, "error": f"Asset {asset} not in portfolio"}
             
-        if self.portfolio[asset]["amount"] < amount:
-            logger.warning(f"Insufficient {asset} balance for allocation: {self.portfolio[asset]['amount']} < {amount}")
+        if self.portfolio[asset].amount < amount:
+            logger.warning(f"Insufficient {asset} balance for allocation: {self.portfolio[asset].amount} < {amount}")
             return {"success": False, "error": f"Insufficient {asset} balance"}
             
         # Update portfolio
-        self.portfolio[asset]["amount"] -= amount
-        self.portfolio[asset]["last_updated"] = time.time()
+        self._set_amount(asset, self.portfolio[asset].amount - amount)
+        self._touch(asset)
         
         # Record allocation to strategy
         if strategy_id not in self.strategy_performance:
@@ -504,6 +814,8 @@ class CapitalAllocator:
                 "allocations": {},
                 "returns": {},
                 "active_allocations": {},
+                "active_total": {},  # asset -> sum of its active allocations
+                "roi": {},
                 "start_time": time.time()
             }
             
@@ -518,10 +830,9 @@ class CapitalAllocator:
             self.strategy_performance[strategy_id]["active_allocations"][asset] = {}
             
         self.strategy_performance[strategy_id]["allocations"][asset] += amount
-        self.strategy_performance[strategy_id]["active_allocations"][asset][allocation_id] = {
-            "amount": amount,
-            "timestamp": time.time()
-        }
+        self.strategy_performance[strategy_id]["active_allocations"][asset][allocation_id] = Allocation(amount, time.time())
+        active_total = self.strategy_performance[strategy_id]["active_total"]
+        active_total[asset] = active_total.get(asset, 0) + amount
         
         allocation_result = {
             "success": True,
@@ -539,7 +850,7 @@ class CapitalAllocator:
         
         return allocation_result
         
-    async def record_strategy_return(self, strategy_id: str, allocation_id: str, 
+    def record_strategy_return(self, strategy_id: str, allocation_id: str, 
                                     asset: str, amount: float, 
                                     profit: float) -> Dict[str, Any]:
         """
@@ -561,14 +872,10 @@ class CapitalAllocator:
             
         # Update portfolio with returned amount
         if asset not in self.portfolio:
-            self.portfolio[asset] = {
-                "amount": 0,
-                "weight": 0,
-                "last_updated": time.time()
-            }
+            self._add_asset(asset)
             
-        self.portfolio[asset]["amount"] += amount
-        self.portfolio[asset]["last_updated"] = time.time()
+        self._set_amount(asset, self.portfolio[asset].amount + amount)
+        self._touch(asset)
         
         # Record return in strategy performance
         if asset not in self.strategy_performance[strategy_id]["returns"]:
@@ -578,9 +885,11 @@ class CapitalAllocator:
         
         # Remove from active allocations if provided
         active_allocations = self.strategy_performance[strategy_id]["active_allocations"]
+        active_total = self.strategy_performance[strategy_id]["active_total"]
         if asset in active_allocations and allocation_id in active_allocations[asset]:
-            original_amount = active_allocations[asset][allocation_id]["amount"]
+            original_amount = active_allocations[asset][allocation_id].amount
             del active_allocations[asset][allocation_id]
+            active_total[asset] -= original_amount
             
             # If this is returning less than allocated, it's a partial return
             is_partial = amount < original_amount
@@ -589,11 +898,10 @@ class CapitalAllocator:
             if is_partial:
                 remainder = original_amount - amount
                 new_allocation_id = f"{allocation_id}_remainder"
-                active_allocations[asset][new_allocation_id] = {
-                    "amount": remainder,
-                    "timestamp": time.time(),
-                    "parent_allocation": allocation_id
-                }
+                active_allocations[asset][new_allocation_id] = Allocation(
+                    remainder, time.time(), parent_allocation=allocation_id
+                )
+                active_total[asset] += remainder
         
         # Update strategy ROI
         allocated = self.strategy_performance[strategy_id]["allocations"].get(asset, 0)
@@ -603,9 +911,6 @@ class CapitalAllocator:
             roi = profit / allocated
             
             # Update strategy performance metrics
-            if "roi" not in self.strategy_performance[strategy_id]:
-                self.strategy_performance[strategy_id]["roi"] = {}
-                
             self.strategy_performance[strategy_id]["roi"][asset] = roi
             
         return_result = {
@@ -662,17 +967,16 @@ class CapitalAllocator:
         perf = self.strategy_performance[strategy_id]
         
         # Calculate totals
-        total_allocated = sum(amount for asset, amount in perf.get("allocations", {}).items())
-        total_active = sum(sum(alloc["amount"] for alloc in asset_allocs.values()) 
-                         for asset, asset_allocs in perf.get("active_allocations", {}).items())
+        total_allocated = sum(perf["allocations"].values())
+        total_active = sum(perf["active_total"].values())
         total_returned = total_allocated - total_active
-        total_profit = sum(amount for asset, amount in perf.get("returns", {}).items())
+        total_profit = sum(perf["returns"].values())
         
         # Calculate ROI
         overall_roi = total_profit / total_allocated if total_allocated > 0 else 0
         
         # Other metrics
-        duration = time.time() - perf.get("start_time", time.time())
+        duration = time.time() - perf["start_time"]
         annual_roi = overall_roi * (86400 * 365) / duration if duration > 0 else 0
         
         return {
@@ -687,11 +991,11 @@ class CapitalAllocator:
             "asset_breakdown": {
                 asset: {
                     "allocated": amount,
-                    "active": sum(alloc["amount"] for alloc in perf["active_allocations"].get(asset, {}).values()),
+                    "active": perf["active_total"].get(asset, 0.0),
                     "profit": perf["returns"].get(asset, 0),
-                    "roi": perf["roi"].get(asset, 0) if asset in perf.get("roi", {}) else None
+                    "roi": perf["roi"].get(asset)
                 }
-                for asset, amount in perf.get("allocations", {}).items()
+                for asset, amount in perf["allocations"].items()
             }
         }
         
@@ -703,15 +1007,13 @@ class CapitalAllocator:
         
         for strategy_id, perf in self.strategy_performance.items():
             # Sum allocations
-            total_allocated += sum(amount for asset, amount in perf.get("allocations", {}).items())
+            total_allocated += sum(perf["allocations"].values())
             
             # Sum active allocations
-            strategy_active = sum(sum(alloc["amount"] for alloc in asset_allocs.values()) 
-                               for asset, asset_allocs in perf.get("active_allocations", {}).items())
-            total_active += strategy_active
+            total_active += sum(perf["active_total"].values())
             
             # Sum profits
-            total_profit += sum(amount for asset, amount in perf.get("returns", {}).items())
+            total_profit += sum(perf["returns"].values())
         
         # Calculate overall metrics
         total_returned = total_allocated - total_active
@@ -728,51 +1030,88 @@ class CapitalAllocator:
         
     def _add_to_history(self, action_type: str, data: Dict[str, Any]):
         """Add an entry to allocation history"""
-        self.allocation_history.append({
-            "type": action_type,
-            "data": data,
-            "timestamp": time.time()
-        })
+        code = self._hist_type_codes.get(action_type)
+        if code is None:
+            # First sighting of this action type; keep one canonical string
+            action_type = sys.intern(action_type)
+            code = self._hist_type_codes[action_type] = len(self._hist_type_names)
+            self._hist_type_names.append(action_type)
+            
+        i = self._hist_head
+        self._hist_type[i] = code
+        self._hist_data[i] = data
+        self._hist_ts[i] = time.time_ns()
+        self._hist_head = (i + 1) % self.max_history_records
+        self._hist_len = min(self._hist_len + 1, self.max_history_records)
+        
+    def history_view(self) -> List[Dict[str, Any]]:
+        """
+        Get allocation history, oldest first
+        
+        Returns:
+            List of history entries with type, data and timestamp
+            (integer nanoseconds since the epoch)
+        """
+        capacity = self.max_history_records
+        start = (self._hist_head - self._hist_len) % capacity
+        names = self._hist_type_names
+        return [
+            {
+                "type": names[self._hist_type[i]],
+                "data": self._hist_data[i],
+                "timestamp": int(self._hist_ts[i])
+            }
+            for i in ((start + k) % capacity for k in range(self._hist_len))
+        ]
         
-        # Trim history if too long
-        if len(self.allocation_history) > self.max_history_records:
-            self.allocation_history = self.allocation_history[-self.max_history_records:]
+    @property
+    def allocation_history(self) -> List[Dict[str, Any]]:
+        """Allocation history as a list of entries, oldest first"""
+        return self.history_view()
             
-    def get_portfolio_summary(self) -> Dict[str, Any]:
+    def get_portfolio_summary(self) -> PortfolioSummary:
         """
         Get summary of current portfolio
         
         Returns:
-            Portfolio summary
+            Read-only portfolio summary, shared until the portfolio changes;
+            asset_breakdown is built only if read and the timestamp is in
+            nanoseconds. Use dict(...) on the parts that need mutating.
         """
         if not self.portfolio:
-            return {
-                "assets": 0,
-                "total_value": 0,
-                "asset_breakdown": {}
-            }
+            return _EMPTY_SUMMARY
+            
+        version, summary = self._summary_cache
+        if version == self._portfolio_version:
+            return summary
+            
+        if len(self.portfolio) == 1:
+            # A single asset is the whole portfolio; no arrays to snapshot
+            asset, row = next(iter(self.portfolio.items()))
+            amount, target_weight, last_updated = _ROW_FIELDS(row)
+            summary = PortfolioSummary.from_breakdown(amount, MappingProxyType({
+                asset: MappingProxyType({
+                    "amount": amount,
+                    "weight": 1.0 if amount > 0 else 0.0,
+                    "target_weight": target_weight,
+                    "last_updated": last_updated
+                })
+            }), time.time_ns())
+        else:
+            # Snapshot the column store; the breakdown is built from it lazily
+            n = len(self._asset_index)
+            summary = PortfolioSummary(
+                tuple(self._asset_index), self._total_value, self._amounts[:n].copy(),
+                self._target_weights[:n].copy(), self._last_updated[:n].copy()
+            )
             
-        total_value = sum(data.get("amount", 0) for data in self.portfolio.values())
+        self._summary_cache = (self._portfolio_version, summary)
+        return summary
         
-        # Calculate current weights
-        current_weights = {}
-        for asset, data in self.portfolio.items():
-            if total_value > 0:
-                current_weights[asset] = data.get("amount", 0) / total_value
-            else:
-                current_weights[asset] = 0
-                
-        return {
-            "assets": len(self.portfolio),
-            "total_value": total_value,
-            "asset_breakdown": {
-                asset: {
-                    "amount": data.get("amount", 0),
-                    "weight": current_weights.get(asset, 0),
-                    "target_weight": data.get("weight", 0),
-                    "last_updated": data.get("last_updated", 0)
-                }
-                for asset, data in self.portfolio.items()
-            },
-            "timestamp": time.time()
-        }
+    def portfolio_summary_json(self) -> bytes:
+        """Portfolio summary encoded as JSON, for API and log sinks"""
+        return _dumps(self.get_portfolio_summary().to_dict())
+        
+    def history_json(self) -> bytes:
+        """Allocation history encoded as JSON, oldest entry first"""
+        return _dumps(self.history_view())
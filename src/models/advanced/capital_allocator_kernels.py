@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; without it the kernels fall back to NumPy
+    njit = None
+
+def _portfolio_variance_loops(weights: np.ndarray, volatilities: np.ndarray, correlations: np.ndarray) -> float:
+    """Portfolio variance as explicit loops, compiled by Numba"""
+    variance = 0.0
+    n = weights.shape[0]
+    for i in range(n):
+        scaled_i = weights[i] * volatilities[i]
+        for j in range(n):
+            variance += scaled_i * weights[j] * volatilities[j] * correlations[i, j]
+    return variance
+
+def _portfolio_variance_numpy(weights: np.ndarray, volatilities: np.ndarray, correlations: np.ndarray) -> float:
+    """Portfolio variance with NumPy, used when Numba is unavailable"""
+    scaled = weights * volatilities
+    return float(scaled @ correlations @ scaled)
+
+# portfolio_variance(weights, volatilities, correlations) -> w' (C * vv') w.
+# For the small matrices used here, loops compiled by Numba beat NumPy,
+# whose per-call overhead and temporaries dominate; cache=True keeps the
+# compiled kernel on disk between runs.
+if njit is not None:
+    portfolio_variance = njit(cache=True, fastmath=True)(_portfolio_variance_loops)
+else:
+    portfolio_variance = _portfolio_variance_numpy
+
+def _portfolio_weights_loops(amounts: np.ndarray):
+    """Total and weights of a portfolio as explicit loops, compiled by Numba"""
+    total = 0.0
+    for i in range(amounts.size):
+        total += amounts[i]
+    weights = np.zeros_like(amounts)
+    if total > 0:
+        inv_total = 1.0 / total
+        for i in range(amounts.size):
+            weights[i] = amounts[i] * inv_total
+    return total, weights
+
+def _portfolio_weights_numpy(amounts: np.ndarray):
+    """Total and weights of a portfolio with NumPy, used when Numba is unavailable"""
+    total = float(amounts.sum())
+    if total > 0:
+        return total, amounts * (1.0 / total)
+    return total, np.zeros_like(amounts)
+
+# portfolio_weights(amounts) -> (total, amounts / total), zero weights for
+# an empty or zero-valued portfolio. Compiled, the sum and the scaling are
+# tight loops over the contiguous amounts column.
+if njit is not None:
+    portfolio_weights = njit(cache=True, fastmath=True)(_portfolio_weights_loops)
+else:
+    portfolio_weights = _portfolio_weights_numpy
@@ -3,12 +3,109 @@ import asyncio
 import time
 import logging
 import networkx as nx
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Awaitable, Callable, Dict, Iterable, List, Any, Optional, Tuple
 import numpy as np
 import uuid
+from dataclasses import dataclass
+from models.advanced.cross_protocol_arbitrage_kernels import bf_relax
 
 logger = logging.getLogger(__name__)
 
+# Edge action codes for EdgeArrays.kind
+ACTION_BUY = 0
+ACTION_SELL = 1
+ACTION_TRANSFER = 2
+ACTION_UNKNOWN = -1
+_ACTION_KINDS = {"buy": ACTION_BUY, "sell": ACTION_SELL, "transfer": ACTION_TRANSFER}
+
+# Graph nodes are (connector id << 16) | asset id, fitting in a uint32
+_ASSET_BITS = 16
+_ASSET_MASK = (1 << _ASSET_BITS) - 1
+_CONN_MASK = (1 << (32 - _ASSET_BITS)) - 1
+_UNKNOWN_NODE = -1  # Lookup result for names never added to the graph
+
+@dataclass(slots=True)
+class EdgeArrays:
+    """Opportunity graph edges as parallel arrays, indexed by edge id"""
+    node_ids: np.ndarray  # dense node index -> node id
+    node_index: Dict[int, int]  # node id -> dense node index
+    edge_index: Dict[Tuple[int, int], int]  # (u, v) node ids -> edge id
+    src: np.ndarray  # int32 dense node indices
+    dst: np.ndarray
+    kind: np.ndarray  # int8 ACTION_* codes
+    rate: np.ndarray  # float64
+    fee: np.ndarray
+    liquidity: np.ndarray
+    time_s: np.ndarray  # int32 transfer time, 0 for trades
+    weight: np.ndarray  # float64 -log(rate), inf if unusable
+    searchable: np.ndarray  # edge ids with a finite weight
+
+def _simple_cycles_through(src: np.ndarray, dst: np.ndarray, weight: np.ndarray, n: int,
+                           source: int, max_length: int, max_paths: int = 100_000) -> List[List[int]]:
+    """
+    Enumerate the simple cycles of 3 to max_length edges through source.
+    Open paths are grown one edge per layer as rows of a NumPy array; a node
+    is entered only if it is not on the path yet and source is still
+    reachable from it in the hops left, per a Bellman-Ford pass over the
+    reversed edges.
+    
+    Returns:
+        Cycles as node indices, source repeated at the end, cheapest first.
+        If a layer exceeds max_paths open paths only the cheapest are
+        extended, so very dense graphs may miss costly cycles.
+    """
+    if max_length < 3:
+        return []
+        
+    # Hops from each node back to source; after k passes every node within
+    # k hops has its exact count and the rest stay above k
+    hops = np.full(n, np.inf)
+    hops[source] = 0.0
+    pred = np.full(n, -1, dtype=np.int64)
+    ones = np.ones(len(src))
+    for _ in range(max_length - 1):
+        if bf_relax(dst, src, ones, hops, hops, pred) < 0:
+            break
+            
+    # Out-edges grouped by source node, and the weight of each node's edge back to source
+    order = np.argsort(src, kind='stable')
+    out_dst = dst[order]
+    out_weight = weight[order]
+    offsets = np.searchsorted(src[order], np.arange(n + 1))
+    closing = dst == source
+    close_weight = np.full(n, np.inf)
+    close_weight[src[closing]] = weight[closing]
+    
+    paths = np.full((1, 1), source, dtype=np.int64)
+    costs = np.zeros(1)
+    found_paths = []
+    found_costs = []
+    for depth in range(1, max_length):
+        # Expand every open path along every out-edge of its last node
+        last = paths[:, -1]
+        degree = offsets[last + 1] - offsets[last]
+        rows = np.repeat(np.arange(len(paths)), degree)
+        edges = np.repeat(offsets[last] - np.cumsum(degree) + degree, degree) + np.arange(degree.sum())
+        nodes = out_dst[edges]
+        keep = (hops[nodes] <= max_length - depth) & ~(paths[rows] == nodes[:, None]).any(axis=1)
+        rows, edges, nodes = rows[keep], edges[keep], nodes[keep]
+        if not len(rows):
+            break
+        paths = np.column_stack((paths[rows], nodes))
+        costs = costs[rows] + out_weight[edges]
+        if len(paths) > max_paths:
+            cheapest = np.argpartition(costs, max_paths)[:max_paths]
+            paths, costs = paths[cheapest], costs[cheapest]
+            
+        # Close paths of two or more edges whose last node links back to source
+        if depth >= 2:
+            closable = np.isfinite(close_weight[nodes])
+            found_paths.extend(paths[closable].tolist())
+            found_costs.extend((costs[closable] + close_weight[nodes[closable]]).tolist())
+            
+    by_cost = sorted(range(len(found_paths)), key=found_costs.__getitem__)
+    return [found_paths[i] + [source] for i in by_cost]
+
 class CrossProtocolArbitrageEngine:
     def __init__(self, connectors: List[Any] = None):
         """
@@ -24,6 +121,16 @@ class CrossProtocolArbitrageEngine:
         self.execution_history = []
         self.last_graph_update = 0
         self.graph_update_interval = 60  # Update graph every 60 seconds
+        self.max_concurrent_requests = 10  # Calls in flight per connector without a rate_limit
+        self._connector_semaphores = {}  # id(connector) -> (event loop, asyncio.Semaphore)
+        self.dfs_node_limit = 32  # Graphs smaller than this are searched with DFS
+        self._edge_arrays = None  # EdgeArrays of the current graph, see _build_edge_arrays
+        self._asset_ids = {}  # asset -> asset id
+        self._conn_ids = {}  # connector name -> connector id
+        self._asset_names = []  # asset id -> asset
+        self._conn_names = []  # connector id -> connector name
+        self.assets_cache_ttl = 60  # Reuse connector asset lists for 60 seconds
+        self._assets_cache = {}  # id(connector) -> (fetch time, assets as ordered dict keys)
         
     async def add_connector(self, connector: Any):
         """
@@ -34,11 +141,111 @@ class CrossProtocolArbitrageEngine:
         """
         # Add new exchange/protocol connector
         self.connectors.append(connector)
+        self._assets_cache.pop(id(connector), None)
         
         # Update opportunity graph with new vertices
         await self.update_graph_for_connector(connector)
         logger.info(f"Added connector: {connector.name if hasattr(connector, 'name') else 'Unknown'}")
         
+    def _semaphore_for(self, connector: Any) -> asyncio.Semaphore:
+        """
+        Get the request limiter for a connector, allowing connector.rate_limit
+        calls in flight if set, else max_concurrent_requests
+        """
+        # Semaphores are bound to the loop they are first awaited in
+        loop = asyncio.get_running_loop()
+        entry = self._connector_semaphores.get(id(connector))
+        if entry is None or entry[0] is not loop:
+            limit = getattr(connector, 'rate_limit', None) or self.max_concurrent_requests
+            entry = self._connector_semaphores[id(connector)] = (loop, asyncio.Semaphore(limit))
+        return entry[1]
+        
+    async def _limited(self, connector: Any, call: Callable[[], Awaitable]):
+        """Make and await a connector call under that connector's request limiter"""
+        async with self._semaphore_for(connector):
+            return await call()
+            
+    async def _fetch_rate(self, connector: Any, action: str, pair: str):
+        """Fetch the current rate of a buy or sell edge"""
+        if action == 'buy':
+            return await self._limited(connector, lambda: connector.get_buy_price(pair))
+        return await self._limited(connector, lambda: connector.get_sell_price(pair))
+            
+    async def _call_or_default(self, connector: Any, method: str, default: Any, *args):
+        """Await a connector method, or return default if it is missing or fails"""
+        try:
+            return await getattr(connector, method)(*args)
+        except Exception:
+            return default
+            
+    def _node_id(self, asset: str, connector_name: str) -> int:
+        """Get the graph node id of an asset on a connector, assigning ids on first use"""
+        asset_id = self._asset_ids.get(asset)
+        if asset_id is None:
+            asset_id = len(self._asset_names)
+            if asset_id > _ASSET_MASK:
+                raise ValueError(f"Too many assets for node ids, cannot add {asset}")
+            self._asset_ids[asset] = asset_id
+            self._asset_names.append(asset)
+        conn_id = self._conn_ids.get(connector_name)
+        if conn_id is None:
+            conn_id = len(self._conn_names)
+            if conn_id > _CONN_MASK:
+                raise ValueError(f"Too many connectors for node ids, cannot add {connector_name}")
+            self._conn_ids[connector_name] = conn_id
+            self._conn_names.append(connector_name)
+        return (conn_id << _ASSET_BITS) | asset_id
+        
+    def _lookup_node(self, asset: str, connector_name: str) -> int:
+        """Get the graph node id of an asset on a connector, or _UNKNOWN_NODE if it has none"""
+        asset_id = self._asset_ids.get(asset)
+        conn_id = self._conn_ids.get(connector_name)
+        if asset_id is None or conn_id is None:
+            return _UNKNOWN_NODE
+        return (conn_id << _ASSET_BITS) | asset_id
+        
+    def _node_asset(self, node: int) -> str:
+        """Asset of a graph node"""
+        return self._asset_names[node & _ASSET_MASK]
+        
+    def _node_connector(self, node: int) -> str:
+        """Connector name of a graph node"""
+        return self._conn_names[node >> _ASSET_BITS]
+        
+    def _node_name(self, node: int) -> str:
+        """Readable 'ASSET:connector' name of a graph node"""
+        return f"{self._node_asset(node)}:{self._node_connector(node)}"
+        
+    def _as_node_ids(self, cycle: List[Any]) -> List[int]:
+        """
+        Accept a cycle of node ids or of 'ASSET:connector' names; names
+        unknown to the graph become _UNKNOWN_NODE, which has no edges
+        """
+        nodes = []
+        for node in cycle:
+            if not isinstance(node, int):
+                asset, _, connector_name = node.partition(':')
+                node = self._lookup_node(asset, connector_name)
+            nodes.append(node)
+        return nodes
+        
+    def _node_label(self, node: Any) -> str:
+        """Readable name of a caller-supplied cycle entry"""
+        return node if isinstance(node, str) else self._node_name(node)
+        
+    async def _assets_for(self, connector: Any):
+        """
+        Get the assets available on a connector, fetched at most once per
+        assets_cache_ttl; supports iteration in connector order and O(1) lookup
+        """
+        cached = self._assets_cache.get(id(connector))
+        if cached is not None and time.time() - cached[0] < self.assets_cache_ttl:
+            return cached[1]
+            
+        assets = dict.fromkeys(await self._limited(connector, connector.get_assets)).keys()
+        self._assets_cache[id(connector)] = (time.time(), assets)
+        return assets
+        
     async def update_graph_for_connector(self, connector: Any):
         """
         Update the opportunity graph with trading pairs from a connector.
@@ -54,14 +261,14 @@ class CrossProtocolArbitrageEngine:
             pairs = await connector.get_tradeable_pairs()
             logger.debug(f"Found {len(pairs)} tradeable pairs for {connector_name}")
             
-            # Add edges to opportunity graph
-            for pair in pairs:
-                await self._add_pair_to_graph(connector, pair)
+            # Add edges to opportunity graph, fetching all pairs concurrently
+            await asyncio.gather(*(self._add_pair_to_graph(connector, pair) for pair in pairs))
                 
             # Add cross-connector edges for same asset
-            assets = await connector.get_assets()
+            assets = await self._assets_for(connector)
             await self._add_cross_connector_edges(connector, assets)
             
+            self._edge_arrays = None
             logger.debug(f"Graph now has {len(self.opportunity_graph.nodes)} nodes and {len(self.opportunity_graph.edges)} edges")
             
         except Exception as e:
@@ -80,10 +287,21 @@ class CrossProtocolArbitrageEngine:
             # Parse the trading pair
             base, quote = pair.split('-')
             
+            # Fetch fee and liquidity once for both directions, in parallel,
+            # with default values if methods not available
+            async with self._semaphore_for(connector):
+                fee, liquidity = await asyncio.gather(
+                    self._call_or_default(connector, 'get_fee', 0.001, pair),  # 0.1% default fee
+                    self._call_or_default(connector, 'get_liquidity', 1.0, pair)  # Default liquidity
+                )
+            
+            quote_node = self._node_id(quote, connector_name)
+            base_node = self._node_id(base, connector_name)
+            
             # Add forward edge (buy)
             self.opportunity_graph.add_edge(
-                f"{quote}:{connector_name}", 
-                f"{base}:{connector_name}",
+                quote_node,
+                base_node,
                 action="buy",
                 connector=connector,
                 pair=pair,
@@ -92,8 +310,8 @@ class CrossProtocolArbitrageEngine:
             
             # Add backward edge (sell)
             self.opportunity_graph.add_edge(
-                f"{base}:{connector_name}", 
-                f"{quote}:{connector_name}",
+                base_node,
+                quote_node,
                 action="sell",
                 connector=connector,
                 pair=pair,
@@ -101,68 +319,68 @@ class CrossProtocolArbitrageEngine:
             )
             
             # Add edge attributes for fees and liquidity
-            for edge in [(f"{quote}:{connector_name}", f"{base}:{connector_name}"),
-                        (f"{base}:{connector_name}", f"{quote}:{connector_name}")]:
-                try:
-                    fee = await connector.get_fee(pair)
-                    liquidity = await connector.get_liquidity(pair)
-                    self.opportunity_graph.edges[edge]['fee'] = fee
-                    self.opportunity_graph.edges[edge]['liquidity'] = liquidity
-                except:
-                    # Default values if methods not available
-                    self.opportunity_graph.edges[edge]['fee'] = 0.001  # 0.1% default fee
-                    self.opportunity_graph.edges[edge]['liquidity'] = 1.0  # Default liquidity
+            for edge in [(quote_node, base_node), (base_node, quote_node)]:
+                self.opportunity_graph.edges[edge]['fee'] = fee
+                self.opportunity_graph.edges[edge]['liquidity'] = liquidity
             
         except Exception as e:
             logger.error(f"Error adding pair {pair} to graph: {str(e)}")
             
-    async def _add_cross_connector_edges(self, connector: Any, assets: List[str]):
+    async def _add_cross_connector_edges(self, connector: Any, assets: Iterable[str]):
         """
         Add cross-connector edges for asset transfers between protocols.
         
         Args:
             connector: Exchange connector
-            assets: List of assets available on this connector
+            assets: Assets available on this connector
         """
         connector_name = connector.name if hasattr(connector, 'name') else str(connector)
         
         # Add transfer edges between connectors for the same asset
-        for asset in assets:
-            for other_connector in self.connectors:
-                other_name = other_connector.name if hasattr(other_connector, 'name') else str(other_connector)
+        for other_connector in self.connectors:
+            other_name = other_connector.name if hasattr(other_connector, 'name') else str(other_connector)
+            
+            # Skip self-connections
+            if other_connector == connector:
+                continue
+                
+            # Fetch the other connector's assets once for all of ours
+            try:
+                other_assets = await self._assets_for(other_connector)
+            except Exception as e:
+                logger.error(f"Error getting assets for {other_name}: {str(e)}")
+                continue
                 
-                # Skip self-connections
-                if other_connector == connector:
+            for asset in assets:
+                # Check if asset exists on other connector
+                if asset not in other_assets:
                     continue
                     
-                # Check if asset exists on other connector
                 try:
-                    other_assets = await other_connector.get_assets()
-                    if asset in other_assets:
-                        # Add deposit/withdrawal edges
-                        self.opportunity_graph.add_edge(
-                            f"{asset}:{connector_name}",
-                            f"{asset}:{other_name}",
-                            action="transfer",
-                            source=connector,
-                            destination=other_connector,
-                            asset=asset,
-                            trade_type="transfer"
-                        )
-                        
-                        # Add transfer fee and time attributes
-                        try:
-                            transfer_fee = await connector.get_withdrawal_fee(asset, other_connector)
-                            transfer_time = await connector.get_withdrawal_time(asset, other_connector)
-                        except:
-                            # Default values if methods not available
-                            transfer_fee = self._get_default_transfer_fee(asset, connector, other_connector)
-                            transfer_time = self._get_default_transfer_time(connector, other_connector)
-                            
-                        edge = (f"{asset}:{connector_name}", f"{asset}:{other_name}")
-                        self.opportunity_graph.edges[edge]['fee'] = transfer_fee
-                        self.opportunity_graph.edges[edge]['time'] = transfer_time
+                    edge = (self._node_id(asset, connector_name), self._node_id(asset, other_name))
+                    
+                    # Add deposit/withdrawal edges
+                    self.opportunity_graph.add_edge(
+                        *edge,
+                        action="transfer",
+                        source=connector,
+                        destination=other_connector,
+                        asset=asset,
+                        trade_type="transfer"
+                    )
+                    
+                    # Add transfer fee and time attributes
+                    try:
+                        transfer_fee = await connector.get_withdrawal_fee(asset, other_connector)
+                        transfer_time = await connector.get_withdrawal_time(asset, other_connector)
+                    except:
+                        # Default values if methods not available
+                        transfer_fee = self._get_default_transfer_fee(asset, connector, other_connector)
+                        transfer_time = self._get_default_transfer_time(connector, other_connector)
                         
+                    self.opportunity_graph.edges[edge]['fee'] = transfer_fee
+                    self.opportunity_graph.edges[edge]['time'] = transfer_time
+                    
                 except Exception as e:
                     logger.error(f"Error adding cross-connector edge for {asset}: {str(e)}")
     
@@ -205,40 +423,47 @@ class CrossProtocolArbitrageEngine:
         logger.info("Updating entire opportunity graph with current rates")
         self.last_graph_update = current_time
         
-        # Update all connector data
-        for connector in self.connectors:
-            await self.update_graph_for_connector(connector)
+        # Update all connector data concurrently
+        await asyncio.gather(*(self.update_graph_for_connector(c) for c in self.connectors))
             
-        # Update edge weights based on current rates
+        # Fetch the current rate of every trade edge in one batch
+        edges = []
+        requests = []
         for u, v, data in self.opportunity_graph.edges(data=True):
             if data.get('action') in ['buy', 'sell']:
-                try:
-                    connector = data.get('connector')
-                    pair = data.get('pair')
+                connector = data.get('connector')
+                pair = data.get('pair')
+                
+                if connector and pair:
+                    edges.append((u, v))
+                    requests.append(self._fetch_rate(connector, data['action'], pair))
                     
-                    if connector and pair:
-                        # Get current rate for this edge
-                        if data['action'] == 'buy':
-                            rate = await connector.get_buy_price(pair)
-                        else:  # sell
-                            rate = await connector.get_sell_price(pair)
-                            
-                        # Update edge with current rate
-                        self.opportunity_graph.edges[u, v]['rate'] = rate
-                        
-                        # Calculate edge weight for pathfinding (negative log of rate)
-                        # Negative because we want to maximize product of rates
-                        if rate > 0:
-                            self.opportunity_graph.edges[u, v]['weight'] = -np.log(rate)
-                        else:
-                            self.opportunity_graph.edges[u, v]['weight'] = float('inf')
-                            
-                except Exception as e:
-                    logger.error(f"Error updating edge weight for {u} -> {v}: {str(e)}")
-                    self.opportunity_graph.edges[u, v]['weight'] = float('inf')
+        rates = await asyncio.gather(*requests, return_exceptions=True)
+        
+        # Update edge weights based on current rates
+        for (u, v), rate in zip(edges, rates):
+            edge_data = self.opportunity_graph.edges[u, v]
+            try:
+                if isinstance(rate, Exception):
+                    raise rate
+                    
+                # Update edge with current rate
+                edge_data['rate'] = rate
+                
+                # Calculate edge weight for pathfinding (negative log of rate)
+                # Negative because we want to maximize product of rates
+                if rate > 0:
+                    edge_data['weight'] = -np.log(rate)
+                else:
+                    edge_data['weight'] = float('inf')
+                    
+            except Exception as e:
+                logger.error(f"Error updating edge weight for {self._node_name(u)} -> {self._node_name(v)}: {str(e)}")
+                edge_data['weight'] = float('inf')
         
         # Clear route cache after update
         self.route_cache = {}
+        self._build_edge_arrays()
                     
     async def find_arbitrage_cycles(self, start_asset: str, min_profit_pct: float = 0.5) -> List[Dict[str, Any]]:
         """
@@ -259,13 +484,14 @@ class CrossProtocolArbitrageEngine:
         # Try each connector as a starting point
         for connector in self.connectors:
             connector_name = connector.name if hasattr(connector, 'name') else str(connector)
-            start_node = f"{start_asset}:{connector_name}"
+            start_node = self._lookup_node(start_asset, connector_name)
+            start_name = f"{start_asset}:{connector_name}"
             
             if start_node not in self.opportunity_graph:
-                logger.debug(f"Start node {start_node} not in graph")
+                logger.debug(f"Start node {start_name} not in graph")
                 continue
                 
-            logger.debug(f"Searching for cycles starting at {start_node}")
+            logger.debug(f"Searching for cycles starting at {start_name}")
             
             # Find simple cycles up to a reasonable length
             max_cycle_length = 5  # Limit to prevent excessive computation
@@ -284,7 +510,7 @@ class CrossProtocolArbitrageEngine:
                             steps = await self.cycle_to_steps(cycle)
                             
                             profitable_cycles.append({
-                                "cycle": cycle,
+                                "cycle": [self._node_name(node) for node in cycle],
                                 "profit_pct": profit_pct,
                                 "steps": steps,
                                 "details": details,
@@ -294,15 +520,79 @@ class CrossProtocolArbitrageEngine:
                             logger.debug(f"Found profitable cycle: {profit_pct:.2f}% profit, {len(steps)} steps")
                             
             except Exception as e:
-                logger.error(f"Error finding cycles from {start_node}: {str(e)}")
+                logger.error(f"Error finding cycles from {start_name}: {str(e)}")
         
         # Sort by profit percentage
         return sorted(profitable_cycles, key=lambda x: x["profit_pct"], reverse=True)
         
-    def _find_negative_cycles(self, start_node: str, max_length: int = 5) -> List[List[str]]:
+    def _build_edge_arrays(self):
+        """
+        Materialize the opportunity graph as parallel edge attribute arrays,
+        so hot loops read contiguous numbers instead of edge dicts
+        """
+        graph = self.opportunity_graph
+        node_ids = np.fromiter(graph.nodes, dtype=np.uint32, count=graph.number_of_nodes())
+        node_index = {node: i for i, node in enumerate(graph.nodes)}
+        
+        m = graph.number_of_edges()
+        edge_index = {}
+        src = np.empty(m, dtype=np.int32)
+        dst = np.empty(m, dtype=np.int32)
+        kind = np.empty(m, dtype=np.int8)
+        rate = np.empty(m, dtype=np.float64)
+        fee = np.empty(m, dtype=np.float64)
+        liquidity = np.empty(m, dtype=np.float64)
+        time_s = np.zeros(m, dtype=np.int32)
+        weight = np.empty(m, dtype=np.float64)
+        
+        for k, (u, v, data) in enumerate(graph.edges(data=True)):
+            edge_index[u, v] = k
+            src[k] = node_index[u]
+            dst[k] = node_index[v]
+            kind[k] = _ACTION_KINDS.get(data.get('action'), ACTION_UNKNOWN)
+            weight[k] = data.get('weight', float('inf'))
+            # A rate is only usable if it produced a finite weight
+            rate[k] = data.get('rate', 0.0) if weight[k] != float('inf') else 0.0
+            fee[k] = data.get('fee', 0.001)
+            liquidity[k] = data.get('liquidity', 1.0)
+            if kind[k] == ACTION_TRANSFER:
+                time_s[k] = data.get('time', 600)
+                
+        self._edge_arrays = EdgeArrays(
+            node_ids=node_ids, node_index=node_index, edge_index=edge_index,
+            src=src, dst=dst, kind=kind, rate=rate, fee=fee, liquidity=liquidity,
+            time_s=time_s, weight=weight, searchable=np.flatnonzero(np.isfinite(weight))
+        )
+        
+    def _find_negative_cycles(self, start_node: int, max_length: int = 5) -> List[List[int]]:
         """
         Find negative weight cycles in the graph (profitable arbitrage cycles).
-        Uses Bellman-Ford algorithm with early termination.
+        Enumerates the simple cycles through the start node over the edge
+        arrays; small graphs use a DFS instead, which finds the same cycles.
+        
+        Args:
+            start_node: Starting node
+            max_length: Maximum cycle length to consider
+            
+        Returns:
+            List of up to 100 cycles; from the edge arrays, the cheapest first
+        """
+        if len(self.opportunity_graph) < self.dfs_node_limit:
+            return self._find_cycles_dfs(start_node, max_length)
+            
+        if self._edge_arrays is None:
+            self._build_edge_arrays()
+        edges = self._edge_arrays
+        search = edges.searchable
+        
+        start = edges.node_index[start_node]
+        cycles = _simple_cycles_through(edges.src[search], edges.dst[search], edges.weight[search],
+                                        len(edges.node_ids), start, max_length)
+        return [[int(edges.node_ids[node]) for node in cycle] for cycle in cycles[:100]]
+        
+    def _find_cycles_dfs(self, start_node: int, max_length: int = 5) -> List[List[int]]:
+        """
+        Find simple cycles back to the start node with a depth-limited DFS.
         
         Args:
             start_node: Starting node
@@ -311,9 +601,8 @@ class CrossProtocolArbitrageEngine:
         Returns:
             List of cycles
         """
-        # Implementation uses a simplified negative cycle detection
         all_cycles = []
-        visited = {start_node: 0}  # node -> depth
+        on_path = {start_node}
         path = [start_node]
         
         def dfs(node, depth):
@@ -321,6 +610,11 @@ class CrossProtocolArbitrageEngine:
                 return
                 
             for neighbor in self.opportunity_graph.neighbors(node):
+                # Stop once enough cycles have been found
+                if len(all_cycles) >= 100:
+                    return
+                    
+
                 edge_data = self.opportunity_graph.edges[node, neighbor]
                 
                 # Skip edges with infinite weight (invalid)
@@ -331,194 +625,148 @@ class CrossProtocolArbitrageEngine:
                 if neighbor == start_node and depth > 1:
                     cycle = path + [start_node]
                     all_cycles.append(cycle)
-                    # Early termination if we've found enough cycles
-                    if len(all_cycles) >= 100:
-                        return
-                # Visit unvisited nodes or revisit if better path
-                elif neighbor not in visited or visited[neighbor] > depth + 1:
-                    visited[neighbor] = depth + 1
+                # Extend the path through nodes not already on it, so every
+                # simple cycle is found whatever order neighbors come in
+                elif neighbor not in on_path:
+                    on_path.add(neighbor)
                     path.append(neighbor)
                     dfs(neighbor, depth + 1)
                     path.pop()
+                    on_path.discard(neighbor)
         
         dfs(start_node, 0)
         return all_cycles
         
-    async def calculate_cycle_profit(self, cycle: List[str]) -> Tuple[float, Dict[str, Any]]:
+    def _cycle_edge_arrays(self, cycle: List[int]) -> Optional[Tuple[np.ndarray, ...]]:
+        """
+        Gather the attributes of a cycle's edges from the edge arrays.
+        
+        Args:
+            cycle: List of node ids in the cycle
+            
+        Returns:
+            Tuple of (rate, fee, liquidity, kind, time_s) arrays, one entry
+            per step, or None if an edge is missing from the graph
+        """
+        if self._edge_arrays is None:
+            self._build_edge_arrays()
+        edges = self._edge_arrays
+        
+        edge_ids = [edges.edge_index.get(edge) for edge in zip(cycle, cycle[1:])]
+        if None in edge_ids:
+            return None
+        return (edges.rate[edge_ids], edges.fee[edge_ids], edges.liquidity[edge_ids],
+                edges.kind[edge_ids], edges.time_s[edge_ids])
+        
+    async def calculate_cycle_profit(self, cycle: List[Any]) -> Tuple[float, Dict[str, Any]]:
         """
-        Calculate expected profit percentage for a cycle.
+        Calculate expected profit percentage for a cycle, net of fees and
+        estimated slippage.
         
         Args:
-            cycle: List of nodes in the cycle
+            cycle: List of nodes in the cycle, as node ids or 'ASSET:connector' names
             
         Returns:
             Tuple of (profit percentage, detailed breakdown)
         """
-        # Base asset and amount
-        start_node = cycle[0]
-        asset = start_node.split(':')[0]
+        names = cycle
+        cycle = self._as_node_ids(cycle)
         start_amount = 1.0  # Normalized to 1 unit
         
-        current_amount = start_amount
-        current_asset = asset
+        arrays = self._cycle_edge_arrays(cycle)
+        if arrays is None:
+            for i, (from_node, to_node) in enumerate(zip(cycle, cycle[1:])):
+                if not self.opportunity_graph.has_edge(from_node, to_node):
+                    return 0.0, {"error": f"Edge not found: {self._node_label(names[i])} -> {self._node_label(names[i + 1])}"}
+            # The graph gained edges since the arrays were built
+            self._build_edge_arrays()
+            arrays = self._cycle_edge_arrays(cycle)
+        rate, fee, liquidity, kind, time_s = arrays
+        
+        unknown = np.flatnonzero(kind == ACTION_UNKNOWN)
+        if unknown.size:
+            action = self.opportunity_graph.edges[cycle[unknown[0]], cycle[unknown[0] + 1]].get('action')
+            return 0.0, {"error": f"Unknown action type: {action}"}
+            
+        # Amount held after each step; transfers only pay their fee
+        factor = np.where(kind == ACTION_TRANSFER, 1.0 - fee, rate * (1.0 - fee))
+        amounts = start_amount * np.cumprod(factor)
+        from_amounts = np.concatenate(([start_amount], amounts[:-1]))
+        # Sell fees are paid in the quote asset received, other fees in the asset spent
+        fees = from_amounts * np.where(kind == ACTION_SELL, rate, 1.0) * fee
+        
+        # Simple slippage model: amount/liquidity is the share of available
+        # liquidity used, at 0.5% per unit, capped at 5% per step
+        slippage = np.minimum(5.0, start_amount / np.maximum(liquidity, 1e-9) * 0.5)
+        
+        profit_pct = float(amounts[-1] - start_amount) / start_amount * 100 if len(amounts) else 0.0
+        estimated_slippage = float(slippage.sum())
+        adjusted_profit_pct = profit_pct - estimated_slippage
         
         details = {
-            "steps": [],
-            "fees": 0.0,
+            "steps": self._cycle_step_details(cycle, kind, rate, from_amounts, amounts, fees, time_s),
+            "fees": float(fees.sum()),
             "slippage": 0.0,
-            "execution_time": 0
+            "execution_time": int(time_s.sum()),
+            "raw_profit_pct": profit_pct,
+            "slippage_estimate_pct": estimated_slippage,
+            "adjusted_profit_pct": adjusted_profit_pct
         }
         
-        # Simulate execution of each step
-        for i in range(len(cycle) - 1):
-            from_node = cycle[i]
-            to_node = cycle[i + 1]
-            
-            if not self.opportunity_graph.has_edge(from_node, to_node):
-                return 0.0, {"error": f"Edge not found: {from_node} -> {to_node}"}
-                
-            edge_data = self.opportunity_graph.edges[from_node, to_node]
-            action = edge_data.get('action')
-            
-            # Extract rate from edge
-            rate = edge_data.get('rate', 0.0)
-            fee = edge_data.get('fee', 0.001)  # Default 0.1% fee
-            
-            # Apply rate and fee to current amount
-            if action == 'buy':
-                to_asset = to_node.split(':')[0]
-                from_asset = from_node.split(':')[0]
-                
-                # Buying to_asset with from_asset
-                new_amount = current_amount * rate * (1 - fee)
-                
-                step_details = {
-                    "action": "buy",
-                    "pair": f"{to_asset}-{from_asset}",
-                    "rate": rate,
-                    "from_amount": current_amount,
-                    "from_asset": from_asset,
-                    "to_amount": new_amount,
-                    "to_asset": to_asset,
-                    "fee": current_amount * fee,
-                    "fee_asset": from_asset
-                }
-                
-                current_amount = new_amount
-                current_asset = to_asset
-                
-            elif action == 'sell':
-                to_asset = to_node.split(':')[0]
-                from_asset = from_node.split(':')[0]
-                
-                # Selling from_asset for to_asset
-                new_amount = current_amount * rate * (1 - fee)
-                
-                step_details = {
-                    "action": "sell",
-                    "pair": f"{from_asset}-{to_asset}",
-                    "rate": rate,
-                    "from_amount": current_amount,
-                    "from_asset": from_asset,
-                    "to_amount": new_amount,
-                    "to_asset": to_asset,
-                    "fee": current_amount * rate * fee,
-                    "fee_asset": to_asset
-                }
-                
-                current_amount = new_amount
-                current_asset = to_asset
-                
-            elif action == 'transfer':
-                to_exchange = to_node.split(':')[1]
-                from_exchange = from_node.split(':')[1]
-                
-                # Transferring asset between exchanges
-                new_amount = current_amount * (1 - fee)
-                transfer_time = edge_data.get('time', 600)  # Default 10 min
-                
-                step_details = {
-                    "action": "transfer",
-                    "from_exchange": from_exchange,
-                    "to_exchange": to_exchange,
-                    "asset": current_asset,
-                    "amount": current_amount,
-                    "fee": current_amount * fee,
-                    "fee_asset": current_asset,
-                    "time": transfer_time
-                }
-                
-                current_amount = new_amount
-                details["execution_time"] += transfer_time
-                
-            else:
-                # Unknown action type
-                return 0.0, {"error": f"Unknown action type: {action}"}
-                
-            details["steps"].append(step_details)
-            details["fees"] += step_details.get("fee", 0.0)
-            
-        # Calculate profit percentage
-        if start_amount > 0:
-            profit_pct = (current_amount - start_amount) / start_amount * 100
-        else:
-            profit_pct = 0.0
-            
-        # Account for estimated slippage based on liquidity
-        estimated_slippage = self._estimate_slippage(cycle, start_amount)
-        adjusted_profit_pct = profit_pct - estimated_slippage
-        
-        details["raw_profit_pct"] = profit_pct
-        details["slippage_estimate_pct"] = estimated_slippage
-        details["adjusted_profit_pct"] = adjusted_profit_pct
-        
         return adjusted_profit_pct, details
         
-    def _estimate_slippage(self, cycle: List[str], amount: float) -> float:
-        """
-        Estimate slippage for a cycle based on liquidity of each edge.
+    def _cycle_step_details(self, cycle: List[int], kind: np.ndarray, rate: np.ndarray,
+                            from_amounts: np.ndarray, to_amounts: np.ndarray,
+                            fees: np.ndarray, time_s: np.ndarray) -> List[Dict[str, Any]]:
+        """Per-step breakdown of a cycle from its computed edge arrays"""
+        steps = []
+        current_asset = self._node_asset(cycle[0])
         
-        Args:
-            cycle: List of nodes in the cycle
-            amount: Base amount
+        for i, (from_node, to_node) in enumerate(zip(cycle, cycle[1:])):
+            from_amount = float(from_amounts[i])
             
-        Returns:
-            Estimated slippage percentage
-        """
-        total_slippage_pct = 0.0
-        
-        for i in range(len(cycle) - 1):
-            from_node = cycle[i]
-            to_node = cycle[i + 1]
-            
-            if self.opportunity_graph.has_edge(from_node, to_node):
-                edge_data = self.opportunity_graph.edges[from_node, to_node]
-                
-                # Get liquidity data if available
-                liquidity = edge_data.get('liquidity', 1.0)
-                
-                # Simple slippage model: higher liquidity = lower slippage
-                # amount/liquidity represents what percentage of available liquidity
-                # we're using, which impacts slippage
-                if liquidity > 0:
-                    step_slippage = min(5.0, (amount / liquidity) * 0.5)  # Cap at 5%
-                else:
-                    step_slippage = 5.0  # Assume worst case for unknown liquidity
-                    
-                total_slippage_pct += step_slippage
+            if kind[i] == ACTION_TRANSFER:
+                steps.append({
+                    "action": "transfer",
+                    "from_exchange": self._node_connector(from_node),
+                    "to_exchange": self._node_connector(to_node),
+                    "asset": current_asset,
+                    "amount": from_amount,
+                    "fee": float(fees[i]),
+                    "fee_asset": current_asset,
+                    "time": int(time_s[i])
+                })
+                continue
                 
-        return total_slippage_pct
-        
-    async def cycle_to_steps(self, cycle: List[str]) -> List[Dict[str, Any]]:
+            from_asset = self._node_asset(from_node)
+            to_asset = self._node_asset(to_node)
+            buy = kind[i] == ACTION_BUY
+            steps.append({
+                "action": "buy" if buy else "sell",
+                "pair": f"{to_asset}-{from_asset}" if buy else f"{from_asset}-{to_asset}",
+                "rate": float(rate[i]),
+                "from_amount": from_amount,
+                "from_asset": from_asset,
+                "to_amount": float(to_amounts[i]),
+                "to_asset": to_asset,
+                "fee": float(fees[i]),
+                "fee_asset": from_asset if buy else to_asset
+            })
+            current_asset = to_asset
+            
+        return steps
+        
+    async def cycle_to_steps(self, cycle: List[Any]) -> List[Dict[str, Any]]:
         """
         Convert a cycle to concrete execution steps.
         
         Args:
-            cycle: List of nodes in the cycle
+            cycle: List of nodes in the cycle, as node ids or 'ASSET:connector' names
             
         Returns:
             List of execution steps
         """
+        cycle = self._as_node_ids(cycle)
         execution_steps = []
         
         for i in range(len(cycle) - 1):
@@ -528,8 +776,10 @@ class CrossProtocolArbitrageEngine:
             if self.opportunity_graph.has_edge(from_node, to_node):
                 edge_data = self.opportunity_graph.edges[from_node, to_node]
                 
-                from_asset, from_exchange = from_node.split(':')
-                to_asset, to_exchange = to_node.split(':')
+                from_asset = self._node_asset(from_node)
+                from_exchange = self._node_connector(from_node)
+                to_asset = self._node_asset(to_node)
+                to_exchange = self._node_connector(to_node)
                 
                 action = edge_data.get('action')
                 
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; without it the kernels fall back to NumPy
+    njit = None
+
+def _bf_relax_loops(src: np.ndarray, dst: np.ndarray, weight: np.ndarray,
+                    prev: np.ndarray, dist: np.ndarray, pred: np.ndarray) -> int:
+    """One Bellman-Ford layer over the edge arrays as explicit loops, compiled by Numba"""
+    relaxed = -1
+    for k in range(src.shape[0]):
+        candidate = prev[src[k]] + weight[k]
+        if candidate < dist[dst[k]]:
+            dist[dst[k]] = candidate
+            pred[dst[k]] = src[k]
+            relaxed = dst[k]
+    return relaxed
+
+def _bf_relax_numpy(src: np.ndarray, dst: np.ndarray, weight: np.ndarray,
+                    prev: np.ndarray, dist: np.ndarray, pred: np.ndarray) -> int:
+    """One Bellman-Ford layer over the edge arrays with NumPy, used when Numba is unavailable"""
+    candidate = prev[src] + weight
+    improved = candidate < dist[dst]
+    if not improved.any():
+        return -1
+    np.minimum.at(dist, dst, np.where(improved, candidate, np.inf))
+    # Keep the predecessor of whichever edge won each destination
+    won = np.flatnonzero(improved & (candidate == dist[dst]))
+    pred[dst[won]] = src[won]
+    return int(dst[won[-1]])
+
+# bf_relax(src, dst, weight, prev, dist, pred) -> index of the last node
+# relaxed, or -1 if no edge improved. Relaxes every edge from the distances
+# in prev into dist and pred, updated in place. Passing dist as prev gives
+# the classic in-place pass; a separate prev layer keeps each pass to walks
+# exactly one edge longer. Compiled, a pass is one sequential sweep over
+# the edges; it is not split across threads, since concurrent writes to
+# dist would race.
+if njit is not None:
+    bf_relax = njit(cache=True)(_bf_relax_loops)
+else:
+    bf_relax = _bf_relax_numpy
@@ -0,0 +1,132 @@
+import json
+import os
+import sys
+import unittest
+from unittest import mock
+
+import numpy as np
+
+# Models import each other as models.*, relative to src
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from models.advanced import capital_allocator
+from models.advanced.capital_allocator import CapitalAllocator, PortfolioSummary, RiskModel, _packed_index
+
+ASSETS = ["BTC", "ETH", "USDT", "SOL", "USDC"]
+
+class TestPackedIndex(unittest.TestCase):
+    def test_matches_row_major_upper_triangle(self):
+        n = 6
+        rows, cols = np.triu_indices(n)
+        np.testing.assert_array_equal(_packed_index(rows, cols, n), np.arange(len(rows)))
+        np.testing.assert_array_equal(_packed_index(cols, rows, n), np.arange(len(rows)))
+
+class TestCorrelationStorage(unittest.TestCase):
+    def setUp(self):
+        self.model = RiskModel()
+        self.model._update_risk_factors(ASSETS)
+
+    def test_packed_triangle_length(self):
+        n = len(ASSETS)
+        self.assertEqual(self.model._corr_packed.shape, (n * (n + 1) // 2,))
+
+    def test_correlation_block_is_symmetric_with_unit_diagonal(self):
+        assets = ASSETS + ["UNKNOWN"]
+        block = self.model._correlation_block(assets)
+        self.assertEqual(block.shape, (len(assets), len(assets)))
+        np.testing.assert_array_equal(block, block.T)
+        np.testing.assert_array_equal(np.diag(block), np.ones(len(assets)))
+        # Assets without data are uncorrelated with the rest
+        np.testing.assert_array_equal(block[-1, :-1], np.zeros(len(ASSETS)))
+
+    def test_corr_is_symmetric(self):
+        for a in ASSETS:
+            self.assertEqual(self.model._corr(a, a), 1.0)
+            for b in ASSETS:
+                self.assertEqual(self.model._corr(a, b), self.model._corr(b, a))
+
+    def correlations(self, assets):
+        return {(a, b): self.model._corr(a, b) for a in assets for b in assets}
+
+    def test_existing_pairs_survive_adding_assets(self):
+        before = self.correlations(ASSETS)
+        self.model._update_risk_factors(ASSETS + ["ADA", "DOT", "DAI"])
+        self.assertEqual(self.correlations(ASSETS), before)
+        n = len(ASSETS) + 3
+        self.assertEqual(self.model._corr_packed.shape, (n * (n + 1) // 2,))
+        block = self.model._correlation_block(ASSETS + ["ADA", "DOT", "DAI"])
+        np.testing.assert_array_equal(block, block.T)
+
+    def test_stale_asset_redraws_only_its_pairs(self):
+        before = self.correlations(ASSETS)
+        self.model.volatility_cache["SOL"]["timestamp"] -= 2 * self.model.update_interval
+        self.model._update_risk_factors(ASSETS)
+        after = self.correlations(ASSETS)
+        for (a, b), value in before.items():
+            if "SOL" not in (a, b):
+                self.assertEqual(after[a, b], value)
+        self.assertNotEqual(after["SOL", "BTC"], before["SOL", "BTC"])
+        self.assertEqual(after["SOL", "SOL"], 1.0)
+
+class TestPortfolioSummary(unittest.TestCase):
+    def test_summary_type_does_not_depend_on_portfolio_size(self):
+        for capital in ({}, {"BTC": 100.0}, {"BTC": 100.0, "ETH": 300.0}):
+            summary = CapitalAllocator(capital).get_portfolio_summary()
+            self.assertIsInstance(summary, PortfolioSummary)
+            plain = summary.to_dict()
+            self.assertEqual(plain["assets"], len(capital))
+            self.assertEqual(plain["total_value"], sum(capital.values()))
+            self.assertEqual(set(plain["asset_breakdown"]), set(capital))
+
+    def test_empty_summary_has_no_timestamp(self):
+        summary = CapitalAllocator().get_portfolio_summary()
+        self.assertEqual(dict(summary), {"assets": 0, "total_value": 0, "asset_breakdown": {}})
+
+    def test_single_asset_breakdown(self):
+        summary = CapitalAllocator({"BTC": 100.0}).get_portfolio_summary()
+        self.assertEqual(list(summary), ["assets", "total_value", "asset_breakdown", "timestamp"])
+        self.assertEqual(summary["asset_breakdown"]["BTC"]["weight"], 1.0)
+
+class TestAllocationHistory(unittest.TestCase):
+    def test_history_stays_in_order_after_wrapping(self):
+        allocator = CapitalAllocator()
+        capacity = allocator.max_history_records
+        total = capacity + capacity // 4
+        for k in range(total):
+            allocator._add_to_history("allocate" if k % 2 else "release", {"k": k})
+        history = allocator.history_view()
+        self.assertEqual(len(history), capacity)
+        self.assertEqual([entry["data"]["k"] for entry in history], list(range(total - capacity, total)))
+        self.assertEqual([entry["type"] for entry in history[:2]],
+                         ["allocate" if k % 2 else "release" for k in range(total - capacity, total - capacity + 2)])
+        timestamps = [entry["timestamp"] for entry in history]
+        self.assertEqual(timestamps, sorted(timestamps))
+
+    def test_history_before_wrapping(self):
+        allocator = CapitalAllocator()
+        for k in range(3):
+            allocator._add_to_history("allocate", {"k": k})
+        self.assertEqual([entry["data"]["k"] for entry in allocator.allocation_history], [0, 1, 2])
+
+class TestJsonEncoding(unittest.TestCase):
+    def setUp(self):
+        self.allocator = CapitalAllocator({"BTC": 100.0, "ETH": 50.0})
+        self.allocator._add_to_history("allocate", {"k": 1})
+
+    def check_encodings(self):
+        summary = json.loads(self.allocator.portfolio_summary_json())
+        self.assertEqual(summary, json.loads(json.dumps(self.allocator.get_portfolio_summary().to_dict())))
+        self.assertEqual(set(summary["asset_breakdown"]), {"BTC", "ETH"})
+        history = json.loads(self.allocator.history_json())
+        self.assertEqual([(entry["type"], entry["data"]) for entry in history], [("allocate", {"k": 1})])
+
+    @unittest.skipIf(capital_allocator.orjson is None, "orjson not installed")
+    def test_orjson_encoding(self):
+        self.check_encodings()
+
+    def test_stdlib_encoding(self):
+        with mock.patch.object(capital_allocator, "orjson", None):
+            self.check_encodings()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+import asyncio
+import os
+import sys
+import unittest
+
+# Models import each other as models.*, relative to src
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from models.advanced.cross_protocol_arbitrage import CrossProtocolArbitrageEngine
+
+class FakeConnector:
+    """Connector quoting fixed prices; prices maps pair -> (buy rate, sell rate)"""
+    def __init__(self, name, prices):
+        self.name = name
+        self.prices = prices
+
+    async def get_tradeable_pairs(self):
+        return list(self.prices)
+
+    async def get_assets(self):
+        return sorted({asset for pair in self.prices for asset in pair.split('-')})
+
+    async def get_fee(self, pair):
+        return 0.001
+
+    async def get_liquidity(self, pair):
+        return 1000.0
+
+    async def get_buy_price(self, pair):
+        await asyncio.sleep(0)  # Yield so rate-limited calls contend
+        return self.prices[pair][0]
+
+    async def get_sell_price(self, pair):
+        await asyncio.sleep(0)
+        return self.prices[pair][1]
+
+def mispriced_triangle_prices(n_assets=40):
+    """Fairly priced A<i>-USDT pairs plus an A5 -> A6 -> A7 -> A5 triangle paying 10% per leg"""
+    prices = {f"A{i}-USDT": (1.0, 1.0) for i in range(n_assets)}
+    for base, quote in (("A6", "A5"), ("A7", "A6"), ("A5", "A7")):
+        prices[f"{base}-{quote}"] = (1.1, 0.99 / 1.1)
+    return prices
+
+class TestFindArbitrageCycles(unittest.IsolatedAsyncioTestCase):
+    async def find_cycles(self, dfs_node_limit):
+        engine = CrossProtocolArbitrageEngine([FakeConnector("ex", mispriced_triangle_prices())])
+        engine.dfs_node_limit = dfs_node_limit
+        cycles = await engine.find_arbitrage_cycles("USDT", min_profit_pct=0.5)
+        self.assertEqual(len(engine.opportunity_graph), 41)
+        return cycles
+
+    async def test_finds_cycles_through_start_beside_other_negative_cycle(self):
+        # The A5/A6/A7 triangle is a negative cycle not through USDT; the
+        # USDT cycles entering and leaving it must still be found
+        cycles = await self.find_cycles(dfs_node_limit=32)
+        self.assertEqual(len(cycles), 6)
+        for cycle in cycles:
+            self.assertEqual(cycle["cycle"][0], "USDT:ex")
+            self.assertEqual(cycle["cycle"][-1], "USDT:ex")
+        self.assertGreater(cycles[0]["profit_pct"], 20.0)
+
+    async def test_matches_dfs_cycles(self):
+        bellman_ford = await self.find_cycles(dfs_node_limit=32)
+        dfs = await self.find_cycles(dfs_node_limit=1000)
+        self.assertEqual({tuple(c["cycle"]) for c in bellman_ford}, {tuple(c["cycle"]) for c in dfs})
+
+class TestCycleSearch(unittest.TestCase):
+    def engine_with_loop_away_from_start(self):
+        # 1 -> 2 -> 1 is a profitable loop not through 0; the cheapest walks
+        # to 2 go around it, but 0 -> 1 -> 4 -> 2 -> 3 -> 0 is a simple cycle
+        engine = CrossProtocolArbitrageEngine()
+        graph = engine.opportunity_graph
+        for u, v, w in [(0, 1, 0.1), (1, 2, 0.0), (2, 1, -5.0), (2, 3, 0.0), (1, 3, 0.0),
+                        (3, 0, 0.1), (1, 4, 0.0), (4, 2, 0.0), (3, 5, 0.0)]:
+            graph.add_edge(u, v, weight=w)
+        for node in range(5, 40):
+            graph.add_edge(node, node + 1, weight=0.0)
+        return engine
+
+    def test_array_search_matches_dfs(self):
+        engine = self.engine_with_loop_away_from_start()
+        self.assertGreaterEqual(len(engine.opportunity_graph), engine.dfs_node_limit)
+        arrays = engine._find_negative_cycles(0, max_length=5)
+        engine.dfs_node_limit = 1000
+        dfs = engine._find_negative_cycles(0, max_length=5)
+        expected = [[0, 1, 2, 3, 0], [0, 1, 3, 0], [0, 1, 4, 2, 3, 0]]
+        self.assertEqual(sorted(arrays), expected)
+        self.assertEqual(sorted(dfs), expected)
+
+    def test_max_length_bounds_cycles(self):
+        engine = self.engine_with_loop_away_from_start()
+        self.assertEqual(sorted(engine._find_negative_cycles(0, max_length=4)), [[0, 1, 2, 3, 0], [0, 1, 3, 0]])
+
+class MinimalConnector:
+    """Connector without fee, liquidity or price methods"""
+    name = "bare"
+
+    async def get_tradeable_pairs(self):
+        return ["BTC-USDT", "ETH-USDT", "ETH-BTC"]
+
+    async def get_assets(self):
+        return ["BTC", "USDT", "ETH"]
+
+class TestUpdateGraph(unittest.IsolatedAsyncioTestCase):
+    async def test_missing_fee_and_liquidity_use_defaults(self):
+        engine = CrossProtocolArbitrageEngine([MinimalConnector()])
+        await engine.update_graph_for_connector(engine.connectors[0])
+        edges = list(engine.opportunity_graph.edges(data=True))
+        self.assertEqual(len(edges), 6)
+        for _, _, data in edges:
+            self.assertEqual(data["fee"], 0.001)
+            self.assertEqual(data["liquidity"], 1.0)
+
+class TestNodeIds(unittest.IsolatedAsyncioTestCase):
+    async def test_lookups_do_not_assign_ids(self):
+        engine = CrossProtocolArbitrageEngine([FakeConnector("ex", {"BTC-USDT": (1 / 50000, 50000.0)})])
+        await engine.find_arbitrage_cycles("DOGE")
+        profit, details = await engine.calculate_cycle_profit(["USDT:ex", "XRP:other", "USDT:ex"])
+        steps = await engine.cycle_to_steps(["USDT:ex", "malformed", "USDT:ex"])
+        self.assertEqual(engine._asset_names, ["USDT", "BTC"])
+        self.assertEqual(engine._conn_names, ["ex"])
+        self.assertEqual((profit, details), (0.0, {"error": "Edge not found: USDT:ex -> XRP:other"}))
+        self.assertEqual(steps, [])
+
+    def test_asset_ids_do_not_overflow_into_connector_bits(self):
+        engine = CrossProtocolArbitrageEngine()
+        engine._asset_names = [f"A{i}" for i in range(1 << 16)]
+        engine._asset_ids = {asset: i for i, asset in enumerate(engine._asset_names)}
+        with self.assertRaises(ValueError):
+            engine._node_id("NEW", "ex")
+        self.assertNotIn("NEW", engine._asset_ids)
+
+class TestRefreshAcrossEventLoops(unittest.TestCase):
+    def test_rate_limited_refresh_in_new_loop(self):
+        connector = FakeConnector("ex", {"BTC-USDT": (1 / 50000, 50000.0), "ETH-USDT": (1 / 3000, 3000.0)})
+        connector.rate_limit = 1
+        engine = CrossProtocolArbitrageEngine([connector])
+        for _ in range(2):
+            engine.last_graph_update = 0
+            for _, _, data in engine.opportunity_graph.edges(data=True):
+                data.pop("weight", None)
+            asyncio.run(engine.update_opportunity_graph())
+            weights = [data["weight"] for _, _, data in engine.opportunity_graph.edges(data=True)]
+            self.assertEqual(len(weights), 4)
+            self.assertTrue(all(abs(w) < 20 for w in weights))
+
+    def test_missing_price_method_marks_edge_unusable(self):
+        engine = CrossProtocolArbitrageEngine([MinimalConnector()])
+        asyncio.run(engine.update_opportunity_graph())
+        weights = [data["weight"] for _, _, data in engine.opportunity_graph.edges(data=True)]
+        self.assertEqual(weights, [float("inf")] * 6)
+
+if __name__ == "__main__":
+    unittest.main()